@@ -0,0 +1,54 @@
+package geopyspark.geotrellis
+
+import geotrellis.spark._
+
+import org.apache.spark.rdd.RDD
+import org.apache.spark.api.java.JavaRDD
+
+import java.nio.{ByteBuffer, ByteOrder}
+
+
+/** Writes a key as fixed-width, little-endian values */
+trait KeyPacker[K] extends Serializable {
+  def size: Int
+  def pack(buffer: ByteBuffer, key: K): Unit
+}
+
+object KeyPacker {
+  implicit val spatialKeyPacker: KeyPacker[SpatialKey] =
+    new KeyPacker[SpatialKey] {
+      val size: Int = 8
+
+      def pack(buffer: ByteBuffer, key: SpatialKey): Unit = {
+        buffer.putInt(key.col)
+        buffer.putInt(key.row)
+      }
+    }
+
+  implicit val spaceTimeKeyPacker: KeyPacker[SpaceTimeKey] =
+    new KeyPacker[SpaceTimeKey] {
+      val size: Int = 16
+
+      def pack(buffer: ByteBuffer, key: SpaceTimeKey): Unit = {
+        buffer.putInt(key.col)
+        buffer.putInt(key.row)
+        buffer.putLong(key.instant)
+      }
+    }
+}
+
+/**
+  * Sends (key, bytes) pairs, such as rendered PNGs and GeoTiffs, to Python without
+  * wrapping them in a ProtoTuple. Each record is the packed key followed by the bytes.
+  */
+object KeyedBytes {
+  def toPython[K](rdd: RDD[(K, Array[Byte])])(implicit packer: KeyPacker[K]): JavaRDD[Array[Byte]] =
+    rdd.map { case (key, bytes) =>
+      val buffer = ByteBuffer.allocate(packer.size + bytes.length).order(ByteOrder.LITTLE_ENDIAN)
+
+      packer.pack(buffer, key)
+      buffer.put(bytes)
+
+      buffer.array
+    }.toJavaRDD
+}
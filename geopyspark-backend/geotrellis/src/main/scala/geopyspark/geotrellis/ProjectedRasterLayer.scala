@@ -17,7 +17,7 @@ import org.apache.spark.api.java.JavaRDD
 import org.apache.spark._
 import org.apache.spark.rdd._
 
-import protos.tupleMessages.ProtoTuple
+import protos.tupleMessages.{ProtoTuple, ProtoTupleBatch}
 import protos.extentMessages.ProtoProjectedExtent
 
 import scala.util.{Either, Left, Right}
@@ -160,6 +160,11 @@ class ProjectedRasterLayer(val rdd: RDD[(ProjectedExtent, MultibandTile)]) exten
   def toProtoRDD(): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(ProjectedExtent, MultibandTile), ProtoTuple](rdd)
 
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    PythonTranslator.toPythonBatched[(ProjectedExtent, MultibandTile), ProtoTuple](rdd, batchBytes) { tuples =>
+      ProtoTupleBatch(tuples = tuples)
+    }
+
   def toPngRDD(pngRDD: RDD[(ProjectedExtent, Array[Byte])]): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(ProjectedExtent, Array[Byte]), ProtoTuple](pngRDD)
 
@@ -193,6 +198,12 @@ object ProjectedRasterLayer {
         (ProjectedExtent, MultibandTile), ProtoTuple
       ](javaRDD, ProtoTuple.parseFrom))
 
+  def fromProtoBatchedRDD(javaRDD: JavaRDD[Array[Byte]]): ProjectedRasterLayer =
+    ProjectedRasterLayer(
+      PythonTranslator.fromPythonBatched[
+        (ProjectedExtent, MultibandTile), ProtoTuple
+      ](javaRDD, ProtoTupleBatch.parseFrom(_).tuples))
+
   def apply(rdd: RDD[(ProjectedExtent, MultibandTile)]): ProjectedRasterLayer =
     new ProjectedRasterLayer(rdd)
 
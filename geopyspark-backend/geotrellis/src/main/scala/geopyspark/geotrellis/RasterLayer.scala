@@ -47,6 +47,7 @@ abstract class RasterLayer[K](implicit ev0: ClassTag[K], ev1: Component[K, Proje
     withRDD(rdd.partitionBy(partitionStrategy.producePartitioner(rdd.getNumPartitions).get))
 
   def toProtoRDD(): JavaRDD[Array[Byte]]
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]]
 
   def collectKeys(): java.util.ArrayList[Array[Byte]]
 
@@ -3,6 +3,7 @@ package geopyspark.geotrellis
 import geopyspark.util._
 import geopyspark.geotrellis._
 import geopyspark.geotrellis.GeoTrellisUtils._
+import geopyspark.geotrellis.arrow.ArrowTranslator
 
 import protos.tileMessages._
 import protos.keyMessages._
@@ -405,8 +406,22 @@ class SpatialTiledRasterLayer(
   def toProtoRDD(): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(SpatialKey, MultibandTile), ProtoTuple](rdd)
 
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    PythonTranslator.toPythonBatched[(SpatialKey, MultibandTile), ProtoTuple](rdd, batchBytes) { tuples =>
+      ProtoTupleBatch(tuples = tuples)
+    }
+
+  def toArrowRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    ArrowTranslator.toPython[SpatialKey](rdd, batchBytes)
+
   def toPngRDD(pngRDD: RDD[(SpatialKey, Array[Byte])]): JavaRDD[Array[Byte]] =
-    PythonTranslator.toPython[(SpatialKey, Array[Byte]), ProtoTuple](pngRDD)
+    KeyedBytes.toPython(pngRDD)
+
+  def filterByKeyBounds(colMin: Int, rowMin: Int, colMax: Int, rowMax: Int): TiledRasterLayer[SpatialKey] = {
+    val bounds = GridBounds(colMin, rowMin, colMax, rowMax)
+
+    withRDD(rdd.filter { case (key, _) => bounds.contains(key.col, key.row) })
+  }
 
   def toGeoTiffRDD(
     tags: Tags,
@@ -434,7 +449,7 @@ class SpatialTiledRasterLayer(
         (k, geoTiff.toByteArray)
       }
 
-    PythonTranslator.toPython[(SpatialKey, Array[Byte]), ProtoTuple](geotiffRDD)
+    KeyedBytes.toPython(geotiffRDD)
   }
 
   def collectKeys(): java.util.ArrayList[Array[Byte]] =
@@ -554,6 +569,52 @@ object SpatialTiledRasterLayer {
     SpatialTiledRasterLayer(Some(zoomLevel), tileLayer)
   }
 
+  def fromProtoBatchedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    metadata: String
+  ): SpatialTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpatialKey]]
+    val tileLayer = MultibandTileLayerRDD(
+      PythonTranslator.fromPythonBatched[(SpatialKey, MultibandTile), ProtoTuple](
+        javaRDD, ProtoTupleBatch.parseFrom(_).tuples), md)
+
+    SpatialTiledRasterLayer(None, tileLayer)
+  }
+
+  def fromProtoBatchedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    zoomLevel: Int,
+    metadata: String
+  ): SpatialTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpatialKey]]
+    val tileLayer = MultibandTileLayerRDD(
+      PythonTranslator.fromPythonBatched[(SpatialKey, MultibandTile), ProtoTuple](
+        javaRDD, ProtoTupleBatch.parseFrom(_).tuples), md)
+
+    SpatialTiledRasterLayer(Some(zoomLevel), tileLayer)
+  }
+
+  def fromArrowEncodedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    metadata: String
+  ): SpatialTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpatialKey]]
+    val tileLayer = MultibandTileLayerRDD(ArrowTranslator.fromPython[SpatialKey](javaRDD.rdd), md)
+
+    SpatialTiledRasterLayer(None, tileLayer)
+  }
+
+  def fromArrowEncodedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    zoomLevel: Int,
+    metadata: String
+  ): SpatialTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpatialKey]]
+    val tileLayer = MultibandTileLayerRDD(ArrowTranslator.fromPython[SpatialKey](javaRDD.rdd), md)
+
+    SpatialTiledRasterLayer(Some(zoomLevel), tileLayer)
+  }
+
   def apply(
     zoomLevel: Integer,
     rdd: RDD[(SpatialKey, MultibandTile)] with Metadata[TileLayerMetadata[SpatialKey]]
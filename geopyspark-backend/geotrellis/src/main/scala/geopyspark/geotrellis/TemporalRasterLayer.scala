@@ -16,7 +16,7 @@ import org.apache.spark.api.java.JavaRDD
 import org.apache.spark._
 import org.apache.spark.rdd.RDD
 
-import protos.tupleMessages.ProtoTuple
+import protos.tupleMessages.{ProtoTuple, ProtoTupleBatch}
 import protos.extentMessages.ProtoTemporalProjectedExtent
 
 import scala.util.{Either, Left, Right}
@@ -159,6 +159,11 @@ class TemporalRasterLayer(val rdd: RDD[(TemporalProjectedExtent, MultibandTile)]
   def toProtoRDD(): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(TemporalProjectedExtent, MultibandTile), ProtoTuple](rdd)
 
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    PythonTranslator.toPythonBatched[(TemporalProjectedExtent, MultibandTile), ProtoTuple](rdd, batchBytes) { tuples =>
+      ProtoTupleBatch(tuples = tuples)
+    }
+
   def toPngRDD(pngRDD: RDD[(TemporalProjectedExtent, Array[Byte])]): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(TemporalProjectedExtent, Array[Byte]), ProtoTuple](pngRDD)
 
@@ -229,6 +234,12 @@ object TemporalRasterLayer {
         (TemporalProjectedExtent, MultibandTile), ProtoTuple
       ](javaRDD, ProtoTuple.parseFrom))
 
+  def fromProtoBatchedRDD(javaRDD: JavaRDD[Array[Byte]]): TemporalRasterLayer =
+    TemporalRasterLayer(
+      PythonTranslator.fromPythonBatched[
+        (TemporalProjectedExtent, MultibandTile), ProtoTuple
+      ](javaRDD, ProtoTupleBatch.parseFrom(_).tuples))
+
   def apply(rdd: RDD[(TemporalProjectedExtent, MultibandTile)]): TemporalRasterLayer =
     new TemporalRasterLayer(rdd)
 
@@ -3,6 +3,7 @@ package geopyspark.geotrellis
 import geopyspark.util._
 import geopyspark.geotrellis._
 import geopyspark.geotrellis.GeoTrellisUtils._
+import geopyspark.geotrellis.arrow.ArrowTranslator
 
 import protos.tileMessages._
 import protos.keyMessages._
@@ -429,8 +430,16 @@ class TemporalTiledRasterLayer(
   def toProtoRDD(): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(SpaceTimeKey, MultibandTile), ProtoTuple](rdd)
 
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    PythonTranslator.toPythonBatched[(SpaceTimeKey, MultibandTile), ProtoTuple](rdd, batchBytes) { tuples =>
+      ProtoTupleBatch(tuples = tuples)
+    }
+
+  def toArrowRDD(batchBytes: Int): JavaRDD[Array[Byte]] =
+    ArrowTranslator.toPython[SpaceTimeKey](rdd, batchBytes)
+
   def toPngRDD(pngRDD: RDD[(SpaceTimeKey, Array[Byte])]): JavaRDD[Array[Byte]] =
-    PythonTranslator.toPython[(SpaceTimeKey, Array[Byte]), ProtoTuple](pngRDD)
+    KeyedBytes.toPython(pngRDD)
 
   def toGeoTiffRDD(
     tags: Tags,
@@ -458,7 +467,7 @@ class TemporalTiledRasterLayer(
         (k, geoTiff.toByteArray)
       }
 
-    PythonTranslator.toPython[(SpaceTimeKey, Array[Byte]), ProtoTuple](geotiffRDD)
+    KeyedBytes.toPython(geotiffRDD)
   }
 
   def toSpatialLayer(instant: Long): SpatialTiledRasterLayer = {
@@ -655,6 +664,52 @@ object TemporalTiledRasterLayer {
     TemporalTiledRasterLayer(Some(zoomLevel), tileLayer)
   }
 
+  def fromProtoBatchedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    metadata: String
+  ): TemporalTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpaceTimeKey]]
+    val tileLayer = MultibandTileLayerRDD(
+      PythonTranslator.fromPythonBatched[(SpaceTimeKey, MultibandTile), ProtoTuple](
+        javaRDD, ProtoTupleBatch.parseFrom(_).tuples), md)
+
+    TemporalTiledRasterLayer(None, tileLayer)
+  }
+
+  def fromProtoBatchedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    zoomLevel: Int,
+    metadata: String
+  ): TemporalTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpaceTimeKey]]
+    val tileLayer = MultibandTileLayerRDD(
+      PythonTranslator.fromPythonBatched[(SpaceTimeKey, MultibandTile), ProtoTuple](
+        javaRDD, ProtoTupleBatch.parseFrom(_).tuples), md)
+
+    TemporalTiledRasterLayer(Some(zoomLevel), tileLayer)
+  }
+
+  def fromArrowEncodedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    metadata: String
+  ): TemporalTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpaceTimeKey]]
+    val tileLayer = MultibandTileLayerRDD(ArrowTranslator.fromPython[SpaceTimeKey](javaRDD.rdd), md)
+
+    TemporalTiledRasterLayer(None, tileLayer)
+  }
+
+  def fromArrowEncodedRDD(
+    javaRDD: JavaRDD[Array[Byte]],
+    zoomLevel: Int,
+    metadata: String
+  ): TemporalTiledRasterLayer = {
+    val md = metadata.parseJson.convertTo[TileLayerMetadata[SpaceTimeKey]]
+    val tileLayer = MultibandTileLayerRDD(ArrowTranslator.fromPython[SpaceTimeKey](javaRDD.rdd), md)
+
+    TemporalTiledRasterLayer(Some(zoomLevel), tileLayer)
+  }
+
   def apply(
     zoomLevel: Integer,
     rdd: RDD[(SpaceTimeKey, MultibandTile)] with Metadata[TileLayerMetadata[SpaceTimeKey]]
@@ -39,6 +39,10 @@ abstract class TileLayer[K: ClassTag] {
   def toPngRDD(cm: ColorMap): JavaRDD[Array[Byte]] =
     toPngRDD(rdd.mapValues { v => v.bands(0).renderPng(cm).bytes })
 
+  /** Renders the first band of the tiles whose bands are not all NoData */
+  def toNonEmptyPngRDD(cm: ColorMap): JavaRDD[Array[Byte]] =
+    toPngRDD(rdd.filter { case (_, v) => !v.bands.forall(_.isNoDataTile) }.mapValues { v => v.bands(0).renderPng(cm).bytes })
+
   def toPngRDD(pngRDD: RDD[(K, Array[Byte])]): JavaRDD[Array[Byte]]
 
   def toGeoTiffRDD(
@@ -78,6 +78,8 @@ abstract class TiledRasterLayer[K: SpatialComponent: JsonFormat: ClassTag: Bound
 
   /** Encode RDD as Avro bytes and return it with avro schema used */
   def toProtoRDD(): JavaRDD[Array[Byte]]
+  def toProtoBatchedRDD(batchBytes: Int): JavaRDD[Array[Byte]]
+  def toArrowRDD(batchBytes: Int): JavaRDD[Array[Byte]]
 
   def collectKeys(): java.util.ArrayList[Array[Byte]]
 
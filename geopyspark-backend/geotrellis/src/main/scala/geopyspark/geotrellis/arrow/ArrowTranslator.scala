@@ -0,0 +1,217 @@
+package geopyspark.geotrellis.arrow
+
+import geopyspark.geotrellis.protobufs.TileProtoBuf
+import protos.tileMessages._
+
+import geotrellis.raster._
+import geotrellis.spark._
+
+import org.apache.arrow.memory.RootAllocator
+import org.apache.arrow.vector._
+import org.apache.arrow.vector.ipc.{ArrowStreamReader, ArrowStreamWriter}
+import org.apache.arrow.vector.types.pojo.{ArrowType, Field, FieldType, Schema}
+
+import org.apache.spark.rdd.RDD
+import org.apache.spark.api.java.JavaRDD
+
+import com.google.protobuf.ByteString
+
+import java.io.{ByteArrayInputStream, ByteArrayOutputStream}
+
+import scala.collection.JavaConverters._
+import scala.collection.mutable.ArrayBuffer
+import scala.reflect.ClassTag
+
+
+/** Reads and writes the key of each record as one or more Arrow columns */
+trait ArrowKeyColumns[K] extends Serializable {
+  def fields: Seq[Field]
+  def write(root: VectorSchemaRoot, index: Int, key: K): Unit
+  def read(root: VectorSchemaRoot, index: Int): K
+}
+
+object ArrowKeyColumns {
+  private def field(name: String, bitWidth: Int): Field =
+    new Field(name, FieldType.nullable(new ArrowType.Int(bitWidth, true)), null)
+
+  private def intVector(root: VectorSchemaRoot, name: String): IntVector =
+    root.getVector(name).asInstanceOf[IntVector]
+
+  private def bigIntVector(root: VectorSchemaRoot, name: String): BigIntVector =
+    root.getVector(name).asInstanceOf[BigIntVector]
+
+  implicit val spatialKeyColumns: ArrowKeyColumns[SpatialKey] =
+    new ArrowKeyColumns[SpatialKey] {
+      def fields: Seq[Field] = Seq(field("col", 32), field("row", 32))
+
+      def write(root: VectorSchemaRoot, index: Int, key: SpatialKey): Unit = {
+        intVector(root, "col").setSafe(index, key.col)
+        intVector(root, "row").setSafe(index, key.row)
+      }
+
+      def read(root: VectorSchemaRoot, index: Int): SpatialKey =
+        SpatialKey(intVector(root, "col").get(index), intVector(root, "row").get(index))
+    }
+
+  implicit val spaceTimeKeyColumns: ArrowKeyColumns[SpaceTimeKey] =
+    new ArrowKeyColumns[SpaceTimeKey] {
+      def fields: Seq[Field] = Seq(field("col", 32), field("row", 32), field("instant", 64))
+
+      def write(root: VectorSchemaRoot, index: Int, key: SpaceTimeKey): Unit = {
+        intVector(root, "col").setSafe(index, key.col)
+        intVector(root, "row").setSafe(index, key.row)
+        bigIntVector(root, "instant").setSafe(index, key.instant)
+      }
+
+      def read(root: VectorSchemaRoot, index: Int): SpaceTimeKey =
+        SpaceTimeKey(
+          intVector(root, "col").get(index),
+          intVector(root, "row").get(index),
+          bigIntVector(root, "instant").get(index))
+    }
+}
+
+
+/**
+  * Moves tiled layers to and from Python as Arrow record batches.
+  *
+  * Each record holds one Arrow IPC stream. Besides the key columns, the stream has a
+  * fixed-size binary "cells" column which contains the raw, little-endian cells of every
+  * band of a tile. The cell type, NoData value, and tile dimensions are the same for every
+  * row of a stream and are stored in the schema's metadata.
+  */
+object ArrowTranslator {
+  private case class CellBlock(cellType: ProtoCellType, bands: Int, cols: Int, rows: Int, bytes: Array[Byte]) {
+    def layout: (ProtoCellType, Int, Int, Int) = (cellType, bands, cols, rows)
+  }
+
+  private def toCellBlock(tile: MultibandTile): CellBlock = {
+    val cellType = TileProtoBuf.cellTypeToMessage(tile.cellType)
+    val bytes = ByteString.newOutput()
+
+    for (index <- 0 until tile.bandCount)
+      TileProtoBuf.toCellBuffer(tile.band(index).toArrayTile(), cellType.dataType).writeTo(bytes)
+
+    CellBlock(cellType, tile.bandCount, tile.cols, tile.rows, bytes.toByteString.toByteArray)
+  }
+
+  private def writeStream[K](batch: Seq[(K, CellBlock)], keyColumns: ArrowKeyColumns[K]): Array[Byte] = {
+    val block = batch.head._2
+
+    val metadata = Map(
+      "cellType" -> block.cellType.dataType.toString,
+      "noData" -> block.cellType.nd.toString,
+      "hasNoData" -> block.cellType.hasNoData.toString,
+      "bands" -> block.bands.toString,
+      "cols" -> block.cols.toString,
+      "rows" -> block.rows.toString)
+
+    val cellsField =
+      new Field("cells", FieldType.nullable(new ArrowType.FixedSizeBinary(block.bytes.length)), null)
+
+    val schema = new Schema((keyColumns.fields :+ cellsField).asJava, metadata.asJava)
+
+    val allocator = new RootAllocator(Long.MaxValue)
+    val root = VectorSchemaRoot.create(schema, allocator)
+    val output = new ByteArrayOutputStream()
+    val writer = new ArrowStreamWriter(root, null, output)
+
+    try {
+      root.getFieldVectors.asScala.foreach { _.allocateNew() }
+
+      val cells = root.getVector("cells").asInstanceOf[FixedSizeBinaryVector]
+
+      for (((key, cellBlock), index) <- batch.zipWithIndex) {
+        keyColumns.write(root, index, key)
+        cells.setSafe(index, cellBlock.bytes)
+      }
+
+      root.setRowCount(batch.size)
+
+      writer.start()
+      writer.writeBatch()
+      writer.end()
+    } finally {
+      writer.close()
+      root.close()
+      allocator.close()
+    }
+
+    output.toByteArray
+  }
+
+  private def readStream[K](bytes: Array[Byte], keyColumns: ArrowKeyColumns[K]): Seq[(K, MultibandTile)] = {
+    val allocator = new RootAllocator(Long.MaxValue)
+    val reader = new ArrowStreamReader(new ByteArrayInputStream(bytes), allocator)
+
+    try {
+      val root = reader.getVectorSchemaRoot
+      val metadata = root.getSchema.getCustomMetadata.asScala
+
+      val ct =
+        TileProtoBuf.messageToCellType(
+          ProtoCellType(
+            ProtoCellType.DataType.fromName(metadata("cellType")).get,
+            metadata("noData").toDouble,
+            metadata("hasNoData").toBoolean))
+
+      val bands = metadata("bands").toInt
+      val cols = metadata("cols").toInt
+      val rows = metadata("rows").toInt
+
+      val result = ArrayBuffer[(K, MultibandTile)]()
+
+      while (reader.loadNextBatch()) {
+        val cells = root.getVector("cells").asInstanceOf[FixedSizeBinaryVector]
+
+        for (index <- 0 until root.getRowCount) {
+          val cellBytes = ByteString.copyFrom(cells.get(index))
+          val bandSize = cellBytes.size / bands
+
+          val tiles =
+            for (band <- 0 until bands) yield
+              TileProtoBuf.fromCellBuffer(
+                cellBytes.substring(band * bandSize, (band + 1) * bandSize), ct, cols, rows)
+
+          result += ((keyColumns.read(root, index), MultibandTile(tiles)))
+        }
+      }
+
+      result
+    } finally {
+      reader.close()
+      allocator.close()
+    }
+  }
+
+  def toPython[K](
+    rdd: RDD[(K, MultibandTile)],
+    batchBytes: Int
+  )(implicit keyColumns: ArrowKeyColumns[K]): JavaRDD[Array[Byte]] =
+    rdd.mapPartitions { iter =>
+      val blocks = iter.map { case (key, tile) => (key, toCellBlock(tile)) }.buffered
+
+      new Iterator[Array[Byte]] {
+        def hasNext: Boolean = blocks.hasNext
+
+        def next(): Array[Byte] = {
+          val layout = blocks.head._2.layout
+          val batch = ArrayBuffer[(K, CellBlock)]()
+          var size = 0
+
+          while (blocks.hasNext && blocks.head._2.layout == layout && (batch.isEmpty || size < batchBytes)) {
+            val entry = blocks.next()
+            size += entry._2.bytes.length
+            batch += entry
+          }
+
+          writeStream(batch, keyColumns)
+        }
+      }
+    }.toJavaRDD
+
+  def fromPython[K: ClassTag](
+    rdd: RDD[Array[Byte]]
+  )(implicit keyColumns: ArrowKeyColumns[K]): RDD[(K, MultibandTile)] =
+    rdd.flatMap { bytes => readStream(bytes, keyColumns) }
+}
@@ -27,8 +27,144 @@ import scala.collection.JavaConverters._
 import scala.collection.mutable
 
 
+/** The key bounds, size and partitioning of the tiles a query reads. */
+case class QueryEstimate(keyBounds: Seq[GridBounds], tileCount: Long, tileBytes: Long, numPartitions: Int) {
+  def toJson: String =
+    JsObject(
+      "keyBounds" -> JsArray(keyBounds.map { bounds =>
+        JsObject(
+          "colMin" -> JsNumber(bounds.colMin),
+          "rowMin" -> JsNumber(bounds.rowMin),
+          "colMax" -> JsNumber(bounds.colMax),
+          "rowMax" -> JsNumber(bounds.rowMax))
+      }.toVector),
+      "tileCount" -> JsNumber(tileCount),
+      "tileBytes" -> JsNumber(tileBytes),
+      "estimatedBytes" -> JsNumber(tileCount * tileBytes),
+      "numPartitions" -> JsNumber(numPartitions)).compactPrint
+}
+
+object QueryEstimate {
+  // Aim for ~16MB per partition
+  final val DefaultPartitionBytes: Long = 1 << 24
+
+  def apply[K: SpatialComponent](
+    layerQuery: LayerQuery[K, TileLayerMetadata[K]],
+    layerMetadata: TileLayerMetadata[K],
+    partitionBytes: Integer
+  ): QueryEstimate = {
+    val tileBytes: Long = (layerMetadata.cellType.bytes.toLong
+      * layerMetadata.layout.tileLayout.tileCols
+      * layerMetadata.layout.tileLayout.tileRows)
+    val tilesPerPartition =
+      math.max(1L, Option(partitionBytes).map(_.toLong).getOrElse(DefaultPartitionBytes) / tileBytes)
+
+    // TODO: consider temporal dimension size as well
+    val keyBounds: Seq[GridBounds] =
+      try {
+        layerQuery(layerMetadata).map(_.toGridBounds)
+      } catch {
+        case e: java.lang.UnsupportedOperationException => Seq()
+      }
+    val tileCount = keyBounds.map(_.size).sum
+
+    QueryEstimate(keyBounds, tileCount, tileBytes, math.max(1, (tileCount / tilesPerPartition).toInt))
+  }
+}
+
+
 class LayerReaderWrapper(sc: SparkContext) {
 
+  private def spatialLayerQuery(
+    attributeStore: AttributeStore,
+    header: LayerHeader,
+    id: LayerId,
+    spatialQuery: Option[Geometry],
+    queryCRS: Option[CRS]
+  ): (LayerQuery[SpatialKey, TileLayerMetadata[SpatialKey]], TileLayerMetadata[SpatialKey]) = {
+    val layerMetadata =
+      header.layerType match {
+        case COGLayerType =>
+          attributeStore
+            .readMetadata[COGLayerStorageMetadata[SpatialKey]](LayerId(id.name, 0))
+            .metadata
+            .tileLayerMetadata(id.zoom)
+        case _ => attributeStore.readMetadata[TileLayerMetadata[SpatialKey]](id)
+      }
+
+    var query = new LayerQuery[SpatialKey, TileLayerMetadata[SpatialKey]]
+
+    for (geom <- spatialQuery) {
+      query = applySpatialFilter(query, geom, layerMetadata.crs, queryCRS)
+    }
+
+    (query, layerMetadata)
+  }
+
+  private def temporalLayerQuery(
+    attributeStore: AttributeStore,
+    header: LayerHeader,
+    id: LayerId,
+    spatialQuery: Option[Geometry],
+    queryCRS: Option[CRS],
+    queryIntervalStrings: ArrayList[String]
+  ): (LayerQuery[SpaceTimeKey, TileLayerMetadata[SpaceTimeKey]], TileLayerMetadata[SpaceTimeKey]) = {
+    val layerMetadata =
+      header.layerType match {
+        case COGLayerType =>
+          attributeStore
+            .readMetadata[COGLayerStorageMetadata[SpaceTimeKey]](LayerId(id.name, 0))
+            .metadata
+            .tileLayerMetadata(id.zoom)
+        case _ => attributeStore.readMetadata[TileLayerMetadata[SpaceTimeKey]](id)
+      }
+
+    var query = new LayerQuery[SpaceTimeKey, TileLayerMetadata[SpaceTimeKey]]
+
+    for (geom <- spatialQuery) {
+      query = applySpatialFilter(query, geom, layerMetadata.crs, queryCRS)
+    }
+
+    for (intervals <- getTemporalQuery(queryIntervalStrings)) {
+      query = query.where(intervals)
+    }
+
+    (query, layerMetadata)
+  }
+
+  /** Returns the key bounds, size and partitioning of the tiles a query would read as JSON. */
+  def explainQuery(
+    catalogUri: String,
+    layerName: String,
+    zoom: Int,
+    queryGeometryBytes: Array[Byte],
+    queryIntervalStrings: ArrayList[String],
+    projQuery: String,
+    partitionBytes: Integer
+  ): String = {
+    val id = LayerId(layerName, zoom)
+    val attributeStore = AttributeStore(catalogUri)
+
+    val spatialQuery: Option[Geometry] = Option(queryGeometryBytes).map(WKB.read)
+    val queryCRS: Option[CRS] = TileLayer.getCRS(projQuery)
+
+    val header = produceHeader(attributeStore, id)
+
+    val estimate =
+      header.keyClass match {
+        case "geotrellis.spark.SpatialKey" =>
+          val (query, layerMetadata) = spatialLayerQuery(attributeStore, header, id, spatialQuery, queryCRS)
+          QueryEstimate(query, layerMetadata, partitionBytes)
+
+        case "geotrellis.spark.SpaceTimeKey" =>
+          val (query, layerMetadata) =
+            temporalLayerQuery(attributeStore, header, id, spatialQuery, queryCRS, queryIntervalStrings)
+          QueryEstimate(query, layerMetadata, partitionBytes)
+      }
+
+    estimate.toJson
+  }
+
   def query(
     catalogUri: String,
     layerName: String,
@@ -36,7 +172,8 @@ class LayerReaderWrapper(sc: SparkContext) {
     queryGeometryBytes: Array[Byte],
     queryIntervalStrings: ArrayList[String],
     projQuery: String,
-    numPartitions: Integer
+    numPartitions: Integer,
+    partitionBytes: Integer
   ): TiledRasterLayer[_] = {
     val id = LayerId(layerName, zoom)
     val attributeStore = AttributeStore(catalogUri)
@@ -52,44 +189,17 @@ class LayerReaderWrapper(sc: SparkContext) {
         case _ => Right(LayerReader(catalogUri)(sc))
       }
 
-    //val pyZoom: Option[Int] = ??? // is this top level zoom or zoom with None ?
-
-    def getNumPartitions[K: SpatialComponent, M](
+    def getNumPartitions[K: SpatialComponent](
       layerQuery: LayerQuery[K, TileLayerMetadata[K]],
       layerMetadata: TileLayerMetadata[K]
     ): Int =
       Option(numPartitions).map(_.toInt).getOrElse {
-        val tileBytes = (layerMetadata.cellType.bytes
-          * layerMetadata.layout.tileLayout.tileCols
-          * layerMetadata.layout.tileLayout.tileRows)
-        // Aim for ~16MB per partition
-        val tilesPerPartition = (1 << 24) / tileBytes
-        // TODO: consider temporal dimension size as well
-        val expectedTileCounts: Seq[Long] = layerQuery(layerMetadata).map(_.toGridBounds.size)
-        try {
-          math.max(1, (expectedTileCounts.reduce( _ + _) / tilesPerPartition).toInt)
-        } catch {
-          case e: java.lang.UnsupportedOperationException => 1
-        }
+        QueryEstimate(layerQuery, layerMetadata, partitionBytes).numPartitions
       }
 
     header.keyClass match {
       case "geotrellis.spark.SpatialKey" =>
-        val layerMetadata =
-          header.layerType match {
-            case COGLayerType =>
-              attributeStore
-                .readMetadata[COGLayerStorageMetadata[SpatialKey]](LayerId(id.name, 0))
-                .metadata
-                .tileLayerMetadata(id.zoom)
-            case _ => attributeStore.readMetadata[TileLayerMetadata[SpatialKey]](id)
-          }
-
-        var query = new LayerQuery[SpatialKey, TileLayerMetadata[SpatialKey]]
-
-        for (geom <- spatialQuery) {
-          query = applySpatialFilter(query, geom, layerMetadata.crs, queryCRS)
-        }
+        val (query, layerMetadata) = spatialLayerQuery(attributeStore, header, id, spatialQuery, queryCRS)
 
         val numPartitions: Int = getNumPartitions(query, layerMetadata)
 
@@ -113,25 +223,8 @@ class LayerReaderWrapper(sc: SparkContext) {
         new SpatialTiledRasterLayer(Some(zoom), rdd)
 
       case "geotrellis.spark.SpaceTimeKey" =>
-        val layerMetadata =
-          header.layerType match {
-            case COGLayerType =>
-              attributeStore
-                .readMetadata[COGLayerStorageMetadata[SpaceTimeKey]](LayerId(id.name, 0))
-                .metadata
-                .tileLayerMetadata(id.zoom)
-            case _ => attributeStore.readMetadata[TileLayerMetadata[SpaceTimeKey]](id)
-          }
-
-        var query = new LayerQuery[SpaceTimeKey, TileLayerMetadata[SpaceTimeKey]]
-
-        for (geom <- spatialQuery) {
-          query = applySpatialFilter(query, geom, layerMetadata.crs, queryCRS)
-        }
-
-        for (intervals <- getTemporalQuery(queryIntervalStrings)) {
-          query = query.where(intervals)
-        }
+        val (query, layerMetadata) =
+          temporalLayerQuery(attributeStore, header, id, spatialQuery, queryCRS, queryIntervalStrings)
 
         val numPartitions: Int = getNumPartitions(query, layerMetadata)
 
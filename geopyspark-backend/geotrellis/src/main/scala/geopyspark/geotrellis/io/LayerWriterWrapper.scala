@@ -33,6 +33,48 @@ class LayerWriterWrapper(attributeStore: AttributeStore, uri: String, useCOGs: B
     else
       Right(LayerWriter(attributeStore, uri))
 
+  private lazy val bytesAccumulator = SparkContext.getOrCreate().longAccumulator("geopyspark.bytesWritten")
+
+  private var jobGroup: Option[String] = None
+  private var schedulerPool: Option[String] = None
+
+  /** The number of bytes of cells in the tiles that have been written. Tasks that are retried
+    * are counted more than once.
+    */
+  def bytesWritten: Long = bytesAccumulator.value
+
+  /** Runs the jobs of the following writes in a job group, and in a scheduler pool if one is given. */
+  def setJobProperties(group: String, pool: String): Unit = {
+    jobGroup = Option(group)
+    schedulerPool = Option(pool)
+  }
+
+  /** The job properties are set in the thread that runs the write, as they are thread-local. */
+  private def withJobProperties[T](write: => T): T = {
+    val sc = SparkContext.getOrCreate()
+
+    jobGroup.foreach { group => sc.setJobGroup(group, s"Writing to $uri", interruptOnCancel = true) }
+    schedulerPool.foreach { pool => sc.setLocalProperty("spark.scheduler.pool", pool) }
+
+    try {
+      write
+    } finally {
+      if (jobGroup.isDefined) sc.clearJobGroup()
+      if (schedulerPool.isDefined) sc.setLocalProperty("spark.scheduler.pool", null)
+    }
+  }
+
+  private def counted[K, M](rdd: RDD[(K, MultibandTile)] with Metadata[M]): RDD[(K, MultibandTile)] with Metadata[M] = {
+    val accumulator = bytesAccumulator
+
+    rdd.withContext {
+      _.map { case (key, tile) =>
+        accumulator.add(tile.bandCount.toLong * tile.cols * tile.rows * tile.cellType.bytes)
+        (key, tile)
+      }
+    }
+  }
+
   private def getSpatialIndexMethod(indexStrategy: String): KeyIndexMethod[SpatialKey] =
     indexStrategy match {
       case "zorder" => ZCurveKeyIndexMethod
@@ -87,19 +129,19 @@ class LayerWriterWrapper(attributeStore: AttributeStore, uri: String, useCOGs: B
     layerName: String,
     spatialRDD: TiledRasterLayer[SpatialKey],
     indexStrategy: String
-  ): Unit = {
+  ): Unit = withJobProperties {
     val indexMethod = getSpatialIndexMethod(indexStrategy)
     layerWriter match {
       case Left(cogWriter) =>
         val zoom = spatialRDD.zoomLevel.getOrElse(0)
-        cogWriter.write(layerName, spatialRDD.rdd, zoom, indexMethod)
+        cogWriter.write(layerName, counted(spatialRDD.rdd), zoom, indexMethod)
       case Right(avroWriter) =>
         val id =
           spatialRDD.zoomLevel match {
             case Some(zoom) => LayerId(layerName, zoom)
             case None => LayerId(layerName, 0)
           }
-        avroWriter.write(id, spatialRDD.rdd, indexMethod)
+        avroWriter.write(id, counted(spatialRDD.rdd), indexMethod)
     }
   }
 
@@ -109,41 +151,43 @@ class LayerWriterWrapper(attributeStore: AttributeStore, uri: String, useCOGs: B
     timeString: String,
     timeResolution: String,
     indexStrategy: String
-  ): Unit = {
+  ): Unit = withJobProperties {
     val indexMethod = getTemporalIndexMethod(timeString, timeResolution, indexStrategy)
     layerWriter match {
       case Left(cogWriter) =>
         val zoom = temporalRDD.zoomLevel.getOrElse(0)
-        cogWriter.write(layerName, temporalRDD.rdd, zoom, indexMethod)
+        cogWriter.write(layerName, counted(temporalRDD.rdd), zoom, indexMethod)
       case Right(avroWriter) =>
         val id =
           temporalRDD.zoomLevel match {
             case Some(zoom) => LayerId(layerName, zoom)
             case None => LayerId(layerName, 0)
           }
-        avroWriter.write(id, temporalRDD.rdd, indexMethod)
+        avroWriter.write(id, counted(temporalRDD.rdd), indexMethod)
     }
   }
 
   def updateSpatial(
     layerName: String,
     spatialRDD: TiledRasterLayer[SpatialKey]
-  ): Unit =
+  ): Unit = withJobProperties {
     layerWriter match {
       case Left(cogWriter) =>
         val id = getLayerId(layerName, spatialRDD)
-        cogWriter.update[SpatialKey, MultibandTile](id.name, spatialRDD.rdd, id.zoom, None)
-      case Right(avroWriter) => avroWriter.update(getLayerId(layerName, spatialRDD), spatialRDD.rdd)
+        cogWriter.update[SpatialKey, MultibandTile](id.name, counted(spatialRDD.rdd), id.zoom, None)
+      case Right(avroWriter) => avroWriter.update(getLayerId(layerName, spatialRDD), counted(spatialRDD.rdd))
     }
+  }
 
   def updateTemporal(
     layerName: String,
     temporalRDD: TiledRasterLayer[SpaceTimeKey]
-  ): Unit =
+  ): Unit = withJobProperties {
     layerWriter match {
       case Left(cogWriter) =>
         val id = getLayerId(layerName, temporalRDD)
-        cogWriter.update[SpaceTimeKey, MultibandTile](id.name, temporalRDD.rdd, id.zoom, None)
-      case Right(avroWriter) => avroWriter.update(getLayerId(layerName, temporalRDD), temporalRDD.rdd)
+        cogWriter.update[SpaceTimeKey, MultibandTile](id.name, counted(temporalRDD.rdd), id.zoom, None)
+      case Right(avroWriter) => avroWriter.update(getLayerId(layerName, temporalRDD), counted(temporalRDD.rdd))
     }
+  }
 }
@@ -17,19 +17,43 @@ import org.apache.spark._
 import org.apache.spark.api.java.JavaRDD
 import org.apache.spark.rdd.RDD
 
+import java.nio.{ByteBuffer, ByteOrder}
 import java.time.ZonedDateTime
 import java.util.ArrayList
+import java.util.concurrent.{Executors, ThreadFactory}
 import scala.collection.JavaConverters._
 import scala.collection.mutable
+import scala.concurrent.{Await, ExecutionContext, Future}
+import scala.concurrent.duration.Duration
 
 import geopyspark.util.PythonTranslator
 
 
 
+object ValueReaderWrapper {
+  /** The number of threads that every reader shares for `readTiles` */
+  val readThreads = 64
+
+  // The threads are daemons so that they do not keep the JVM alive
+  private lazy val readContext: ExecutionContext =
+    ExecutionContext.fromExecutorService(
+      Executors.newFixedThreadPool(readThreads, new ThreadFactory {
+        def newThread(runnable: Runnable): Thread = {
+          val thread = Executors.defaultThreadFactory.newThread(runnable)
+          thread.setDaemon(true)
+          thread
+        }
+      }))
+}
+
 /**
   * General interface for reading.
+  *
+  * @param threads The most tiles that a call to `readTiles` reads at a time.
   */
-class ValueReaderWrapper(uri: String) {
+class ValueReaderWrapper(uri: String, threads: Int) {
+  def this(uri: String) = this(uri, 16)
+
   val attributeStore = AttributeStore(uri)
 
   lazy val cogReader: COGValueReader[LayerId] = COGValueReader(uri)
@@ -38,13 +62,8 @@ class ValueReaderWrapper(uri: String) {
   def getValueClass(id: LayerId): String =
     attributeStore.readHeader[LayerHeader](id).valueClass
 
-  def readTile(
-    layerName: String,
-    zoom: Int,
-    col: Int,
-    row: Int,
-    zdt: String
-  ): Array[Byte] = {
+  /** Returns a function that reads the encoded value of a (col, row) key of a layer. */
+  private def keyReader(layerName: String, zoom: Int, zdt: String): (Int, Int) => Array[Byte] = {
     val id = LayerId(layerName, zoom)
 
     val header = produceHeader(attributeStore, id)
@@ -55,43 +74,102 @@ class ValueReaderWrapper(uri: String) {
         case _ => Right(avroReader)
       }
 
-    try {
-      (header.keyClass, header.valueClass) match {
-        case ("geotrellis.spark.SpatialKey", "geotrellis.raster.Tile") => {
-          val spatialKey = SpatialKey(col, row)
-          val result = valueReader match {
-            case Left(cogReader) => cogReader.reader[SpatialKey, Tile](id).read(spatialKey)
-            case Right(avroReader) => avroReader.reader[SpatialKey, Tile](id).read(spatialKey)
-          }
-          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](MultibandTile(result))
+    (header.keyClass, header.valueClass) match {
+      case ("geotrellis.spark.SpatialKey", "geotrellis.raster.Tile") => {
+        val reader = valueReader match {
+          case Left(cogReader) => cogReader.reader[SpatialKey, Tile](id)
+          case Right(avroReader) => avroReader.reader[SpatialKey, Tile](id)
         }
-        case ("geotrellis.spark.SpatialKey", "geotrellis.raster.MultibandTile") => {
-          val spatialKey = SpatialKey(col, row)
-          val result = valueReader match {
-            case Left(cogReader) => cogReader.reader[SpatialKey, MultibandTile](id).read(spatialKey)
-            case Right(avroReader) => avroReader.reader[SpatialKey, MultibandTile](id).read(spatialKey)
-          }
-          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](result)
+        (col, row) =>
+          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](MultibandTile(reader.read(SpatialKey(col, row))))
+      }
+      case ("geotrellis.spark.SpatialKey", "geotrellis.raster.MultibandTile") => {
+        val reader = valueReader match {
+          case Left(cogReader) => cogReader.reader[SpatialKey, MultibandTile](id)
+          case Right(avroReader) => avroReader.reader[SpatialKey, MultibandTile](id)
         }
-        case ("geotrellis.spark.SpaceTimeKey", "geotrellis.raster.Tile") => {
-          val spaceKey = SpaceTimeKey(col, row, ZonedDateTime.parse(zdt))
-          val result = valueReader match {
-            case Left(cogReader) => cogReader.reader[SpaceTimeKey, Tile](id).read(spaceKey)
-            case Right(avroReader) => avroReader.reader[SpaceTimeKey, Tile](id).read(spaceKey)
-          }
-          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](MultibandTile(result))
+        (col, row) =>
+          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](reader.read(SpatialKey(col, row)))
+      }
+      case ("geotrellis.spark.SpaceTimeKey", "geotrellis.raster.Tile") => {
+        val instant = ZonedDateTime.parse(zdt)
+        val reader = valueReader match {
+          case Left(cogReader) => cogReader.reader[SpaceTimeKey, Tile](id)
+          case Right(avroReader) => avroReader.reader[SpaceTimeKey, Tile](id)
         }
-        case ("geotrellis.spark.SpaceTimeKey", "geotrellis.raster.MultibandTile") => {
-          val spaceKey = SpaceTimeKey(col, row, ZonedDateTime.parse(zdt))
-          val result = valueReader match {
-            case Left(cogReader) => cogReader.reader[SpaceTimeKey, MultibandTile](id).read(spaceKey)
-            case Right(avroReader) => avroReader.reader[SpaceTimeKey, MultibandTile](id).read(spaceKey)
-          }
-          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](result)
+        (col, row) =>
+          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](MultibandTile(reader.read(SpaceTimeKey(col, row, instant))))
+      }
+      case ("geotrellis.spark.SpaceTimeKey", "geotrellis.raster.MultibandTile") => {
+        val instant = ZonedDateTime.parse(zdt)
+        val reader = valueReader match {
+          case Left(cogReader) => cogReader.reader[SpaceTimeKey, MultibandTile](id)
+          case Right(avroReader) => avroReader.reader[SpaceTimeKey, MultibandTile](id)
         }
+        (col, row) =>
+          PythonTranslator.toPython[MultibandTile, ProtoMultibandTile](reader.read(SpaceTimeKey(col, row, instant)))
       }
+    }
+  }
+
+  def readTile(
+    layerName: String,
+    zoom: Int,
+    col: Int,
+    row: Int,
+    zdt: String
+  ): Array[Byte] =
+    try {
+      keyReader(layerName, zoom, zdt)(col, row)
     } catch {
-      case e: ValueNotFoundError => return null
+      case e: ValueNotFoundError => null
     }
+
+  /**
+    * Reads many tiles of a layer concurrently, with at most `threads` reads at a time. The
+    * reads run on a pool of threads that is shared by every reader.
+    *
+    * The keys are given as little-endian (col, row) pairs of ints. The tiles that were found
+    * are returned in a single buffer, with each encoded tile preceded by its col, row and
+    * length as little-endian ints.
+    */
+  def readTiles(
+    layerName: String,
+    zoom: Int,
+    keys: Array[Byte],
+    zdt: String
+  ): Array[Byte] = {
+    implicit val ec: ExecutionContext = ValueReaderWrapper.readContext
+
+    val read = keyReader(layerName, zoom, zdt)
+    val keyBuffer = ByteBuffer.wrap(keys).order(ByteOrder.LITTLE_ENDIAN)
+    val coords = (0 until keys.length / 8).map { i => (keyBuffer.getInt(i * 8), keyBuffer.getInt(i * 8 + 4)) }
+
+    // The keys are split into at most `threads` groups, each of which is read in order
+    val groupSize = math.max((coords.length + threads - 1) / threads, 1)
+
+    val futures =
+      coords.grouped(groupSize).toList.map { group =>
+        Future {
+          group.flatMap { case (col, row) =>
+            try {
+              Some((col, row, read(col, row)))
+            } catch {
+              case e: ValueNotFoundError => None
+            }
+          }
+        }
+      }
+
+    val tiles = Await.result(Future.sequence(futures), Duration.Inf).flatten
+
+    val buffer =
+      ByteBuffer.allocate(tiles.map { case (_, _, bytes) => 12 + bytes.length }.sum).order(ByteOrder.LITTLE_ENDIAN)
+
+    tiles.foreach { case (col, row, bytes) =>
+      buffer.putInt(col).putInt(row).putInt(bytes.length).put(bytes)
+    }
+
+    buffer.array
   }
 }
@@ -4,16 +4,51 @@ import geopyspark.util.ProtoBufCodec
 import protos.tileMessages._
 import geotrellis.raster._
 
+import com.google.protobuf.UnsafeByteOperations
+
+import java.nio.ByteBuffer
+
 
 trait MultibandTileProtoBuf {
   import TileProtoBuf._
   implicit def multibandTileProtoBufCodec = new ProtoBufCodec[MultibandTile, ProtoMultibandTile] {
     def encode(tile: MultibandTile): ProtoMultibandTile = {
+      val protoCellType = cellTypeToMessage(tile.cellType)
       val tiles = for (i <- 0 until tile.bandCount) yield tile.band(i)
-      ProtoMultibandTile(tiles = tiles.map(tileProtoBufCodec.encode))
+
+      // Bands that are all constant are smaller when sent as tiles, otherwise every
+      // band is written into a single buffer.
+      if (tiles.isEmpty || tiles.forall { band => constantValue(band, protoCellType).isDefined })
+        ProtoMultibandTile(tiles = tiles.map(tileProtoBufCodec.encode))
+      else {
+        val buffer =
+          ByteBuffer.allocate(tile.bandCount * tile.cols * tile.rows * bytesPerCell(protoCellType.dataType))
+
+        tiles.foreach { band => writeCellBuffer(band, protoCellType.dataType, buffer) }
+
+        ProtoMultibandTile(
+          cols = tile.cols,
+          rows = tile.rows,
+          bandCount = tile.bandCount,
+          cellType = Some(protoCellType),
+          cellBuffer = UnsafeByteOperations.unsafeWrap(buffer.array))
+      }
     }
 
     def decode(message: ProtoMultibandTile): MultibandTile =
-      MultibandTile(message.tiles.map(tileProtoBufCodec.decode))
+      if (!message.cellBuffer.isEmpty) {
+        val protoCellType = message.cellType.get
+        val ct = messageToCellType(protoCellType)
+        val bandSize = message.cols * message.rows * bytesPerCell(protoCellType.dataType)
+
+        val bands =
+          for (i <- 0 until message.bandCount) yield {
+            val cells = message.cellBuffer.substring(i * bandSize, (i + 1) * bandSize)
+            fromCellBuffer(cells, ct, message.cols, message.rows)
+          }
+
+        MultibandTile(bands)
+      } else
+        MultibandTile(message.tiles.map(tileProtoBufCodec.decode))
   }
 }
@@ -6,109 +6,15 @@ import geotrellis.raster._
 
 import geotrellis.contrib.vlm.PaddedTile
 
+import com.google.protobuf.ByteString
 
-trait TileProtoBuf {
-  implicit def tileProtoBufCodec = new ProtoBufCodec[Tile, ProtoTile] {
-    private def cellTypeToMessage(ct: CellType): ProtoCellType = {
-      ct match {
-        case BitCellType =>
-          ProtoCellType(ProtoCellType.DataType.BIT, Byte.MinValue, false)
-
-        case ByteConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.BYTE, Byte.MinValue, true)
-        case ByteCellType =>
-          ProtoCellType(ProtoCellType.DataType.BYTE, hasNoData = false)
-        case ByteUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.BYTE, v, true)
-
-        case UByteConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.UBYTE, 0, true)
-        case UByteCellType =>
-          ProtoCellType(ProtoCellType.DataType.UBYTE, hasNoData = false)
-        case UByteUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.UBYTE, v, true)
-
-        case ShortConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.SHORT, Short.MinValue, true)
-        case ShortCellType =>
-          ProtoCellType(ProtoCellType.DataType.SHORT, hasNoData = false)
-        case ShortUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.SHORT, v, true)
-
-        case UShortConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.USHORT, 0, true)
-        case UShortCellType =>
-          ProtoCellType(ProtoCellType.DataType.USHORT, hasNoData = false)
-        case UShortUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.USHORT, v, true)
-
-        case IntConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.INT, Int.MinValue, true)
-        case IntCellType =>
-          ProtoCellType(ProtoCellType.DataType.INT, hasNoData = false)
-        case IntUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.INT, v, true)
-
-        case FloatConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.FLOAT, Float.NaN, true)
-        case FloatCellType =>
-          ProtoCellType(ProtoCellType.DataType.FLOAT, hasNoData = false)
-        case FloatUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.FLOAT, v, true)
-
-        case DoubleConstantNoDataCellType =>
-          ProtoCellType(ProtoCellType.DataType.DOUBLE, Double.NaN, true)
-        case DoubleCellType =>
-          ProtoCellType(ProtoCellType.DataType.DOUBLE, hasNoData = false)
-        case DoubleUserDefinedNoDataCellType(v) =>
-          ProtoCellType(ProtoCellType.DataType.DOUBLE, v, true)
-      }
-    }
+import java.nio.{ByteBuffer, ByteOrder}
 
-    private def messageToCellType(ctm: ProtoCellType): CellType = {
-      ctm match {
-        case ProtoCellType(ProtoCellType.DataType.BIT, nd, false) =>
-          BitCellType
-
-        case ProtoCellType(ProtoCellType.DataType.BYTE, nd, true) =>
-          ByteCells.withNoData(Some(nd.toByte))
-        case ProtoCellType(ProtoCellType.DataType.BYTE, nd, false) =>
-          ByteCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.UBYTE, nd, true) =>
-          UByteCells.withNoData(Some(nd.toByte))
-        case ProtoCellType(ProtoCellType.DataType.UBYTE, nd, false) =>
-          UByteCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.SHORT, nd, true) =>
-          ShortCells.withNoData(Some(nd.toShort))
-        case ProtoCellType(ProtoCellType.DataType.SHORT, nd, false) =>
-          ShortCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.USHORT, nd, true) =>
-          UShortCells.withNoData(Some(nd.toShort))
-        case ProtoCellType(ProtoCellType.DataType.USHORT, nd, false) =>
-          UShortCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.INT, nd, true) =>
-          IntCells.withNoData(Some(nd.toInt))
-        case ProtoCellType(ProtoCellType.DataType.INT, nd, false) =>
-          IntCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.FLOAT, nd, true) =>
-          FloatCells.withNoData(Some(nd.toFloat))
-        case ProtoCellType(ProtoCellType.DataType.FLOAT, nd, false) =>
-          FloatCells.withNoData(None)
-
-        case ProtoCellType(ProtoCellType.DataType.DOUBLE, nd, true) =>
-          DoubleCells.withNoData(Some(nd.toDouble))
-        case ProtoCellType(ProtoCellType.DataType.DOUBLE, nd, false) =>
-          DoubleCells.withNoData(None)
-      }
-    }
 
+trait TileProtoBuf {
+  implicit def tileProtoBufCodec = new ProtoBufCodec[Tile, ProtoTile] {
     def encode(targetTile: Tile): ProtoTile = {
-      val protoCellType = cellTypeToMessage(targetTile.cellType)
+      val protoCellType = TileProtoBuf.cellTypeToMessage(targetTile.cellType)
 
       val tile =
         targetTile match {
@@ -127,43 +33,296 @@ trait TileProtoBuf {
           rows = tile.rows,
           cellType = Some(protoCellType))
 
-      protoCellType.dataType.toString match {
-        case "BIT" =>
-          initialProtoTile.withUint32Cells(tile.toArray())
-        case "BYTE" =>
-          initialProtoTile.withSint32Cells(tile.interpretAs(ByteCellType).toArray())
-        case "UBYTE" =>
-          initialProtoTile.withUint32Cells(tile.interpretAs(UByteCellType).toArray())
-        case "SHORT" =>
-          initialProtoTile.withSint32Cells(tile.interpretAs(ShortCellType).toArray())
-        case "USHORT" =>
-          initialProtoTile.withUint32Cells(tile.interpretAs(UShortCellType).toArray())
-        case "INT" =>
-          initialProtoTile.withSint32Cells(tile.toArray())
-        case "FLOAT" =>
-          initialProtoTile.withFloatCells(tile.asInstanceOf[FloatArrayTile].array)
-        case "DOUBLE" =>
-          initialProtoTile.withDoubleCells(tile.asInstanceOf[DoubleArrayTile].array)
+      TileProtoBuf.constantValue(tile, protoCellType) match {
+        case Some(value) => initialProtoTile.withIsConstant(true).withConstantValue(value)
+        case None => initialProtoTile.withCellBuffer(TileProtoBuf.toCellBuffer(tile, protoCellType.dataType))
       }
     }
 
     def decode(message: ProtoTile): Tile = {
       val messageCellType = message.cellType.get
-      val ct = messageToCellType(messageCellType)
-
-      message.cellType.get.dataType.toString match {
-        case ("BYTE" | "SHORT" | "INT") =>
-          RawArrayTile(message.sint32Cells.toArray, message.cols, message.rows).interpretAs(ct)
-        case ("BIT" | "UBYTE" | "USHORT") =>
-          RawArrayTile(message.uint32Cells.toArray, message.cols, message.rows).interpretAs(ct)
-        case "FLOAT" =>
-          ArrayTile(message.floatCells.toArray, message.cols, message.rows).interpretAs(ct)
-        case "DOUBLE" =>
-          ArrayTile(message.doubleCells.toArray, message.cols, message.rows).interpretAs(ct)
-      }
+      val ct = TileProtoBuf.messageToCellType(messageCellType)
+
+      // Tiles encoded before the cellBuffer field existed still carry their cells in
+      // the repeated fields, so those are read if no buffer was sent.
+      if (message.isConstant)
+        TileProtoBuf.constantTile(message.constantValue, ct, message.cols, message.rows)
+      else if (!message.cellBuffer.isEmpty)
+        TileProtoBuf.fromCellBuffer(message.cellBuffer, ct, message.cols, message.rows)
+      else
+        message.cellType.get.dataType.toString match {
+          case ("BYTE" | "SHORT" | "INT") =>
+            RawArrayTile(message.sint32Cells.toArray, message.cols, message.rows).interpretAs(ct)
+          case ("BIT" | "UBYTE" | "USHORT") =>
+            RawArrayTile(message.uint32Cells.toArray, message.cols, message.rows).interpretAs(ct)
+          case "FLOAT" =>
+            ArrayTile(message.floatCells.toArray, message.cols, message.rows).interpretAs(ct)
+          case "DOUBLE" =>
+            ArrayTile(message.doubleCells.toArray, message.cols, message.rows).interpretAs(ct)
+        }
     }
   }
 }
 
 
-object TileProtoBuf extends TileProtoBuf
+object TileProtoBuf extends TileProtoBuf {
+  def cellTypeToMessage(ct: CellType): ProtoCellType = {
+    ct match {
+      case BitCellType =>
+        ProtoCellType(ProtoCellType.DataType.BIT, Byte.MinValue, false)
+
+      case ByteConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.BYTE, Byte.MinValue, true)
+      case ByteCellType =>
+        ProtoCellType(ProtoCellType.DataType.BYTE, hasNoData = false)
+      case ByteUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.BYTE, v, true)
+
+      case UByteConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.UBYTE, 0, true)
+      case UByteCellType =>
+        ProtoCellType(ProtoCellType.DataType.UBYTE, hasNoData = false)
+      case UByteUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.UBYTE, v, true)
+
+      case ShortConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.SHORT, Short.MinValue, true)
+      case ShortCellType =>
+        ProtoCellType(ProtoCellType.DataType.SHORT, hasNoData = false)
+      case ShortUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.SHORT, v, true)
+
+      case UShortConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.USHORT, 0, true)
+      case UShortCellType =>
+        ProtoCellType(ProtoCellType.DataType.USHORT, hasNoData = false)
+      case UShortUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.USHORT, v, true)
+
+      case IntConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.INT, Int.MinValue, true)
+      case IntCellType =>
+        ProtoCellType(ProtoCellType.DataType.INT, hasNoData = false)
+      case IntUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.INT, v, true)
+
+      case FloatConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.FLOAT, Float.NaN, true)
+      case FloatCellType =>
+        ProtoCellType(ProtoCellType.DataType.FLOAT, hasNoData = false)
+      case FloatUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.FLOAT, v, true)
+
+      case DoubleConstantNoDataCellType =>
+        ProtoCellType(ProtoCellType.DataType.DOUBLE, Double.NaN, true)
+      case DoubleCellType =>
+        ProtoCellType(ProtoCellType.DataType.DOUBLE, hasNoData = false)
+      case DoubleUserDefinedNoDataCellType(v) =>
+        ProtoCellType(ProtoCellType.DataType.DOUBLE, v, true)
+    }
+  }
+
+  def messageToCellType(ctm: ProtoCellType): CellType = {
+    ctm match {
+      case ProtoCellType(ProtoCellType.DataType.BIT, nd, false) =>
+        BitCellType
+
+      case ProtoCellType(ProtoCellType.DataType.BYTE, nd, true) =>
+        ByteCells.withNoData(Some(nd.toByte))
+      case ProtoCellType(ProtoCellType.DataType.BYTE, nd, false) =>
+        ByteCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.UBYTE, nd, true) =>
+        UByteCells.withNoData(Some(nd.toByte))
+      case ProtoCellType(ProtoCellType.DataType.UBYTE, nd, false) =>
+        UByteCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.SHORT, nd, true) =>
+        ShortCells.withNoData(Some(nd.toShort))
+      case ProtoCellType(ProtoCellType.DataType.SHORT, nd, false) =>
+        ShortCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.USHORT, nd, true) =>
+        UShortCells.withNoData(Some(nd.toShort))
+      case ProtoCellType(ProtoCellType.DataType.USHORT, nd, false) =>
+        UShortCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.INT, nd, true) =>
+        IntCells.withNoData(Some(nd.toInt))
+      case ProtoCellType(ProtoCellType.DataType.INT, nd, false) =>
+        IntCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.FLOAT, nd, true) =>
+        FloatCells.withNoData(Some(nd.toFloat))
+      case ProtoCellType(ProtoCellType.DataType.FLOAT, nd, false) =>
+        FloatCells.withNoData(None)
+
+      case ProtoCellType(ProtoCellType.DataType.DOUBLE, nd, true) =>
+        DoubleCells.withNoData(Some(nd.toDouble))
+      case ProtoCellType(ProtoCellType.DataType.DOUBLE, nd, false) =>
+        DoubleCells.withNoData(None)
+    }
+  }
+
+  /**
+    * Returns the raw value of every cell in the tile if they are all the same.
+    *
+    * NoData cells are reported as the nd value of the message's cell type. The scan stops at
+    * the first cell that differs from the first one, so tiles that are not constant are
+    * usually rejected after looking at only a few cells.
+    */
+  def constantValue(tile: Tile, protoCellType: ProtoCellType): Option[Double] = {
+    val cols = tile.cols
+    val rows = tile.rows
+
+    def sameAs(first: Double, value: Double): Boolean =
+      value == first || (isNoData(value) && isNoData(first))
+
+    val value: Option[Double] =
+      tile match {
+        case _ if cols == 0 || rows == 0 => None
+        case constant: ConstantTile =>
+          Some(if (tile.cellType.isFloatingPoint) constant.getDouble(0, 0) else constant.get(0, 0).toDouble)
+        case _ if tile.cellType.isFloatingPoint =>
+          val first = tile.getDouble(0, 0)
+          var row = 0
+          var constant = true
+          while (constant && row < rows) {
+            var col = 0
+            while (constant && col < cols) {
+              constant = sameAs(first, tile.getDouble(col, row))
+              col += 1
+            }
+            row += 1
+          }
+          if (constant) Some(first) else None
+        case _ =>
+          val first = tile.get(0, 0)
+          var row = 0
+          var constant = true
+          while (constant && row < rows) {
+            var col = 0
+            while (constant && col < cols) {
+              constant = tile.get(col, row) == first
+              col += 1
+            }
+            row += 1
+          }
+          if (constant) Some(first.toDouble) else None
+      }
+
+    value.map { v =>
+      val noData =
+        if (tile.cellType.isFloatingPoint) isNoData(v) else isNoData(v.toInt)
+
+      if (noData && protoCellType.hasNoData) protoCellType.nd else v
+    }
+  }
+
+  /** Creates a ``ConstantTile`` from a raw value, as sent in a ``ProtoTile``. */
+  def constantTile(value: Double, ct: CellType, cols: Int, rows: Int): Tile =
+    ct match {
+      case BitCellType =>
+        BitConstantTile(value != 0, cols, rows)
+      case cellType: ByteCells with NoDataHandling =>
+        ByteConstantTile(value.toByte, cols, rows, cellType)
+      case cellType: UByteCells with NoDataHandling =>
+        UByteConstantTile(value.toInt.toByte, cols, rows, cellType)
+      case cellType: ShortCells with NoDataHandling =>
+        ShortConstantTile(value.toShort, cols, rows, cellType)
+      case cellType: UShortCells with NoDataHandling =>
+        UShortConstantTile(value.toInt.toShort, cols, rows, cellType)
+      case cellType: IntCells with NoDataHandling =>
+        IntConstantTile(value.toInt, cols, rows, cellType)
+      case cellType: FloatCells with NoDataHandling =>
+        FloatConstantTile(value.toFloat, cols, rows, cellType)
+      case cellType: DoubleCells with NoDataHandling =>
+        DoubleConstantTile(value, cols, rows, cellType)
+    }
+
+  def bytesPerCell(dataType: ProtoCellType.DataType): Int =
+    dataType.toString match {
+      case ("BIT" | "BYTE" | "UBYTE") => 1
+      case ("SHORT" | "USHORT") => 2
+      case ("INT" | "FLOAT") => 4
+      case "DOUBLE" => 8
+    }
+
+  /**
+    * Writes the raw, little-endian cells of the tile into the buffer, starting at its
+    * current position, and moves the position past them.
+    */
+  def writeCellBuffer(tile: Tile, dataType: ProtoCellType.DataType, buffer: ByteBuffer): Unit = {
+    val bytes = buffer.slice().order(ByteOrder.LITTLE_ENDIAN)
+
+    dataType.toString match {
+      case "BIT" =>
+        tile.toArray().foreach { v => bytes.put(v.toByte) }
+      case "BYTE" =>
+        tile.interpretAs(ByteCellType).toArray().foreach { v => bytes.put(v.toByte) }
+      case "UBYTE" =>
+        tile.interpretAs(UByteCellType).toArray().foreach { v => bytes.put(v.toByte) }
+      case "SHORT" =>
+        val shorts = bytes.asShortBuffer
+        tile.interpretAs(ShortCellType).toArray().foreach { v => shorts.put(v.toShort) }
+      case "USHORT" =>
+        val shorts = bytes.asShortBuffer
+        tile.interpretAs(UShortCellType).toArray().foreach { v => shorts.put(v.toShort) }
+      case "INT" =>
+        bytes.asIntBuffer.put(tile.toArray())
+      case "FLOAT" =>
+        bytes.asFloatBuffer.put(tile.toArrayTile().asInstanceOf[FloatArrayTile].array)
+      case "DOUBLE" =>
+        bytes.asDoubleBuffer.put(tile.toArrayTile().asInstanceOf[DoubleArrayTile].array)
+    }
+
+    buffer.position(buffer.position() + tile.cols * tile.rows * bytesPerCell(dataType))
+  }
+
+  def toCellBuffer(tile: Tile, dataType: ProtoCellType.DataType): ByteString = {
+    val buffer = ByteBuffer.allocate(tile.cols * tile.rows * bytesPerCell(dataType))
+    writeCellBuffer(tile, dataType, buffer)
+
+    ByteString.copyFrom(buffer.array)
+  }
+
+  def fromCellBuffer(cellBuffer: ByteString, ct: CellType, cols: Int, rows: Int): Tile = {
+    val buffer = cellBuffer.asReadOnlyByteBuffer.order(ByteOrder.LITTLE_ENDIAN)
+    val size = cols * rows
+
+    ct match {
+      case BitCellType =>
+        val cells = Array.ofDim[Int](size)
+        for (i <- 0 until size) cells(i) = buffer.get(i).toInt
+        RawArrayTile(cells, cols, rows).interpretAs(ct)
+      case cellType: ByteCells with NoDataHandling =>
+        val cells = Array.ofDim[Byte](size)
+        buffer.get(cells)
+        ByteArrayTile(cells, cols, rows, cellType)
+      case cellType: UByteCells with NoDataHandling =>
+        val cells = Array.ofDim[Byte](size)
+        buffer.get(cells)
+        UByteArrayTile(cells, cols, rows, cellType)
+      case cellType: ShortCells with NoDataHandling =>
+        val cells = Array.ofDim[Short](size)
+        buffer.asShortBuffer.get(cells)
+        ShortArrayTile(cells, cols, rows, cellType)
+      case cellType: UShortCells with NoDataHandling =>
+        val cells = Array.ofDim[Short](size)
+        buffer.asShortBuffer.get(cells)
+        UShortArrayTile(cells, cols, rows, cellType)
+      case cellType: IntCells with NoDataHandling =>
+        val cells = Array.ofDim[Int](size)
+        buffer.asIntBuffer.get(cells)
+        IntArrayTile(cells, cols, rows, cellType)
+      case cellType: FloatCells with NoDataHandling =>
+        val cells = Array.ofDim[Float](size)
+        buffer.asFloatBuffer.get(cells)
+        FloatArrayTile(cells, cols, rows, cellType)
+      case cellType: DoubleCells with NoDataHandling =>
+        val cells = Array.ofDim[Double](size)
+        buffer.asDoubleBuffer.get(cells)
+        DoubleArrayTile(cells, cols, rows, cellType)
+    }
+  }
+}
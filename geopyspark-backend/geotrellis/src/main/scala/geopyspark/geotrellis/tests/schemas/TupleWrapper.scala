@@ -21,6 +21,11 @@ object TupleWrapper extends Wrapper2[(ProjectedExtent, MultibandTile), ProtoTupl
   def testOut(sc: SparkContext): JavaRDD[Array[Byte]] =
     PythonTranslator.toPython[(ProjectedExtent, MultibandTile), ProtoTuple](testRdd(sc))
 
+  def testOutBatched(sc: SparkContext, batchBytes: Int): JavaRDD[Array[Byte]] =
+    PythonTranslator.toPythonBatched[(ProjectedExtent, MultibandTile), ProtoTuple](testRdd(sc), batchBytes) {
+      tuples => ProtoTupleBatch(tuples = tuples)
+    }
+
   def testIn(rdd: RDD[Array[Byte]]) =
     PythonTranslator.fromPython[(ProjectedExtent, MultibandTile), ProtoTuple](rdd,
       ProtoTuple.parseFrom)
@@ -3,6 +3,12 @@ package geopyspark.geotrellis.tms
 import geotrellis.raster._
 import geotrellis.raster.render._
 
+/** Thrown when a renderer has no capacity left for another tile.
+  *
+  * Renderers that require encoding signal this by returning an empty image.
+  */
+class RendererBusyException extends RuntimeException("The tile renderer is busy")
+
 trait TileRender {
   def requiresEncoding(): Boolean
   def render(tiles: MultibandTile): Array[Byte] = ???
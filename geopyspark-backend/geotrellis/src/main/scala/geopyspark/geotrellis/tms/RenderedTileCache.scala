@@ -0,0 +1,182 @@
+package geopyspark.geotrellis.tms
+
+import java.io.File
+import java.net.{URLDecoder, URLEncoder}
+import java.nio.file.Files
+import java.security.MessageDigest
+import java.util.concurrent.atomic.AtomicLong
+
+import scala.collection.mutable.ArrayBuffer
+import scala.concurrent.{ExecutionContext, Future}
+import scala.util.Try
+
+
+case class RenderedTileKey(sourceIds: List[String], displayId: String, zoom: Int, x: Int, y: Int)
+
+/** A rendered image, or None if there was no tile to render */
+case class RenderedTile(png: Option[Array[Byte]], eTag: String, lastModified: Long) {
+  // Entries are never free, even when there is no image
+  def sizeBytes: Long = png.map(_.length.toLong).getOrElse(0L) + 64L
+}
+
+object RenderedTile {
+  def apply(png: Option[Array[Byte]], lastModified: Long): RenderedTile = {
+    val digest = MessageDigest.getInstance("MD5").digest(png.getOrElse(Array.empty[Byte]))
+
+    RenderedTile(png, digest.map("%02x".format(_)).mkString, lastModified)
+  }
+}
+
+/** A least recently used cache of the images that TMS routes have rendered.
+  *
+  * Images that are evicted from memory are written to `spillDirectory`, if it
+  * is not null, and are read back from there the next time they are requested.
+  * The spill directory is laid out as `source/display/zoom/x/y.png` and should
+  * not be shared with anything else.
+  */
+class RenderedTileCache(maxBytes: Long, spillDirectory: String) {
+  private val entries = new java.util.LinkedHashMap[RenderedTileKey, RenderedTile](16, 0.75f, true)
+  private var sizeBytes = 0L
+
+  private val hits = new AtomicLong
+  private val misses = new AtomicLong
+  private val evictions = new AtomicLong
+
+  private val spillRoot: Option[File] = Option(spillDirectory).map(new File(_))
+
+  private def encode(str: String): String = URLEncoder.encode(str, "UTF-8")
+
+  private def sourceDirectoryName(sourceIds: List[String]): String = encode(sourceIds.mkString("\n"))
+
+  private def sourceIdsOf(directory: File): List[String] =
+    URLDecoder.decode(directory.getName, "UTF-8").split("\n").toList
+
+  private def spillFile(key: RenderedTileKey): Option[File] =
+    spillRoot.map { root =>
+      new File(root,
+        Seq(sourceDirectoryName(key.sourceIds), encode(key.displayId), key.zoom, key.x, s"${key.y}.png").mkString(File.separator))
+    }
+
+  private def spill(key: RenderedTileKey, tile: RenderedTile): Unit =
+    spillFile(key).foreach { file =>
+      Try {
+        file.getParentFile.mkdirs()
+        Files.write(file.toPath, tile.png.getOrElse(Array.empty[Byte]))
+        file.setLastModified(tile.lastModified)
+      }
+    }
+
+  // Images without a tile are spilled as empty files
+  private def unspill(key: RenderedTileKey): Option[RenderedTile] =
+    spillFile(key).filter(_.isFile).flatMap { file =>
+      Try {
+        val bytes = Files.readAllBytes(file.toPath)
+        RenderedTile(if (bytes.isEmpty) None else Some(bytes), file.lastModified)
+      }.toOption
+    }
+
+  private def deleteRecursively(file: File): Unit = {
+    Option(file.listFiles).foreach { _.foreach(deleteRecursively) }
+    file.delete()
+  }
+
+  private def store(key: RenderedTileKey, tile: RenderedTile): Unit = {
+    val evicted = ArrayBuffer.empty[(RenderedTileKey, RenderedTile)]
+
+    synchronized {
+      Option(entries.put(key, tile)).foreach { previous => sizeBytes -= previous.sizeBytes }
+      sizeBytes += tile.sizeBytes
+
+      val iterator = entries.entrySet.iterator
+
+      while (sizeBytes > maxBytes && iterator.hasNext) {
+        val entry = iterator.next
+        iterator.remove()
+        sizeBytes -= entry.getValue.sizeBytes
+        evictions.incrementAndGet
+        evicted += entry.getKey -> entry.getValue
+      }
+    }
+
+    // Writing to disk happens outside of the lock so that readers are not held up
+    evicted.foreach { case (k, v) => spill(k, v) }
+  }
+
+  /** Returns the key of a tile whose source ids are separated by newlines */
+  def key(sourceIds: String, displayId: String, zoom: Int, x: Int, y: Int): RenderedTileKey =
+    RenderedTileKey(sourceIds.split("\n").toList, displayId, zoom, x, y)
+
+  def get(key: RenderedTileKey): Option[RenderedTile] = {
+    val cached = synchronized { Option(entries.get(key)) }.orElse {
+      val spilled = unspill(key)
+      spilled.foreach { tile => store(key, tile) }
+      spilled
+    }
+
+    if (cached.isDefined) hits.incrementAndGet else misses.incrementAndGet
+    cached
+  }
+
+  def put(key: RenderedTileKey, png: Option[Array[Byte]]): RenderedTile = {
+    val tile = RenderedTile(png, System.currentTimeMillis)
+    store(key, tile)
+    tile
+  }
+
+  /** Returns the cached image of `key`, or renders and caches it.
+    *
+    * An image of null means that rendering failed, that is not cached and fails
+    * the returned future.
+    */
+  def getOrElseUpdate(key: RenderedTileKey)(render: => Future[Option[Array[Byte]]])
+                     (implicit ec: ExecutionContext): Future[RenderedTile] =
+    get(key) match {
+      case Some(tile) => Future.successful(tile)
+      case None =>
+        render.map {
+          case Some(null) => throw new IllegalStateException(s"Could not render $key")
+          case png => put(key, png)
+        }
+    }
+
+  /** Drops the cached images of a source, display and zoom. Null matches everything. */
+  def invalidate(sourceId: String, displayId: String, zoom: Integer): Unit = {
+    def matches(sourceIds: List[String], display: String, z: Int): Boolean =
+      (sourceId == null || sourceIds.contains(sourceId)) &&
+      (displayId == null || display == displayId) &&
+      (zoom == null || z == zoom.intValue)
+
+    synchronized {
+      val iterator = entries.entrySet.iterator
+
+      while (iterator.hasNext) {
+        val entry = iterator.next
+        val key = entry.getKey
+
+        if (matches(key.sourceIds, key.displayId, key.zoom)) {
+          iterator.remove()
+          sizeBytes -= entry.getValue.sizeBytes
+        }
+      }
+    }
+
+    for {
+      root <- spillRoot.toSeq
+      sourceDirectory <- Option(root.listFiles).toSeq.flatten if sourceDirectory.isDirectory
+      sourceIds = sourceIdsOf(sourceDirectory) if sourceId == null || sourceIds.contains(sourceId)
+      displayDirectory <- Option(sourceDirectory.listFiles).toSeq.flatten
+      if displayId == null || displayDirectory.getName == encode(displayId)
+    } {
+      if (zoom == null)
+        deleteRecursively(displayDirectory)
+      else
+        deleteRecursively(new File(displayDirectory, zoom.toString))
+    }
+  }
+
+  def clear(): Unit = invalidate(null, null, null)
+
+  /** Returns the hits, misses, evictions and size in bytes of the cache */
+  def stats(): Array[Long] =
+    Array(hits.get, misses.get, evictions.get, synchronized { sizeBytes })
+}
@@ -133,27 +133,79 @@ object TileReaders {
   private case object Initialize extends FulfillerCommand
   private case class FulfillRequests(reqs: Seq[QueueRequest]) extends AggregatorCommand
 
+  /** A short-lived cache of the tiles read along with requested ones.
+    *
+    * Keys that were looked up but are not in the layer are cached as None.
+    */
+  private class MetatileCache(ttl: FiniteDuration, maxEntries: Int) {
+    private val entries = new java.util.LinkedHashMap[(Int, SpatialKey), (Option[MultibandTile], Long)](16, 0.75f, true)
+
+    def get(zoom: Int, key: SpatialKey): Option[Option[MultibandTile]] = synchronized {
+      Option(entries.get((zoom, key))) match {
+        case Some((tile, expires)) if expires > System.currentTimeMillis => Some(tile)
+        case Some(_) =>
+          entries.remove((zoom, key))
+          None
+        case None => None
+      }
+    }
+
+    def put(zoom: Int, key: SpatialKey, tile: Option[MultibandTile]): Unit = synchronized {
+      entries.put((zoom, key), (tile, System.currentTimeMillis + ttl.toMillis))
+
+      val iterator = entries.entrySet.iterator
+      while (entries.size > maxEntries && iterator.hasNext) {
+        iterator.next
+        iterator.remove()
+      }
+    }
+  }
+
+  private object MetatileCache {
+    val ttl = 30 seconds
+    val maxEntries = 1024
+  }
+
+  /** The keys of the metatileSize x metatileSize block that a key is in */
+  private def metatileKeys(key: SpatialKey, metatileSize: Int): Seq[SpatialKey] = {
+    val col0 = key.col / metatileSize * metatileSize
+    val row0 = key.row / metatileSize * metatileSize
+
+    for (col <- col0 until col0 + metatileSize; row <- row0 until row0 + metatileSize) yield SpatialKey(col, row)
+  }
+
+  private def overzoomedKey(zoom: Int, key: SpatialKey, maxZoom: Int): SpatialKey = {
+    val dz = zoom - maxZoom
+    SpatialKey((key.col / math.pow(2, dz)).toInt, (key.row / math.pow(2, dz)).toInt)
+  }
+
   private object RDDLookup {
     val interval = 150 milliseconds
     def props(levels: scala.collection.Map[Int, RDD[(SpatialKey, MultibandTile)]],
               aggregator: ActorRef,
-              overzooming: Boolean
-            ) = Props(new RDDLookup(levels, aggregator, overzooming))
+              overzooming: Boolean,
+              metatileSize: Int,
+              interval: FiniteDuration,
+              metatiles: MetatileCache
+            ) = Props(new RDDLookup(levels, aggregator, overzooming, metatileSize, interval, metatiles))
   }
 
   private class RDDLookup(
     levels: scala.collection.Map[Int, RDD[(SpatialKey, MultibandTile)]],
     aggregator: ActorRef,
-    overzooming: Boolean
+    overzooming: Boolean,
+    metatileSize: Int,
+    interval: FiniteDuration,
+    metatiles: MetatileCache
   )(implicit ec: ExecutionContext) extends Actor {
     private val maxZoom = levels.keys.max
 
     def receive = {
       case Initialize =>
-        context.system.scheduler.scheduleOnce(RDDLookup.interval, aggregator, DumpRequests)
+        context.system.scheduler.scheduleOnce(interval, aggregator, DumpRequests)
       case FulfillRequests(requests) =>
         fulfillRequests(requests)
-        context.system.scheduler.scheduleOnce(RDDLookup.interval, aggregator, DumpRequests)
+        context.system.scheduler.scheduleOnce(interval, aggregator, DumpRequests)
     }
 
     def fulfillRequests(requests: Seq[QueueRequest]) = {
@@ -161,35 +213,35 @@ object TileReaders {
         requests
           .groupBy{ case QueueRequest(zoom, _, _, _) => zoom }
           .foreach{ case (zoom, reqs) => {
-            levels.get(zoom) match {
-              case Some(rdd) =>
-                val kps = reqs.map{ case QueueRequest(_, x, y, promise) => (SpatialKey(x, y), promise) }
-                val keys = reqs.map{ case QueueRequest(_, x, y, _) => SpatialKey(x, y) }.toSet
-                val results = new MultiValueRDDFunctions(rdd).multilookup(keys)
-                kps.foreach{ case (key, promise) => {
-                  promise success (
-                    results
-                      .find{ case (rddKey, _) => rddKey == key }
-                      .map{ case (_, tile) => tile }
-                  )
-                }}
-              case None =>
-                if (overzooming && zoom > maxZoom) {
-                  val rdd = levels(maxZoom)
-                  val kps = reqs.map{ case QueueRequest(_, x, y, promise) => (SpatialKey(x, y), promise) }
-                  val dz = zoom - maxZoom
-                  val remap: SpatialKey => SpatialKey = {
-                    case SpatialKey(x, y) => SpatialKey((x / math.pow(2, dz)).toInt, (y / math.pow(2, dz)).toInt)
-                  }
-                  val keys = kps.map{ case (key, _) => remap(key) }.toSet
-                  val rawTiles = new MultiValueRDDFunctions(rdd).multilookup(keys)
-                  val fetch: SpatialKey => MultibandTile = { toFind => rawTiles.find{ case (rddKey, _) => rddKey == toFind }.get._2 }
+            val kps = reqs.map{ case QueueRequest(_, x, y, promise) => (SpatialKey(x, y), promise) }
+
+            if (levels.contains(zoom) || (overzooming && zoom > maxZoom)) {
+              val readZoom = if (levels.contains(zoom)) zoom else maxZoom
+              val readKey: SpatialKey => SpatialKey =
+                if (readZoom == zoom) identity else overzoomedKey(zoom, _, maxZoom)
+
+              // Every tile in the metatiles of the requested ones is read by the same job
+              val keys = kps.map{ case (key, _) => readKey(key) }.toSet.flatMap { key: SpatialKey => metatileKeys(key, metatileSize) }
+
+              Try(new MultiValueRDDFunctions(levels(readZoom)).multilookup(keys).toMap) match {
+                case Success(results) =>
+                  keys.foreach { key => metatiles.put(readZoom, key, results.get(key)) }
+
                   kps.foreach{ case (key, promise) =>
-                    promise success (Try(rezoom(zoom, key._1, key._2, maxZoom, fetch)).toOption)
+                    val tile = results.get(readKey(key))
+
+                    promise success (
+                      if (readZoom == zoom)
+                        tile
+                      else
+                        tile.flatMap { t => Try(rezoom(zoom, key._1, key._2, maxZoom, _ => t)).toOption }
+                    )
                   }
-                } else
-                  reqs.foreach{ case QueueRequest(_, _, _, promise) => promise success None }
-            }
+                case Failure(e) =>
+                  kps.foreach{ case (_, promise) => promise failure e }
+              }
+            } else
+              kps.foreach{ case (_, promise) => promise success None }
           }}
       }
     }
@@ -198,7 +250,9 @@ object TileReaders {
   private class SpatialRddTileReader(
     levels: scala.collection.Map[Int, RDD[(SpatialKey, MultibandTile)]],
     system: ActorSystem,
-    overzooming: Boolean
+    overzooming: Boolean,
+    metatileSize: Int,
+    coalesceWindow: FiniteDuration
   ) extends TileReader {
 
     import java.util.UUID
@@ -208,12 +262,20 @@ object TileReaders {
     private var _aggregator: ActorRef = null
     private var _fulfiller: ActorRef = null
 
+    private val maxZoom = levels.keys.max
+    private val metatiles = new MetatileCache(MetatileCache.ttl, MetatileCache.maxEntries)
+
+    // Identical requests that arrive while a tile is being read share its future
+    private val inFlight = TrieMap.empty[(Int, Int, Int), Future[Option[MultibandTile]]]
+
     override def startup() = {
       if (_aggregator != null)
         throw new IllegalStateException("Cannot start: TMS server already running")
 
       _aggregator = system.actorOf(RequestAggregator.props, UUID.randomUUID.toString)
-      _fulfiller = system.actorOf(RDDLookup.props(levels, aggregator, overzooming), UUID.randomUUID.toString)
+      _fulfiller = system.actorOf(
+        RDDLookup.props(levels, aggregator, overzooming, metatileSize, coalesceWindow, metatiles),
+        UUID.randomUUID.toString)
       _fulfiller ! Initialize
     }
 
@@ -230,11 +292,30 @@ object TileReaders {
     def aggregator = _aggregator
     def fulfiller = _fulfiller
 
-    def retrieve(zoom: Int, x: Int, y: Int) = {
-      val callback = Promise[Option[MultibandTile]]()
-      aggregator ! QueueRequest(zoom, x, y, callback)
-      callback.future
-    }
+    private def cached(zoom: Int, x: Int, y: Int): Option[Option[MultibandTile]] =
+      if (levels.contains(zoom))
+        metatiles.get(zoom, SpatialKey(x, y))
+      else if (overzooming && zoom > maxZoom)
+        metatiles
+          .get(maxZoom, overzoomedKey(zoom, SpatialKey(x, y), maxZoom))
+          .map { _.flatMap { tile => Try(rezoom(zoom, x, y, maxZoom, _ => tile)).toOption } }
+      else
+        Some(None)
+
+    def retrieve(zoom: Int, x: Int, y: Int) =
+      cached(zoom, x, y) match {
+        case Some(tile) => Future.successful(tile)
+        case None =>
+          val callback = Promise[Option[MultibandTile]]()
+
+          inFlight.putIfAbsent((zoom, x, y), callback.future) match {
+            case Some(pending) => pending
+            case None =>
+              callback.future.onComplete { _ => inFlight.remove((zoom, x, y), callback.future) }
+              aggregator ! QueueRequest(zoom, x, y, callback)
+              callback.future
+          }
+      }
   }
 
   def createCatalogReader(uriString: String, layerName: String, overzooming: Boolean): TileReader = {
@@ -270,9 +351,18 @@ object TileReaders {
     levels: java.util.HashMap[Int, TiledRasterLayer[SpatialKey]],
     system: ActorSystem,
     overzooming: Boolean
+  ): TileReader =
+    createSpatialRddReader(levels, system, overzooming, 1, RDDLookup.interval.toMillis.toInt)
+
+  def createSpatialRddReader(
+    levels: java.util.HashMap[Int, TiledRasterLayer[SpatialKey]],
+    system: ActorSystem,
+    overzooming: Boolean,
+    metatileSize: Int,
+    coalesceMillis: Int
   ): TileReader = {
     val tiles = levels.mapValues(_.rdd)
-    new SpatialRddTileReader(tiles, system, overzooming)
+    new SpatialRddTileReader(tiles, system, overzooming, metatileSize, coalesceMillis.milliseconds)
   }
 
 }
@@ -12,7 +12,8 @@ import akka.actor.{Actor, ActorRef, ActorSystem, Props}
 import akka.http.scaladsl.marshallers.sprayjson.SprayJsonSupport._
 import akka.http.scaladsl.marshallers.sprayjson.SprayJsonSupport
 import akka.http.scaladsl.marshalling.{Marshaller, ToResponseMarshaller}
-import akka.http.scaladsl.model.{ContentType, HttpEntity, HttpResponse, MediaTypes, StatusCodes}
+import akka.http.scaladsl.model.{ContentType, DateTime, HttpEntity, HttpResponse, MediaTypes, StatusCodes}
+import akka.http.scaladsl.model.headers.EntityTag
 import akka.http.scaladsl.model.MediaTypes.{`image/png`, `text/plain`}
 import akka.http.scaladsl.server.{Route, Directives}
 import akka.http.scaladsl.unmarshalling.Unmarshaller._
@@ -32,7 +33,7 @@ import scala.concurrent.duration._
 import scala.concurrent.ExecutionContext.Implicits.global
 import scala.collection.immutable.HashMap
 import scala.collection.concurrent._
-import scala.util.Try
+import scala.util.{Failure, Success, Try}
 
 import org.apache.log4j.Logger
 
@@ -56,6 +57,35 @@ trait TMSServerRoute extends Directives with AkkaSystem.LoggerExecutor {
     v
   }
 
+  /** Completes with the image that `render` makes, or with the cached one.
+    *
+    * Cached images are served with an ETag and a Last-Modified header, so that
+    * clients can revalidate them with conditional requests. If the renderer is
+    * busy, the request is answered with 503 so that clients retry later.
+    */
+  def cachedTile(cache: RenderedTileCache, key: RenderedTileKey)(render: => Future[Option[Array[Byte]]]): Route = {
+    def checkedRender: Future[Option[Array[Byte]]] =
+      render.map {
+        case Some(img) if img != null && img.isEmpty => throw new RendererBusyException
+        case img => img
+      }
+
+    val rendered: Future[(Option[Array[Byte]], Option[RenderedTile])] =
+      if (cache == null)
+        checkedRender.map { img => (img, None) }
+      else
+        cache.getOrElseUpdate(key)(checkedRender).map { tile => (tile.png, Some(tile)) }
+
+    onComplete(rendered) {
+      case Success((Some(img), Some(tile))) =>
+        conditional(EntityTag(tile.eTag), DateTime(tile.lastModified)) { complete(img) }
+      case Success((Some(img), None)) => complete(img)
+      case Success((None, _)) => complete(204, None)
+      case Failure(_: RendererBusyException) => complete(StatusCodes.ServiceUnavailable)
+      case Failure(e) => failWith(e)
+    }
+  }
+
   implicit def pngMarshaller: ToResponseMarshaller[Array[Byte]] = Marshaller.oneOf(
     Marshaller.withFixedContentType(ContentType(`image/png`)) { img =>
       HttpResponse(entity = HttpEntity(ContentType(`image/png`), img))
@@ -64,10 +94,16 @@ trait TMSServerRoute extends Directives with AkkaSystem.LoggerExecutor {
 
 object TMSServerRoutes {
 
-  private class RenderingTileRoute(reader: TileReader, renderer: TileRender) extends TMSServerRoute {
+  private class RenderingTileRoute(
+    reader: TileReader,
+    renderer: TileRender,
+    cache: RenderedTileCache,
+    sourceId: String,
+    displayId: String
+  ) extends TMSServerRoute {
     def root: Route =
       pathPrefix("tile" / IntNumber / IntNumber / IntNumber) { (zoom, x, y) =>
-        val tileFuture =
+        cachedTile(cache, RenderedTileKey(List(sourceId), displayId, zoom, x, y)) {
           reader
             .retrieve(zoom, x, y)
             .map(_.map{tile =>
@@ -77,9 +113,6 @@ object TMSServerRoutes {
                 renderer.render(tile)
               }
             })
-        onSuccess(tileFuture) {
-          case Some(t) => complete(t)
-          case None => complete(204, None)
         }
       }
 
@@ -87,12 +120,19 @@ object TMSServerRoutes {
     override def shutdown() = reader.shutdown()
   }
 
-  private class CompositingTileRoute(readers: List[TileReader], compositer: TileCompositer) extends TMSServerRoute {
+  private class CompositingTileRoute(
+    readers: List[TileReader],
+    compositer: TileCompositer,
+    cache: RenderedTileCache,
+    sourceIds: List[String],
+    displayId: String
+  ) extends TMSServerRoute {
     def root: Route =
       pathPrefix("tile" / IntNumber / IntNumber / IntNumber) { (zoom, x, y) =>
-        val tileFutures: List[Future[Option[MultibandTile]]] = readers.map(_.retrieve(zoom, x, y))
-        val futureTiles: Future[Option[Array[MultibandTile]]] = tileFutures.sequence.map(_.sequence).map(_.map(_.toArray))
-        val composited: Future[Option[Array[Byte]]] =
+        cachedTile(cache, RenderedTileKey(sourceIds, displayId, zoom, x, y)) {
+          val tileFutures: List[Future[Option[MultibandTile]]] = readers.map(_.retrieve(zoom, x, y))
+          val futureTiles: Future[Option[Array[MultibandTile]]] = tileFutures.sequence.map(_.sequence).map(_.map(_.toArray))
+
           futureTiles
             .map(
               _.map(array =>
@@ -103,10 +143,6 @@ object TMSServerRoutes {
                 }
               )
             )
-
-        onSuccess(composited) {
-          case Some(img) => complete(img)
-          case None => complete(204, None)
         }
       }
 
@@ -114,8 +150,28 @@ object TMSServerRoutes {
     override def shutdown() = readers.foreach(_.shutdown())
   }
 
-  def renderingTileRoute(reader: TileReader, renderer: TileRender): TMSServerRoute = new RenderingTileRoute(reader, renderer)
-
-  def compositingTileRoute(readers: java.util.ArrayList[TileReader], compositer: TileCompositer): TMSServerRoute = new CompositingTileRoute(readers.toList, compositer)
+  def renderingTileRoute(reader: TileReader, renderer: TileRender): TMSServerRoute =
+    new RenderingTileRoute(reader, renderer, null, null, null)
+
+  def renderingTileRoute(
+    reader: TileReader,
+    renderer: TileRender,
+    cache: RenderedTileCache,
+    sourceId: String,
+    displayId: String
+  ): TMSServerRoute =
+    new RenderingTileRoute(reader, renderer, cache, sourceId, displayId)
+
+  def compositingTileRoute(readers: java.util.ArrayList[TileReader], compositer: TileCompositer): TMSServerRoute =
+    new CompositingTileRoute(readers.toList, compositer, null, null, null)
+
+  def compositingTileRoute(
+    readers: java.util.ArrayList[TileReader],
+    compositer: TileCompositer,
+    cache: RenderedTileCache,
+    sourceIds: java.util.ArrayList[String],
+    displayId: String
+  ): TMSServerRoute =
+    new CompositingTileRoute(readers.toList, compositer, cache, sourceIds.toList, displayId)
 
 }
@@ -0,0 +1,151 @@
+package geopyspark.util
+
+import org.apache.spark.api.java.JavaRDD
+
+import net.jpountz.lz4.LZ4Factory
+import com.github.luben.zstd.Zstd
+
+import java.io.ByteArrayOutputStream
+import java.nio.{ByteBuffer, ByteOrder}
+import java.util.zip.{Deflater, Inflater}
+
+
+/**
+  * Compresses the frames that are sent between the JVM and Python.
+  *
+  * A compressed frame starts with a one byte codec id and the length of the uncompressed
+  * frame as a little-endian int, followed by the payload. Frames that did not compress well
+  * are stored with the NONE codec, so that the reader never has to guess.
+  */
+object FrameCompression {
+  final val NONE: Byte = 0
+  final val ZLIB: Byte = 1
+  final val LZ4: Byte = 2
+  final val ZSTD: Byte = 3
+
+  private final val HEADER_SIZE = 5
+
+  /** Frames that compress to more than this fraction of their size are stored as is */
+  private final val MAX_RATIO = 0.9
+
+  /** The number of bytes compressed when probing whether a frame is worth compressing */
+  private final val PROBE_SIZE = 64 * 1024
+
+  def codecId(codec: String): Byte =
+    codec match {
+      case "none" => NONE
+      case "zlib" => ZLIB
+      case "lz4" => LZ4
+      case "zstd" => ZSTD
+      case _ => throw new IllegalArgumentException(s"Unknown frame compression codec: $codec")
+    }
+
+  private def deflate(bytes: Array[Byte], offset: Int, length: Int, level: Int): Array[Byte] = {
+    val deflater = new Deflater(if (level < 0) Deflater.DEFAULT_COMPRESSION else level)
+    val output = new ByteArrayOutputStream(length / 2 + 64)
+    val buffer = new Array[Byte](64 * 1024)
+
+    try {
+      deflater.setInput(bytes, offset, length)
+      deflater.finish()
+
+      while (!deflater.finished()) {
+        val count = deflater.deflate(buffer)
+        output.write(buffer, 0, count)
+      }
+    } finally {
+      deflater.end()
+    }
+
+    output.toByteArray
+  }
+
+  private def inflate(bytes: Array[Byte], offset: Int, rawLength: Int): Array[Byte] = {
+    val inflater = new Inflater()
+    val result = new Array[Byte](rawLength)
+
+    try {
+      inflater.setInput(bytes, offset, bytes.length - offset)
+
+      var count = 0
+      while (count < rawLength && !inflater.finished())
+        count += inflater.inflate(result, count, rawLength - count)
+    } finally {
+      inflater.end()
+    }
+
+    result
+  }
+
+  private def encode(codec: Byte, level: Int, bytes: Array[Byte], offset: Int, length: Int): Array[Byte] =
+    codec match {
+      case ZLIB => deflate(bytes, offset, length, level)
+      case LZ4 =>
+        val factory = LZ4Factory.fastestInstance()
+        val compressor = if (level > 0) factory.highCompressor(level) else factory.fastCompressor()
+        compressor.compress(bytes, offset, length)
+      case ZSTD =>
+        val input = java.util.Arrays.copyOfRange(bytes, offset, offset + length)
+        Zstd.compress(input, if (level > 0) level else 3)
+    }
+
+  private def withHeader(codec: Byte, rawLength: Int, payload: Array[Byte]): Array[Byte] =
+    ByteBuffer
+      .allocate(HEADER_SIZE + payload.length)
+      .order(ByteOrder.LITTLE_ENDIAN)
+      .put(codec)
+      .putInt(rawLength)
+      .put(payload)
+      .array
+
+  /**
+    * Compresses a single frame.
+    *
+    * @param probe If true, a sample of the frame is compressed first and the whole frame is
+    *              only compressed if the sample shrank. This avoids spending time on frames of
+    *              floating point cells, which rarely compress.
+    */
+  def compress(frame: Array[Byte], codec: Byte, level: Int, probe: Boolean): Array[Byte] = {
+    val worthCompressing =
+      codec != NONE && (
+        !probe ||
+        frame.length <= 2 * PROBE_SIZE ||
+        encode(codec, level, frame, 0, PROBE_SIZE).length <= PROBE_SIZE * MAX_RATIO)
+
+    if (worthCompressing) {
+      val compressed = encode(codec, level, frame, 0, frame.length)
+
+      if (compressed.length <= frame.length * MAX_RATIO)
+        withHeader(codec, frame.length, compressed)
+      else
+        withHeader(NONE, frame.length, frame)
+    } else
+      withHeader(NONE, frame.length, frame)
+  }
+
+  def decompress(frame: Array[Byte]): Array[Byte] = {
+    val buffer = ByteBuffer.wrap(frame).order(ByteOrder.LITTLE_ENDIAN)
+    val codec = buffer.get()
+    val rawLength = buffer.getInt()
+
+    codec match {
+      case NONE => java.util.Arrays.copyOfRange(frame, HEADER_SIZE, frame.length)
+      case ZLIB => inflate(frame, HEADER_SIZE, rawLength)
+      case LZ4 =>
+        LZ4Factory.fastestInstance().fastDecompressor().decompress(frame, HEADER_SIZE, rawLength)
+      case ZSTD =>
+        Zstd.decompress(java.util.Arrays.copyOfRange(frame, HEADER_SIZE, frame.length), rawLength)
+      case _ => throw new IllegalArgumentException(s"Unknown frame compression codec id: $codec")
+    }
+  }
+
+  /** Compresses each frame of an RDD that is about to be sent to Python */
+  def compress(rdd: JavaRDD[Array[Byte]], codec: String, level: Int, probe: Boolean): JavaRDD[Array[Byte]] = {
+    val id = codecId(codec)
+    rdd.rdd.map { frame => compress(frame, id, level, probe) }.toJavaRDD
+  }
+
+  /** Decompresses each frame of an RDD that was sent from Python */
+  def decompress(rdd: JavaRDD[Array[Byte]]): JavaRDD[Array[Byte]] =
+    rdd.rdd.map { frame => decompress(frame) }.toJavaRDD
+}
@@ -6,6 +6,7 @@ import org.apache.spark.rdd.RDD
 import org.apache.spark.api.java.JavaRDD
 
 import scala.reflect.ClassTag
+import scala.collection.mutable.ArrayBuffer
 
 import com.trueaccord.scalapb.GeneratedMessage
 
@@ -33,6 +34,38 @@ object PythonTranslator {
     array_list
   }
 
+  /** Encodes the RDD so that each record holds as many messages as fit in `batchBytes` */
+  def toPythonBatched[T, M <: GeneratedMessage](
+    rdd: RDD[T],
+    batchBytes: Int
+  )(toBatch: Seq[M] => GeneratedMessage)(implicit codec: ProtoBufCodec[T, M]): JavaRDD[Array[Byte]] =
+    rdd.mapPartitions { iter =>
+      val messages = iter.map { v => codec.encode(v) }
+
+      new Iterator[Array[Byte]] {
+        def hasNext: Boolean = messages.hasNext
+
+        def next(): Array[Byte] = {
+          val batch = ArrayBuffer[M]()
+          var size = 0
+
+          while (messages.hasNext && (batch.isEmpty || size < batchBytes)) {
+            val message = messages.next()
+            size += message.serializedSize
+            batch += message
+          }
+
+          toBatch(batch).toByteArray
+        }
+      }
+    }.toJavaRDD
+
+  def fromPythonBatched[T: ClassTag, M <: GeneratedMessage](
+    rdd: RDD[Array[Byte]],
+    toProtoClasses: Array[Byte] => Seq[M]
+  )(implicit codec: ProtoBufCodec[T, M]): RDD[T] =
+    rdd.flatMap { bytes => toProtoClasses(bytes).map { message => codec.decode(message) } }
+
   def fromPython[T: ClassTag, M <: GeneratedMessage](
     rdd: RDD[Array[Byte]],
     toProtoClass: Array[Byte] => M
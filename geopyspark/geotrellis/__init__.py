@@ -4,12 +4,12 @@ import json
 import warnings
 import datetime
 import functools
-import datetime
+import numbers
 from shapely.geometry import box
 import pytz
 
 from geopyspark import get_spark_context
-from geopyspark.geotrellis.constants import CellType, NO_DATA_INT, Unit, LayerType
+from geopyspark.geotrellis.constants import CellType, NO_DATA_INT, Unit, LayerType, TimeUnit
 
 
 _EPOCH = datetime.datetime.utcfromtimestamp(0)
@@ -21,12 +21,63 @@ def check_partition_strategy(partition_strategy, layer_type):
 
 
 def _convert_to_unix_time(date_time):
-    if date_time.tzinfo:
+    if isinstance(date_time, numbers.Integral):
+        # Already in milliseconds since the epoch
+        return int(date_time)
+    elif date_time.tzinfo:
         return int((date_time.astimezone(pytz.utc) - _EPOCH.replace(tzinfo=pytz.utc)).total_seconds() * 1000)
     else:
         return int((date_time - _EPOCH).total_seconds() * 1000)
 
 
+# The bit interleaving below matches GeoTrellis' Z2 and Z3 curves, so that keys are grouped the
+# same way in Python as they are by the SpatialPartitioner and SpaceTimePartitioner on the JVM.
+
+def _z2_split(value):
+    x = value & 0x7fffffff
+    x = (x ^ (x << 32)) & 0x00000000ffffffff
+    x = (x ^ (x << 16)) & 0x0000ffff0000ffff
+    x = (x ^ (x << 8)) & 0x00ff00ff00ff00ff
+    x = (x ^ (x << 4)) & 0x0f0f0f0f0f0f0f0f
+    x = (x ^ (x << 2)) & 0x3333333333333333
+    x = (x ^ (x << 1)) & 0x5555555555555555
+    return x
+
+
+def _z2_index(col, row):
+    return _z2_split(col) | _z2_split(row) << 1
+
+
+def _z3_split(value):
+    x = value & 0x1fffff
+    x = (x | x << 32) & 0x1f00000000ffff
+    x = (x | x << 16) & 0x1f0000ff0000ff
+    x = (x | x << 8) & 0x100f00f00f00f00f
+    x = (x | x << 4) & 0x10c30c30c30c30c3
+    x = (x | x << 2) & 0x1249249249249249
+    return x
+
+
+def _z3_index(col, row, time):
+    return _z3_split(col) | _z3_split(row) << 1 | _z3_split(time) << 2
+
+
+_TIME_UNIT_MILLIS = {
+    TimeUnit.MILLIS: 1,
+    TimeUnit.SECONDS: 1000,
+    TimeUnit.MINUTES: 1000 * 60,
+    TimeUnit.HOURS: 1000 * 60 * 60,
+    TimeUnit.DAYS: 1000 * 60 * 60 * 24,
+    TimeUnit.WEEKS: 1000 * 60 * 60 * 24 * 7,
+    TimeUnit.MONTHS: 1000 * 60 * 60 * 24 * 30,
+    TimeUnit.YEARS: 1000 * 60 * 60 * 24 * 365
+}
+
+
+def _time_resolution_millis(time_unit, time_resolution=None):
+    return _TIME_UNIT_MILLIS[TimeUnit(time_unit)] * int(time_resolution or 1)
+
+
 def zfactor_lat_lng_calculator(unit):
     """Produces the Scala class, ``ZFactorCalculator`` as a ``JavaObject``.
 
@@ -469,6 +520,20 @@ class SpatialKey(namedtuple("SpatialKey", 'col row')):
 
     __slots__ = []
 
+    def zindex(self):
+        """Packs the key into a single 64-bit int by interleaving the bits of ``col`` and
+        ``row`` along a Z-order curve.
+
+        Keys that are near each other in the grid tend to have indices that are near each
+        other, so the index can be used to sort, hash, or partition keys while keeping them
+        spatially local.
+
+        Returns:
+            int
+        """
+
+        return _z2_index(self.col, self.row)
+
 
 class SpaceTimeKey(namedtuple("SpaceTimeKey", 'col row instant')):
     """
@@ -479,16 +544,35 @@ class SpaceTimeKey(namedtuple("SpaceTimeKey", 'col row instant')):
     Args:
         col (int): The column of the grid, the numbers run east to west.
         row (int): The row of the grid, the numbers run north to south.
-        instant (``datetime.datetime``): The time stamp of the raster.
+        instant (``datetime.datetime`` or int): The time stamp of the raster. This may also be
+            given as an int of the milliseconds since the epoch.
 
     Attributes:
         col (int): The column of the grid, the numbers run east to west.
         row (int): The row of the grid, the numbers run north to south.
-        instant (``datetime.datetime``): The time stamp of the raster.
+        instant (``datetime.datetime`` or int): The time stamp of the raster.
     """
 
     __slots__ = []
 
+    def zindex(self, time_unit, time_resolution=None):
+        """Packs the key into a single 64-bit int by interleaving the bits of ``col``, ``row``,
+        and ``instant`` along a Z-order curve.
+
+        Args:
+            time_unit (str or :class:`~geopyspark.geotrellis.constants.TimeUnit`): The unit
+                of time that ``instant`` is binned to before being indexed.
+            time_resolution (str or int, optional): How many ``time_unit``\s are in each bin.
+                Default is, ``None``, which is one ``time_unit`` per bin.
+
+        Returns:
+            int
+        """
+
+        time = _convert_to_unix_time(self.instant) // _time_resolution_millis(time_unit, time_resolution)
+
+        return _z3_index(self.col, self.row, time)
+
 
 class RasterizerOptions(namedtuple("RasterizerOption", 'includePartial sampleType')):
     """Represents options available to geometry rasterizer
@@ -589,6 +673,39 @@ class SpatialPartitionStrategy(namedtuple("SpatialPartitionStrategy", "num_parti
     def __new__(cls, num_partitions=None, bits=8):
         return super(cls, SpatialPartitionStrategy).__new__(cls, num_partitions, bits)
 
+    def partition_func(self):
+        """Creates a function that can be given to ``partitionBy`` or ``groupByKey`` of a
+        PySpark RDD keyed by :class:`~geopyspark.geotrellis.SpatialKey` or
+        :class:`~geopyspark.geotrellis.SpaceTimeKey`.
+
+        Keys are placed in the same partitions that GeoPySpark's ``SpatialPartitioner`` would
+        place them in, without needing to send the RDD to the JVM.
+
+        Example:
+            .. code:: python3
+
+                strategy = SpatialPartitionStrategy(num_partitions=16)
+                numpy_rdd.partitionBy(strategy.num_partitions, strategy.partition_func())
+
+        Returns:
+            A function that takes a key and returns an int.
+
+        Raises:
+            ValueError: If ``bits`` is ``None``, as it is for strategies whose ``num_partitions``
+                is ``None``.
+        """
+
+        if self.bits is None:
+            raise ValueError("A partition function can only be made when bits is set. Recieved",
+                             self, "instead.")
+
+        bits = self.bits
+
+        def spatial_partition_func(key):
+            return _z2_index(key.col, key.row) >> bits
+
+        return spatial_partition_func
+
 
 class SpaceTimePartitionStrategy(namedtuple("SpaceTimePartitionStrategy", "time_unit num_partitions bits time_resolution")):
     """Represents a partitioning strategy for a layer that uses GeoPySpark's ``SpaceTimePartitioner``
@@ -645,6 +762,34 @@ class SpaceTimePartitionStrategy(namedtuple("SpaceTimePartitionStrategy", "time_
     def __new__(cls, time_unit, num_partitions=None, bits=8, time_resolution=None):
         return super(cls, SpaceTimePartitionStrategy).__new__(cls, time_unit, num_partitions, bits, time_resolution)
 
+    def partition_func(self):
+        """Creates a function that can be given to ``partitionBy`` or ``groupByKey`` of a
+        PySpark RDD keyed by :class:`~geopyspark.geotrellis.SpaceTimeKey`.
+
+        Keys are placed in the same partitions that GeoPySpark's ``SpaceTimePartitioner`` would
+        place them in, without needing to send the RDD to the JVM.
+
+        Returns:
+            A function that takes a key and returns an int.
+
+        Raises:
+            ValueError: If ``bits`` is ``None``, as it is for strategies whose ``num_partitions``
+                is ``None``.
+        """
+
+        if self.bits is None:
+            raise ValueError("A partition function can only be made when bits is set. Recieved",
+                             self, "instead.")
+
+        bits = self.bits
+        resolution = _time_resolution_millis(self.time_unit, self.time_resolution)
+
+        def space_time_partition_func(key):
+            time = _convert_to_unix_time(key.instant) // resolution
+            return _z3_index(key.col, key.row, time) >> bits
+
+        return space_time_partition_func
+
 
 class SourceInfo(namedtuple("SourceInfo", "source source_to_target_band")):
     """Represents a data source and how its bands should be formatted when being read
@@ -866,6 +1011,7 @@ __all__ = ["Tile", "Extent", "ProjectedExtent", "TemporalProjectedExtent", "Spat
 from . import catalog
 from . import color
 from . import constants
+from . import framecompression
 from . import converters
 from . import geotiff
 from . import rasterio
@@ -879,6 +1025,7 @@ from . import key_conversion
 from .catalog import *
 from .color import *
 from .constants import *
+from .framecompression import *
 from .converters import *
 from .cost_distance import *
 from .euclidean_distance import *
@@ -896,6 +1043,7 @@ from .key_conversion import *
 __all__ += catalog.__all__
 __all__ += color.__all__
 __all__ += constants.__all__
+__all__ += framecompression.__all__
 __all__ += ['cost_distance']
 __all__ += ['euclidean_distance']
 __all__ += ['geotiff']
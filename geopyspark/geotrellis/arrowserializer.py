@@ -0,0 +1,279 @@
+"""The class which serializes/deserializes tiled layers to/from Python as Arrow record batches.
+
+The JVM reads and writes these batches with Arrow 0.8, so only ``pyarrow`` versions before 0.15
+can be used. ``pyarrow`` 0.15 starts each IPC message with a continuation marker, and ``pyarrow``
+1.0 and later write metadata version V5, neither of which the Arrow 0.8 reader understands. The
+supported range is installed with ``pip install geopyspark[arrow]``.
+"""
+import math
+import itertools
+import numpy as np
+
+from geopyspark.geopyspark_utils import ensure_pyspark
+ensure_pyspark()
+from geopyspark.geotrellis import SpatialKey, SpaceTimeKey, Tile, _convert_to_unix_time
+from geopyspark.geotrellis.protobufcodecs import _buffer_dtypes, _instant_from_millis
+from geopyspark.geotrellis.protobufserializer import DEFAULT_BATCH_BYTES
+
+from pyspark.serializers import FramedSerializer, write_int
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow must be installed in order to use the ARROW transport")
+
+    return pyarrow
+
+
+def _format_no_data(no_data_value):
+    # The JVM parses this value with java.lang.Double.parseDouble
+    if math.isnan(no_data_value):
+        return 'NaN'
+    elif math.isinf(no_data_value):
+        return 'Infinity' if no_data_value > 0 else '-Infinity'
+    else:
+        return repr(no_data_value)
+
+
+def _tile_layout(tile):
+    """Returns the schema metadata that describes the cells of the given ``Tile``."""
+
+    if tile.cell_type in _buffer_dtypes:
+        cell_type = tile.cell_type
+    else:
+        cell_type = "DOUBLE"
+
+    has_no_data = tile.no_data_value is not None and tile.no_data_value is not False
+
+    if tile.cells.ndim == 2:
+        bands, (rows, cols) = 1, tile.cells.shape
+    else:
+        bands, rows, cols = tile.cells.shape
+
+    return (('cellType', cell_type),
+            ('noData', _format_no_data(float(tile.no_data_value)) if has_no_data else '0.0'),
+            ('hasNoData', 'true' if has_no_data else 'false'),
+            ('bands', str(bands)),
+            ('rows', str(rows)),
+            ('cols', str(cols)))
+
+
+def _column(batch, name, dtype):
+    column = batch.column(batch.schema.names.index(name))
+    return np.frombuffer(column.buffers()[1], dtype=dtype, count=batch.num_rows)
+
+
+def arrow_batch_decoder(arrow_bytes, key_type):
+    """Decodes an Arrow IPC stream into a list of (key, ``Tile``) tuples.
+
+    Note:
+        The cells of each returned ``Tile`` are a read-only view into the decoded stream.
+        Copy them first if they need to be modified in place.
+
+    Args:
+        arrow_bytes (bytes): The encoded stream.
+        key_type (str): Either ``"SpatialKey"`` or ``"SpaceTimeKey"``.
+
+    Returns:
+        [(:class:`~geopyspark.geotrellis.SpatialKey` or :class:`~geopyspark.geotrellis.SpaceTimeKey`,
+        :class:`~geopyspark.geotrellis.Tile`)]
+    """
+
+    pa = _import_pyarrow()
+
+    reader = pa.RecordBatchStreamReader(pa.BufferReader(arrow_bytes))
+    metadata = {k.decode(): v.decode() for k, v in reader.schema.metadata.items()}
+
+    cell_type = metadata['cellType']
+    dtype = np.dtype(_buffer_dtypes[cell_type])
+    shape = (int(metadata['bands']), int(metadata['rows']), int(metadata['cols']))
+
+    if metadata['hasNoData'] == 'true':
+        no_data_value = float(metadata['noData'])
+    else:
+        no_data_value = None
+
+    results = []
+
+    for batch in reader:
+        n = batch.num_rows
+        cells_column = batch.column(batch.schema.names.index('cells'))
+        cells = np.frombuffer(cells_column.buffers()[1],
+                              dtype=dtype,
+                              count=n * shape[0] * shape[1] * shape[2]).reshape((n,) + shape)
+
+        cols = _column(batch, 'col', '<i4').tolist()
+        rows = _column(batch, 'row', '<i4').tolist()
+
+        if key_type == "SpatialKey":
+            keys = [SpatialKey(col, row) for col, row in zip(cols, rows)]
+        else:
+            instants = _column(batch, 'instant', '<i8').tolist()
+            keys = [SpaceTimeKey(col, row, _instant_from_millis(instant))
+                    for col, row, instant in zip(cols, rows, instants)]
+
+        results.extend((key, Tile(tile_cells, cell_type, no_data_value))
+                       for key, tile_cells in zip(keys, cells))
+
+    return results
+
+
+def arrow_batch_encoder(objs, key_type):
+    """Encodes a list of (key, ``Tile``) tuples into an Arrow IPC stream.
+
+    Note:
+        Every ``Tile`` in ``objs`` must have the same cell type, ``no_data_value``, and shape.
+
+    Args:
+        objs (list): The tuples to encode.
+        key_type (str): Either ``"SpatialKey"`` or ``"SpaceTimeKey"``.
+
+    Returns:
+        bytes
+    """
+
+    pa = _import_pyarrow()
+
+    layout = _tile_layout(objs[0][1])
+    metadata = dict(layout)
+    shape = (int(metadata['bands']), int(metadata['rows']), int(metadata['cols']))
+
+    cells = np.empty((len(objs),) + shape, dtype=_buffer_dtypes[metadata['cellType']])
+
+    for index, (_, tile) in enumerate(objs):
+        cells[index] = tile.cells.reshape(shape)
+
+    names = ['col', 'row']
+    arrays = [pa.array(np.array([key.col for key, _ in objs], dtype=np.int32)),
+              pa.array(np.array([key.row for key, _ in objs], dtype=np.int32))]
+
+    if key_type == "SpaceTimeKey":
+        names.append('instant')
+        arrays.append(pa.array(np.array([_convert_to_unix_time(key.instant) for key, _ in objs],
+                                        dtype=np.int64)))
+
+    names.append('cells')
+    arrays.append(pa.Array.from_buffers(pa.binary(cells[0].nbytes),
+                                        len(objs),
+                                        [None, pa.py_buffer(cells)]))
+
+    schema = pa.schema([pa.field(name, array.type) for name, array in zip(names, arrays)],
+                       metadata=metadata)
+    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    sink = pa.BufferOutputStream()
+    writer = pa.RecordBatchStreamWriter(sink, schema)
+    writer.write_batch(batch)
+    writer.close()
+
+    return sink.getvalue().to_pybytes()
+
+
+class ArrowSerializer(FramedSerializer):
+    """The serializer used to move the tiles of a ``TiledRasterLayer`` to/from Python as
+    Arrow record batches.
+
+    Each frame holds an Arrow IPC stream of many tiles. The cells of all of the tiles in a
+    stream are stored in one contiguous buffer, so decoding does not copy them.
+
+    Note:
+        ``pyarrow`` must be installed to use this serializer. The JVM side uses the Arrow 0.8
+        library that comes with Spark, so when using ``pyarrow>=0.15`` the environment variable
+        ``ARROW_PRE_0_15_IPC_FORMAT=1`` needs to be set on the driver and the executors.
+
+    Args:
+        key_type (str): Either ``"SpatialKey"`` or ``"SpaceTimeKey"``.
+        batch_bytes (int, optional): The target size of each frame in bytes when writing.
+            Default is, ``DEFAULT_BATCH_BYTES``.
+        compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+            If set, then every frame is compressed when written and decompressed when read.
+            Default is, ``None``.
+
+    Attributes:
+        key_type (str): Either ``"SpatialKey"`` or ``"SpaceTimeKey"``.
+        batch_bytes (int): The target size of each frame in bytes when writing.
+        compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`): How
+            the frames are compressed. ``None`` if they are not.
+    """
+
+    __slots__ = ['key_type', 'batch_bytes', 'compression']
+
+    def __init__(self, key_type, batch_bytes=DEFAULT_BATCH_BYTES, compression=None):
+        FramedSerializer.__init__(self)
+
+        self.key_type = key_type
+        self.batch_bytes = batch_bytes
+        self.compression = compression
+
+    def _compress(self, encoded):
+        if self.compression:
+            return self.compression.compress(encoded)
+
+        return encoded
+
+    def dumps(self, obj):
+        """Serialize a list of (key, ``Tile``) tuples into an Arrow IPC stream.
+
+        Args:
+            obj: The tuple, or list of tuples, to serialize.
+
+        Returns:
+            bytes
+        """
+
+        if isinstance(obj, list):
+            return self._compress(arrow_batch_encoder(obj, self.key_type))
+        else:
+            return self._compress(arrow_batch_encoder([obj], self.key_type))
+
+    def dump_stream(self, iterator, stream):
+        """Serializes a stream of (key, ``Tile``) tuples into frames.
+
+        A new frame is started whenever the cell type, ``no_data_value``, or shape of the
+        tiles changes. Otherwise, the number of tuples in each frame grows or shrinks with
+        the encoded size of the previous frame, in the same way as
+        ``pyspark.serializers.AutoBatchedSerializer``. The size used is the one before
+        compression.
+
+        Args:
+            iterator: The tuples to be serialized.
+            stream: The stream the frames are written to.
+        """
+
+        batch, best = 1, self.batch_bytes
+
+        for _, group in itertools.groupby(iterator, key=lambda obj: _tile_layout(obj[1])):
+            while True:
+                values = list(itertools.islice(group, batch))
+
+                if not values:
+                    break
+
+                encoded = arrow_batch_encoder(values, self.key_type)
+                size = len(encoded)
+                frame = self._compress(encoded)
+
+                write_int(len(frame), stream)
+                stream.write(frame)
+
+                if size < best:
+                    batch *= 2
+                elif size > best * 10 and batch > 1:
+                    batch //= 2
+
+    def loads(self, obj):
+        """Deserializes an Arrow IPC stream into a list of (key, ``Tile``) tuples.
+
+        Args:
+            obj (bytes): The encoded stream.
+
+        Returns:
+            A list of deserialized tuples.
+        """
+
+        if self.compression:
+            obj = self.compression.decompress(obj)
+
+        return arrow_batch_decoder(obj, self.key_type)
@@ -1,7 +1,15 @@
 """Methods for reading, querying, and saving tile layers to and from GeoTrellis Catalogs.
 """
 
+import copy
 import json
+import time
+import struct
+import uuid
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple, OrderedDict
 from shapely.geometry import Polygon, MultiPolygon, Point
 import shapely.wkb
 import pytz
@@ -10,14 +18,33 @@ from py4j.protocol import Py4JJavaError
 from geopyspark import get_spark_context, scala_companion
 from geopyspark.geotrellis.constants import LayerType, IndexingMethod, TimeUnit
 from geopyspark.geotrellis.protobufcodecs import multibandtile_decoder
-from geopyspark.geotrellis import Metadata, Extent, deprecated, Log
+from geopyspark.geotrellis import Metadata, Extent, SpatialKey, Bounds, deprecated, Log
 from geopyspark.geotrellis.layer import TiledRasterLayer
 
 
-__all__ = ["read_layer_metadata", "read_value", "query", "write", "update_layer", "AttributeStore"]
+__all__ = ["read_layer_metadata", "read_value", "query", "explain_query", "QueryExplanation", "write", "write_async", "update_layer",
+           "AttributeStore", "TileCache", "TileCacheStats", "WriteHandle", "LevelProgress"]
 
-"""Instances of previously used AttributeStore keyed by their URI """
-_cached_stores = {}
+"""The col, row and length that precede each tile read by ValueReader.read_many"""
+_TILE_HEADER = struct.Struct('<iii')
+
+"""The number of bytes a cached, missing tile is counted as"""
+_MISSING_TILE_BYTES = 64
+
+"""The TileCaches that are invalidated when a layer is written to"""
+_tile_caches = weakref.WeakSet()
+
+"""Every AttributeStore, so that the values they memoize can be dropped when a catalog is written to"""
+_attribute_stores = weakref.WeakSet()
+
+"""Instances of previously used AttributeStore keyed by their URI, least recently used first"""
+_cached_stores = OrderedDict()
+
+"""The number of AttributeStores that are kept in _cached_stores"""
+_MAX_CACHED_STORES = 16
+
+"""The number of attribute values each AttributeStore memoizes"""
+_MAX_MEMOIZED_VALUES = 1024
 
 
 def read_layer_metadata(uri,
@@ -71,18 +98,230 @@ def read_value(uri,
     return reader.read(col, row, zdt)
 
 
+def _format_zdt(zdt):
+    if not zdt:
+        return zdt
+    elif zdt.tzinfo:
+        return zdt.astimezone(pytz.utc).isoformat()
+    else:
+        return zdt.replace(tzinfo=pytz.utc).isoformat()
+
+
+class TileCacheStats(namedtuple("TileCacheStats", 'hits misses evictions size_bytes')):
+    """The statistics of a :class:`~geopyspark.geotrellis.catalog.TileCache`.
+
+    Attributes:
+        hits (int): The number of reads that were served from the cache.
+        misses (int): The number of reads that had to go to the catalog.
+        evictions (int): The number of tiles that were removed to stay within the cache's size,
+            or because they expired.
+        size_bytes (int): The number of bytes of the tiles that are currently cached.
+    """
+
+    __slots__ = []
+
+    @property
+    def hit_rate(self):
+        """float: The fraction of reads that were served from the cache. ``None`` if nothing
+        has been read yet.
+        """
+
+        total = self.hits + self.misses
+
+        if not total:
+            return None
+
+        return self.hits / total
+
+
+class TileCache(object):
+    """An in-memory, least recently used cache of the tiles read by
+    :class:`~geopyspark.geotrellis.catalog.ValueReader`\s.
+
+    Tiles are keyed by the catalog URI, layer name, zoom, col, row, and time of the tile, so one
+    cache can be shared by many readers. Tiles that do not exist are cached as well. The cells of
+    cached tiles are made read-only, as every read of a tile returns the same ``Tile``; copy
+    them before changing them. Cached tiles of a layer are dropped when :meth:`~geopyspark.geotrellis.catalog.write` or
+    :meth:`~geopyspark.geotrellis.catalog.update_layer` write to it.
+
+    Args:
+        max_bytes (int, optional): The number of bytes of cells the cache holds before it
+            evicts the least recently used tiles. Default is, 256 MiB.
+        ttl (float, optional): The number of seconds a tile stays in the cache. If ``None``,
+            then tiles are only evicted to make space. Default is, ``None``.
+
+    Attributes:
+        max_bytes (int): The number of bytes of cells the cache holds.
+        ttl (float): The number of seconds a tile stays in the cache.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, ttl=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        _tile_caches.add(self)
+
+    def _remove(self, key):
+        (_, size, _) = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def get(self, key):
+        """Returns whether ``key`` is cached, and its tile.
+
+        Args:
+            key (tuple): The ``(uri, layer_name, zoom, col, row, instant)`` of the tile.
+
+        Returns:
+            (bool, :class:`~geopyspark.geotrellis.Tile`)
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+
+            if entry:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return (True, entry[0])
+
+            self._misses += 1
+            return (False, None)
+
+    def put(self, key, tile):
+        """Caches a tile, or the fact that it does not exist if ``tile`` is ``None``. The cells
+        of ``tile`` are made read-only.
+
+        Args:
+            key (tuple): The ``(uri, layer_name, zoom, col, row, instant)`` of the tile.
+            tile (:class:`~geopyspark.geotrellis.Tile`): The tile.
+        """
+
+        if tile is not None:
+            tile.cells.flags.writeable = False
+            size = tile.cells.nbytes
+        else:
+            size = _MISSING_TILE_BYTES
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (tile, size, time.monotonic())
+            self._size_bytes += size
+
+            while self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, uri, layer_name, zoom=None):
+        """Removes the cached tiles of a layer.
+
+        Args:
+            uri (str): The URI of the catalog.
+            layer_name (str): The name of the layer.
+            zoom (int, optional): The zoom of the layer. If ``None``, then the tiles of every zoom
+                are removed.
+        """
+
+        with self._lock:
+            stale = [key for key in self._entries
+                     if key[:2] == (uri, layer_name) and (zoom is None or key[2] == zoom)]
+
+            for key in stale:
+                self._remove(key)
+
+    def clear(self):
+        """Removes every cached tile."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self):
+        """Returns the statistics of the cache.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.catalog.TileCacheStats`
+        """
+
+        with self._lock:
+            return TileCacheStats(self._hits, self._misses, self._evictions, self._size_bytes)
+
+    def __repr__(self):
+        return "TileCache(max_bytes={}, ttl={}, stats={})".format(self.max_bytes, self.ttl, self.stats())
+
+
+def _invalidate_layer(uri, layer_name, zoom, store=None):
+    """Drops the cached tiles and attributes of a layer that has been written to."""
+
+    for cache in list(_tile_caches):
+        cache.invalidate(uri, layer_name, zoom)
+
+    # COG layers keep the metadata of every zoom in the attributes of zoom 0
+    _invalidate_attributes(uri, layer_name, store=store)
+
+
+def _invalidate_attributes(uri, layer_name, zoom=None, attribute_name=None, store=None):
+    """Drops the values memoized by every AttributeStore of ``uri``, and by ``store``."""
+
+    for attribute_store in list(_attribute_stores):
+        if attribute_store is store or attribute_store.uri == uri:
+            attribute_store.invalidate(layer_name, zoom, attribute_name)
+
+
 class ValueReader(object):
     """GeoTrellis catalog indivual value reader.
     Suitable for use in TMS service because it does not have Spark overhead.
+
+    Args:
+        uri (str): The Uniform Resource Identifier used to point towards the desired GeoTrellis
+            catalog to be read from. The shape of this string varies depending on backend.
+        layer_name (str): The name of the GeoTrellis catalog to be read from.
+        zoom (int, optional): The zoom level of the layer that is read by default.
+        cache (:class:`~geopyspark.geotrellis.catalog.TileCache`, optional): If set, tiles are
+            read from, and kept in, this cache. Default is, ``None``.
+        max_workers (int, optional): The most tiles that
+            :meth:`~geopyspark.geotrellis.catalog.ValueReader.read_many` reads at a time. The
+            reads run on a bounded pool of threads in the JVM that every reader shares.
+            Default is, 16.
     """
 
-    def __init__(self, uri, layer_name, zoom=None):
+    def __init__(self, uri, layer_name, zoom=None, cache=None, max_workers=16):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1. Recieved", max_workers, "instead.")
 
+        self.uri = uri
         self.layer_name = layer_name
         self.zoom = zoom
+        self.cache = cache
         pysc = get_spark_context()
         ValueReaderWrapper = pysc._gateway.jvm.geopyspark.geotrellis.io.ValueReaderWrapper
-        self.wrapper = ValueReaderWrapper(uri)
+        self.wrapper = ValueReaderWrapper(uri, max_workers)
+
+    @property
+    def cache_stats(self):
+        """:class:`~geopyspark.geotrellis.catalog.TileCacheStats`: The statistics of the reader's
+        cache, or ``None`` if it does not have one.
+        """
+
+        return self.cache and self.cache.stats()
+
+    def _cache_key(self, zoom, col, row, zdt):
+        return (self.uri, self.layer_name, zoom, col, row, zdt)
 
     def read(self, col, row, zdt=None, zoom=None):
         """Reads a single ``Tile`` from a GeoTrellis catalog.
@@ -104,14 +343,81 @@ class ValueReader(object):
         zoom = zoom or self.zoom or 0
         zoom = zoom and int(zoom)
 
-        if zdt:
-            if zdt.tzinfo:
-                zdt = zdt.astimezone(pytz.utc).isoformat()
-            else:
-                zdt = zdt.replace(tzinfo=pytz.utc).isoformat()
+        zdt = _format_zdt(zdt)
+
+        if self.cache:
+            (cached, tile) = self.cache.get(self._cache_key(zoom, col, row, zdt))
+
+            if cached:
+                return tile
 
         value = self.wrapper.readTile(self.layer_name, zoom, col, row, zdt)
-        return value and multibandtile_decoder(value)
+        tile = value and multibandtile_decoder(value)
+
+        if self.cache:
+            self.cache.put(self._cache_key(zoom, col, row, zdt), tile)
+
+        return tile
+
+    def read_many(self, keys, zoom=None, zdt=None):
+        """Reads many ``Tile``\s from a GeoTrellis catalog with a single call to the JVM, which
+        reads them concurrently.
+
+        Args:
+            keys ([:class:`~geopyspark.geotrellis.SpatialKey`] or [(int, int)]): The keys of the
+                tiles to read, given as ``SpatialKey``\s or as ``(col, row)`` tuples.
+            zoom (int, optional): The zoom level of the layer that is to be read.
+                Defaults to ``self.zoom``
+            zdt (``datetime.datetime``): The time stamp of the tiles if the data is
+                spatial-temporal. This is represented as a ``datetime.datetime.`` instance. The
+                default value is, ``None``. If ``None``, then only the spatial area will be queried.
+
+        Returns:
+            dict: A ``dict`` of :class:`~geopyspark.geotrellis.Tile`\s keyed by their
+            :class:`~geopyspark.geotrellis.SpatialKey`. Keys whose tiles do not exist are left out.
+        """
+
+        zoom = zoom or self.zoom or 0
+        zoom = zoom and int(zoom)
+
+        zdt = _format_zdt(zdt)
+        keys = [SpatialKey(*key[:2]) for key in keys]
+        tiles = {}
+
+        if self.cache:
+            missing = []
+
+            for key in keys:
+                (cached, tile) = self.cache.get(self._cache_key(zoom, key.col, key.row, zdt))
+
+                if not cached:
+                    missing.append(key)
+                elif tile is not None:
+                    tiles[key] = tile
+
+            keys = missing
+
+        if not keys:
+            return tiles
+
+        coords = [coord for key in keys for coord in key]
+        value = self.wrapper.readTiles(self.layer_name, zoom,
+                                       struct.pack('<{}i'.format(len(coords)), *coords),
+                                       zdt)
+
+        offset = 0
+
+        while offset < len(value):
+            (col, row, length) = _TILE_HEADER.unpack_from(value, offset)
+            offset += _TILE_HEADER.size
+            tiles[SpatialKey(col, row)] = multibandtile_decoder(value[offset:offset + length])
+            offset += length
+
+        if self.cache:
+            for key in keys:
+                self.cache.put(self._cache_key(zoom, key.col, key.row, zdt), tiles.get(key))
+
+        return tiles
 
 
 def query(uri,
@@ -120,7 +426,8 @@ def query(uri,
           query_geom=None,
           time_intervals=None,
           query_proj=None,
-          num_partitions=None):
+          num_partitions=None,
+          partition_bytes=None):
     """Queries a single, zoom layer from a GeoTrellis catalog given spatial and/or time parameters.
 
     Note:
@@ -164,6 +471,10 @@ def query(uri,
             then the returned ``TiledRasterLayer`` could contain incorrect values. If ``None``,
             then the geometry and layer are assumed to be in the same projection.
         num_partitions (int, optional): Sets RDD partition count when reading from catalog.
+            If ``None``, then it is picked from the number of tiles the query is estimated to
+            read, as returned by :meth:`~geopyspark.geotrellis.catalog.explain_query`.
+        partition_bytes (int, optional): The number of bytes of tiles each partition should
+            hold when ``num_partitions`` is picked automatically. If ``None``, then 16 MiB is used.
 
     Returns:
         :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
@@ -171,7 +482,20 @@ def query(uri,
 
     pysc = get_spark_context()
     layer_zoom = layer_zoom or 0
+    (query_geom, time_intervals, query_proj) = _query_args(query_geom, time_intervals, query_proj)
+
+    reader = pysc._gateway.jvm.geopyspark.geotrellis.io.LayerReaderWrapper(pysc._jsc.sc())
+    srdd = reader.query(uri,
+                        layer_name, layer_zoom,
+                        query_geom, time_intervals, query_proj,
+                        num_partitions, partition_bytes)
+
+    layer_type = LayerType._from_key_name(srdd.keyClassName())
+
+    return TiledRasterLayer(layer_type, srdd)
+
 
+def _query_args(query_geom, time_intervals, query_proj):
     if query_geom is None:
         pass  # pass as Null to Java
     elif isinstance(query_geom, Extent):
@@ -187,24 +511,78 @@ def query(uri,
     if isinstance(query_proj, int):
         query_proj = str(query_proj)
 
-    if time_intervals:
-        for x, time in enumerate(time_intervals):
-            if time.tzinfo:
-                time_intervals[x] = time.astimezone(pytz.utc).isoformat()
-            else:
-                time_intervals[x] = time.replace(tzinfo=pytz.utc).isoformat()
-    else:
-        time_intervals = []
+    time_intervals = [_format_zdt(time) for time in time_intervals or []]
+
+    return (query_geom, time_intervals, query_proj)
+
+
+class QueryExplanation(namedtuple("QueryExplanation", 'key_bounds tile_count tile_bytes estimated_bytes num_partitions')):
+    """The tiles that a query of a layer would read, as estimated from the layer's metadata.
+
+    Attributes:
+        key_bounds ([:class:`~geopyspark.geotrellis.Bounds`]): The ranges of ``SpatialKey``\s
+            the query reads.
+        tile_count (int): The number of tiles within ``key_bounds``. Tiles that are missing from
+            the layer, and the time dimension of spatial-temporal layers, are not taken into account.
+        tile_bytes (int): The number of bytes of cells in each band of a tile.
+        estimated_bytes (int): ``tile_count`` times ``tile_bytes``.
+        num_partitions (int): The number of partitions that
+            :meth:`~geopyspark.geotrellis.catalog.query` would read the tiles into.
+    """
+
+    __slots__ = []
+
+
+def explain_query(uri,
+                  layer_name,
+                  layer_zoom=None,
+                  query_geom=None,
+                  time_intervals=None,
+                  query_proj=None,
+                  partition_bytes=None):
+    """Estimates which, and how many, tiles a query would read without reading them.
+
+    The estimate is made from the layer's metadata. Nothing but the metadata is read from the
+    catalog.
+
+    Args:
+        uri (str): The Uniform Resource Identifier used to point towards the desired GeoTrellis
+            catalog to be read from. The shape of this string varies depending on backend.
+        layer_name (str): The name of the GeoTrellis catalog to be querried.
+        layer_zoom (int, optional): The zoom level of the layer that is to be querried.
+            If ``None``, then the ``layer_zoom`` will be set to 0.
+        query_geom (bytes or shapely.geometry or :class:`~geopyspark.geotrellis.Extent`, Optional):
+            The spatial area of the query. See :meth:`~geopyspark.geotrellis.catalog.query`.
+        time_intervals (``[datetime.datetime]``, optional): A list of the time intervals of the
+            query. See :meth:`~geopyspark.geotrellis.catalog.query`.
+        query_proj (int or str, optional): The crs of the querried geometry. See
+            :meth:`~geopyspark.geotrellis.catalog.query`.
+        partition_bytes (int, optional): The number of bytes of tiles each partition should
+            hold. If ``None``, then 16 MiB is used.
+
+    Returns:
+        :class:`~geopyspark.geotrellis.catalog.QueryExplanation`
+    """
+
+    pysc = get_spark_context()
+    layer_zoom = layer_zoom or 0
+    (query_geom, time_intervals, query_proj) = _query_args(query_geom, time_intervals, query_proj)
 
     reader = pysc._gateway.jvm.geopyspark.geotrellis.io.LayerReaderWrapper(pysc._jsc.sc())
-    srdd = reader.query(uri,
-                        layer_name, layer_zoom,
-                        query_geom, time_intervals, query_proj,
-                        num_partitions)
+    explanation = json.loads(reader.explainQuery(uri,
+                                                 layer_name, layer_zoom,
+                                                 query_geom, time_intervals, query_proj,
+                                                 partition_bytes))
 
-    layer_type = LayerType._from_key_name(srdd.keyClassName())
+    key_bounds = [Bounds(SpatialKey(bounds['colMin'], bounds['rowMin']),
+                         SpatialKey(bounds['colMax'], bounds['rowMax']))
+                  for bounds in explanation['keyBounds']]
 
-    return TiledRasterLayer(layer_type, srdd)
+    return QueryExplanation(key_bounds,
+                            explanation['tileCount'],
+                            explanation['tileBytes'],
+                            explanation['estimatedBytes'],
+                            explanation['numPartitions'])
 
 
 def write(uri,
@@ -255,17 +633,27 @@ def write(uri,
     if tiled_raster_layer.zoom_level is None:
         Log.warn(tiled_raster_layer.pysc, "The given layer doesn't not have a zoom_level. Writing to zoom 0.")
 
+    (store, writer) = _layer_writer(uri, tiled_raster_layer.pysc, store, use_cogs)
+    _write_layer(writer, store, uri, layer_name, tiled_raster_layer,
+                 index_strategy, time_unit, time_resolution)
+
+
+def _layer_writer(uri, pysc, store, use_cogs):
     if store:
         store = AttributeStore.build(store)
     else:
         store = AttributeStore.cached(uri)
 
-    pysc = tiled_raster_layer.pysc
-    time_unit = time_unit or ""
-
     writer = pysc._gateway.jvm.geopyspark.geotrellis.io.LayerWriterWrapper(
         store.wrapper.attributeStore(), uri, use_cogs)
 
+    return (store, writer)
+
+
+def _write_layer(writer, store, uri, layer_name, tiled_raster_layer,
+                 index_strategy, time_unit, time_resolution):
+    time_unit = time_unit or ""
+
     if tiled_raster_layer.layer_type == LayerType.SPATIAL:
         writer.writeSpatial(layer_name,
                             tiled_raster_layer.srdd,
@@ -283,6 +671,201 @@ def write(uri,
     else:
         raise ValueError("Cannot write {} layer".format(tiled_raster_layer.layer_type))
 
+    _invalidate_layer(uri, layer_name, tiled_raster_layer.zoom_level or 0, store)
+
+
+class LevelProgress(namedtuple("LevelProgress", 'zoom state completed_tasks total_tasks bytes_written')):
+    """The progress of writing one layer of a :class:`~geopyspark.geotrellis.catalog.WriteHandle`.
+
+    Attributes:
+        zoom (int): The zoom of the layer.
+        state (str): One of ``"pending"``, ``"running"``, ``"done"``, or ``"failed"``.
+        completed_tasks (int): The number of tasks of the layer's Spark jobs that have finished.
+        total_tasks (int): The number of tasks of the layer's Spark jobs that have started so far.
+        bytes_written (int): The number of bytes of cells in the tiles that have been written.
+            Tasks that were retried are counted more than once.
+    """
+
+    __slots__ = []
+
+
+class _LevelWrite(object):
+    def __init__(self, zoom, writer, job_group):
+        self.zoom = zoom
+        self.writer = writer
+        self.job_group = job_group
+        self.future = None
+        self.started = False
+
+
+class WriteHandle(object):
+    """A handle to layers that are being written in the background by
+    :meth:`~geopyspark.geotrellis.catalog.write_async` or
+    :meth:`~geopyspark.geotrellis.layer.Pyramid.write_async`.
+
+    Each layer is written by its own Spark jobs, which run concurrently with those of the
+    other layers and with any other jobs the driver submits.
+    """
+
+    def __init__(self, pysc, levels):
+        self._pysc = pysc
+        self._levels = levels
+
+    def done(self):
+        """Returns whether every layer has finished being written, or has failed.
+
+        Returns:
+            bool
+        """
+
+        return all(level.future.done() for level in self._levels)
+
+    def result(self, timeout=None):
+        """Waits for every layer to be written.
+
+        Args:
+            timeout (float, optional): The number of seconds to wait for each layer. If ``None``,
+                then there is no limit. Default is, ``None``.
+
+        Raises:
+            Exception: The error of the first layer that failed to be written.
+        """
+
+        for level in self._levels:
+            level.future.result(timeout)
+
+    def cancel(self):
+        """Cancels the layers that have not finished being written. The layers that were
+        being written may be left partially written.
+        """
+
+        for level in self._levels:
+            if not level.future.cancel():
+                self._pysc.cancelJobGroup(level.job_group)
+
+    def progress(self):
+        """Returns the progress of each layer.
+
+        Returns:
+            [:class:`~geopyspark.geotrellis.catalog.LevelProgress`]
+        """
+
+        tracker = self._pysc.statusTracker()
+        progress = []
+
+        for level in self._levels:
+            if not level.started:
+                state = "pending"
+            elif not level.future.done():
+                state = "running"
+            elif level.future.cancelled() or level.future.exception():
+                state = "failed"
+            else:
+                state = "done"
+
+            completed_tasks = 0
+            total_tasks = 0
+
+            for job_id in tracker.getJobIdsForGroup(level.job_group):
+                job = tracker.getJobInfo(job_id)
+
+                for stage_id in (job.stageIds if job else []):
+                    stage = tracker.getStageInfo(stage_id)
+
+                    if stage:
+                        completed_tasks += stage.numCompletedTasks
+                        total_tasks += stage.numTasks
+
+            bytes_written = level.writer.bytesWritten() if level.started else 0
+            progress.append(LevelProgress(level.zoom, state, completed_tasks, total_tasks, bytes_written))
+
+        return progress
+
+    @property
+    def bytes_written(self):
+        """int: The number of bytes of cells that have been written across every layer."""
+
+        return sum(level.bytes_written for level in self.progress())
+
+    def __repr__(self):
+        return "WriteHandle({})".format(self.progress())
+
+
+def _write_async(uri, layer_name, tiled_raster_layers, index_strategy, time_unit, time_resolution,
+                 store, use_cogs, scheduler_pool, max_concurrent):
+    pysc = get_spark_context()
+    executor = ThreadPoolExecutor(max_workers=max_concurrent or len(tiled_raster_layers) or 1)
+    levels = []
+
+    for tiled_raster_layer in tiled_raster_layers:
+        zoom = tiled_raster_layer.zoom_level or 0
+        (layer_store, writer) = _layer_writer(uri, pysc, store, use_cogs)
+
+        # The job group lets the progress of each layer be looked up in the status tracker
+        job_group = "geopyspark-write-{}-{}-{}".format(layer_name, zoom, uuid.uuid4().hex)
+        writer.setJobProperties(job_group, scheduler_pool)
+
+        level = _LevelWrite(zoom, writer, job_group)
+
+        def run(level=level, tiled_raster_layer=tiled_raster_layer, layer_store=layer_store):
+            level.started = True
+            _write_layer(level.writer, layer_store, uri, layer_name, tiled_raster_layer,
+                         index_strategy, time_unit, time_resolution)
+
+        level.future = executor.submit(run)
+        levels.append(level)
+
+    executor.shutdown(wait=False)
+
+    return WriteHandle(pysc, levels)
+
+
+def write_async(uri,
+                layer_name,
+                tiled_raster_layer,
+                index_strategy=IndexingMethod.ZORDER,
+                time_unit=None,
+                time_resolution=None,
+                store=None,
+                use_cogs=False,
+                scheduler_pool=None):
+    """Writes a tile layer to a specified destination in the background.
+
+    This is the same as :meth:`~geopyspark.geotrellis.catalog.write`, except that it returns
+    right away, and the driver can submit other work while the layer is written.
+
+    Note:
+        Jobs are only given a fair share of the cluster when the ``SparkContext`` was created
+        with ``spark.scheduler.mode`` set to ``FAIR``. Otherwise they are run first in, first out.
+
+    Args:
+        uri (str): The Uniform Resource Identifier used to point towards the desired location for
+            the tile layer to written to. The shape of this string varies depending on backend.
+        layer_name (str): The name of the new, tile layer.
+        tiled_raster_layer (:class:`~geopyspark.geotrellis.layer.TiledRasterLayer`): The
+            ``TiledRasterLayer`` to be saved.
+        index_strategy (str or :class:`~geopyspark.geotrellis.constants.IndexingMethod`, optional):
+            See :meth:`~geopyspark.geotrellis.catalog.write`.
+        time_unit (str or :class:`~geopyspark.geotrellis.constants.TimeUnit`, optional):
+            See :meth:`~geopyspark.geotrellis.catalog.write`.
+        time_resolution (str or int, optional): See :meth:`~geopyspark.geotrellis.catalog.write`.
+        store (str or :class:`~geopyspark.geotrellis.catalog.AttributeStore`, optional):
+            ``AttributeStore`` instance or URI for layer metadata lookup.
+        use_cogs (bool, optional): Should the layer be written as a GeoTrellis Avro or COG layer.
+            By default, an Avro layer will be written.
+        scheduler_pool (str, optional): The name of the fair scheduler pool the jobs are run in.
+            If ``None``, then the default pool is used. Default is, ``None``.
+
+    Returns:
+        :class:`~geopyspark.geotrellis.catalog.WriteHandle`
+    """
+
+    if tiled_raster_layer.zoom_level is None:
+        Log.warn(tiled_raster_layer.pysc, "The given layer doesn't not have a zoom_level. Writing to zoom 0.")
+
+    return _write_async(uri, layer_name, [tiled_raster_layer], index_strategy, time_unit,
+                        time_resolution, store, use_cogs, scheduler_pool, 1)
+
 
 def update_layer(uri,
                  layer_name,
@@ -328,6 +911,8 @@ def update_layer(uri,
     else:
         raise ValueError("Cannot use {} layer for overwrite".format(tiled_raster_layer.layer_type))
 
+    _invalidate_layer(uri, layer_name, tiled_raster_layer.zoom_level or 0, store)
+
 
 class AttributeStore(object):
     """AttributeStore provides a way to read and write GeoTrellis layer attributes.
@@ -348,6 +933,61 @@ class AttributeStore(object):
         except Py4JJavaError as err:
             raise ValueError(err.java_exception.getMessage())
 
+        self._lock = threading.Lock()
+        self._values = OrderedDict()
+
+        _attribute_stores.add(self)
+
+    def _memoized(self, layer_name, zoom, attribute_name, read):
+        """Returns the memoized, parsed value of an attribute, calling ``read`` to get it if it
+        has not been read yet. ``None`` is the ``attribute_name`` of the layer's metadata. Attributes
+        that do not exist are not memoized, as they may be written later.
+        """
+
+        key = (layer_name, zoom, attribute_name)
+
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+
+        value = read()
+
+        if value is None:
+            return value
+
+        with self._lock:
+            self._values[key] = value
+
+            while len(self._values) > _MAX_MEMOIZED_VALUES:
+                self._values.popitem(last=False)
+
+        return value
+
+    def invalidate(self, name=None, zoom=None, attribute_name=None):
+        """Drops memoized attribute values, so that they are read from the catalog again.
+
+        Attributes and layer metadata are memoized after they are first read. Values written or
+        deleted through any ``AttributeStore`` of the same URI, or by writing a layer to that URI,
+        are dropped automatically. This only needs to be called when the catalog is changed by
+        something else.
+
+        Args:
+            name (str, optional): Layer name. If ``None``, then the values of every layer are dropped.
+            zoom (int, optional): Layer zoom. If ``None``, then the values of every zoom are dropped.
+            attribute_name (str, optional): Attribute name. If ``None``, then every attribute,
+                including the layer metadata, is dropped.
+        """
+
+        with self._lock:
+            stale = [key for key in self._values
+                     if (name is None or key[0] == name) and
+                     (zoom is None or key[1] == zoom) and
+                     (attribute_name is None or key[2] == attribute_name)]
+
+            for key in stale:
+                del self._values[key]
+
     @classmethod
     def build(cls, store):
         """Builds AttributeStore from URI or passes an instance through.
@@ -370,10 +1010,15 @@ class AttributeStore(object):
     def cached(cls, uri):
         """Returns cached version of AttributeStore for URI or creates one"""
         if uri in _cached_stores:
+            _cached_stores.move_to_end(uri)
             return _cached_stores[uri]
         else:
             store = cls(uri)
             _cached_stores[uri] = store
+
+            while len(_cached_stores) > _MAX_CACHED_STORES:
+                _cached_stores.popitem(last=False)
+
             return store
 
     class Attributes(object):
@@ -405,18 +1050,28 @@ class AttributeStore(object):
                 ``dict``: Attribute value
             """
             zoom = self.layer_zoom or 0
-            value_json = self.store.wrapper.read(self.layer_name, zoom, name)
-            if value_json:
-                return json.loads(value_json)
+
+            def read():
+                value_json = self.store.wrapper.read(self.layer_name, zoom, name)
+                return json.loads(value_json) if value_json else None
+
+            value = self.store._memoized(self.layer_name, zoom, name, read)
+            if value is not None:
+                # The memoized value is shared, so callers are given their own copy
+                return copy.deepcopy(value)
             else:
                 raise KeyError(self.store.uri, self.layer_name, self.layer_zoom, name)
 
         def layer_metadata(self):
             zoom = self.layer_zoom or 0
-            value_json = self.store.wrapper.readMetadata(self.layer_name, zoom)
-            if value_json:
-                metadata_dict = json.loads(value_json)
-                return Metadata.from_dict(metadata_dict)
+
+            def read():
+                value_json = self.store.wrapper.readMetadata(self.layer_name, zoom)
+                return Metadata.from_dict(json.loads(value_json)) if value_json else None
+
+            metadata = self.store._memoized(self.layer_name, zoom, None, read)
+            if metadata is not None:
+                return metadata
             else:
                 raise KeyError(self.store.uri, self.layer_name, self.layer_zoom, "layer metadata")
 
@@ -430,6 +1085,7 @@ class AttributeStore(object):
             zoom = self.layer_zoom or 0
             value_json = json.dumps(value)
             self.store.wrapper.write(self.layer_name, zoom, name, value_json)
+            _invalidate_attributes(self.store.uri, self.layer_name, zoom, name, store=self.store)
 
         def delete(self, name):
             """Delete attribute by name
@@ -439,6 +1095,7 @@ class AttributeStore(object):
             """
             zoom = self.layer_zoom or 0
             self.store.wrapper.delete(self.layer_name, zoom, name)
+            _invalidate_attributes(self.store.uri, self.layer_name, zoom, name, store=self.store)
 
     def layer(self, name, zoom=None):
         """Layer Attributes object for given layer
@@ -470,6 +1127,7 @@ class AttributeStore(object):
         """
         zoom = zoom or 0
         self.wrapper.delete(name, zoom)
+        _invalidate_attributes(self.uri, name, store=self)
 
     def contains(self, name, zoom=None):
         """Checks if this store contains a layer metadata.
@@ -1,6 +1,7 @@
 """This module contains functions needed to create color maps used in coloring tiles,
 PNGs, and GeoTiffs.
 """
+import zlib
 import struct
 import numpy as np
 from geopyspark import get_spark_context
@@ -11,7 +12,7 @@ ensure_pyspark()
 from geopyspark.geotrellis.constants import ClassificationStrategy
 
 
-__all__ = ["get_colors_from_colors", "get_colors_from_matplotlib", "ColorMap"]
+__all__ = ["get_colors_from_colors", "get_colors_from_matplotlib", "ColorMap", "NumpyColorMap"]
 
 
 def get_colors_from_colors(colors):
@@ -75,6 +76,18 @@ nlcd_color_map = {
     92 : 0xB6D8F5FF}    # Emergent Herbaceous Wetlands
 
 
+def _get_color_list(colors):
+    if isinstance(colors, str):
+        return get_colors_from_matplotlib(colors)
+    elif isinstance(colors, list):
+        if all(isinstance(c, int) for c in colors):
+            return colors
+        else:
+            return get_colors_from_colors(colors)
+    else:
+        raise ValueError("Could not construct ColorMap from the given colors", colors)
+
+
 class ColorMap(object):
     """A class that wraps a GeoTrellis ColorMap class.
 
@@ -122,15 +135,7 @@ class ColorMap(object):
         if isinstance(breaks, dict):
             return ColorMap.from_break_map(breaks, no_data_color, fallback, classification_strategy)
 
-        if isinstance(colors, str):
-            color_list = get_colors_from_matplotlib(colors)
-        elif isinstance(colors, list):
-            if all(isinstance(c, int) for c in colors):
-                color_list = colors
-            else:
-                color_list = get_colors_from_colors(colors)
-        else:
-            raise ValueError("Could not construct ColorMap from the given colors", colors)
+        color_list = _get_color_list(colors)
 
         if isinstance(breaks, np.ndarray):
             breaks = list(breaks)
@@ -254,3 +259,226 @@ class ColorMap(object):
         """
 
         return ColorMap.from_break_map(nlcd_color_map)
+
+
+def _color_stops(colors, num_stops):
+    """Returns ``num_stops`` RGBA colors taken from, or interpolated between, ``colors`` in the
+    same way as a GeoTrellis ``ColorRamp``.
+    """
+
+    rgba = np.array(colors, dtype='>u4').view(np.uint8).reshape(-1, 4)
+
+    if len(rgba) == num_stops:
+        return rgba
+    elif num_stops < len(rgba):
+        return rgba[np.round(np.linspace(0, len(rgba) - 1, num_stops)).astype(int)]
+    else:
+        positions = np.linspace(0, len(rgba) - 1, num_stops)
+        channels = [np.interp(positions, np.arange(len(rgba)), rgba[:, x]) for x in range(4)]
+        return np.round(np.stack(channels, axis=1)).astype(np.uint8)
+
+
+def _encode_png(rgba, compress_level):
+    """Encodes an array of shape ``(rows, cols, 4)`` of ``uint8`` RGBA values as a PNG."""
+
+    (rows, cols, _) = rgba.shape
+
+    # Every scanline starts with the filter type, which is 0 (None)
+    scanlines = np.zeros((rows, cols * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = rgba.reshape(rows, cols * 4)
+
+    def chunk(chunk_type, data):
+        return (struct.pack(">I", len(data)) + chunk_type + data +
+                struct.pack(">I", zlib.crc32(chunk_type + data) & 0xffffffff))
+
+    return b"".join([b"\x89PNG\r\n\x1a\n",
+                     chunk(b"IHDR", struct.pack(">IIBBBBB", cols, rows, 8, 6, 0, 0, 0)),
+                     chunk(b"IDAT", zlib.compress(scanlines.tobytes(), compress_level)),
+                     chunk(b"IEND", b"")])
+
+
+class NumpyColorMap(object):
+    """A color map that is applied to tiles in Python with NumPy.
+
+    Unlike :class:`~geopyspark.geotrellis.color.ColorMap`, which wraps a GeoTrellis ``ColorMap``
+    on the JVM, this does not need a ``SparkContext``. Every cell of a tile is classified at once
+    with ``np.searchsorted``, and the colors are gathered from a lookup table. Instances can be
+    called on a ``Tile``, or on a list of ``Tile``\s, to get a PNG, so they can be given to
+    :meth:`~geopyspark.geotrellis.tms.TMS.build` as the ``display`` of multiband or
+    composited sources.
+
+    Args:
+        breaks ([int] or [float]): The tile values that specify breaks in the color mapping.
+        colors ([int]): The colors of the breaks, represented as integers e.g., 0xff000080 is
+            red at half opacity. If there are not as many colors as breaks, then colors are
+            picked from, or interpolated between, them.
+        no_data_color(int, optional): A color to replace NODATA values with
+        fallback (int, optional): A color to replace cells that have no value in the mapping
+        classification_strategy (str or :class:`~geopyspark.geotrellis.constants.ClassificationStrategy`, optional):
+            A string giving the strategy for converting tile values to colors. See
+            :meth:`~geopyspark.geotrellis.color.ColorMap.build`.
+        band (int, optional): The band of multiband tiles that is colored. Default is, 0.
+        compress_level (int, optional): The zlib compression level of the PNGs. Default is, 1.
+
+    Attributes:
+        breaks (np.ndarray): The sorted breaks.
+        colors (np.ndarray): The RGBA colors of the breaks, with the shape ``(len(breaks), 4)``.
+        no_data_color(int): The color of NODATA values.
+        fallback (int): The color of values that have no value in the mapping.
+        classification_strategy (:class:`~geopyspark.geotrellis.constants.ClassificationStrategy`):
+            The strategy for converting tile values to colors.
+        band (int): The band of multiband tiles that is colored.
+        compress_level (int): The zlib compression level of the PNGs.
+    """
+
+    def __init__(self, breaks, colors,
+                 no_data_color=0x00000000, fallback=0x00000000,
+                 classification_strategy=ClassificationStrategy.LESS_THAN_OR_EQUAL_TO,
+                 band=0, compress_level=1):
+
+        breaks = np.asarray(list(breaks))
+        order = np.argsort(breaks, kind='mergesort')
+
+        self.breaks = breaks[order]
+        self.colors = _color_stops(colors, len(breaks))[order]
+        self.no_data_color = no_data_color
+        self.fallback = fallback
+        self.classification_strategy = ClassificationStrategy(classification_strategy)
+        self.band = band
+        self.compress_level = compress_level
+
+        # The fallback and NoData colors are kept at the end of the table
+        extra = np.array([fallback, no_data_color], dtype='>u4').view(np.uint8).reshape(-1, 4)
+        self._lookup_table = np.concatenate([self.colors, extra])
+
+    @classmethod
+    def build(cls, breaks, colors=None,
+              no_data_color=0x00000000, fallback=0x00000000,
+              classification_strategy=ClassificationStrategy.LESS_THAN_OR_EQUAL_TO,
+              band=0, compress_level=1):
+        """Given breaks and colors, build a ``NumpyColorMap`` object.
+
+        Args:
+            breaks (dict or list or ``np.ndarray`` or :class:`~geopyspark.geotrellis.Histogram`):
+                See :meth:`~geopyspark.geotrellis.color.ColorMap.build`. When a ``Histogram``, its
+                quantile breaks are used.
+            colors (str or list, optional): See :meth:`~geopyspark.geotrellis.color.ColorMap.build`.
+            no_data_color(int, optional): A color to replace NODATA values with
+            fallback (int, optional): A color to replace cells that have no
+                value in the mapping
+            classification_strategy (str or :class:`~geopyspark.geotrellis.constants.ClassificationStrategy`, optional):
+                A string giving the strategy for converting tile values to colors.
+            band (int, optional): The band of multiband tiles that is colored. Default is, 0.
+            compress_level (int, optional): The zlib compression level of the PNGs. Default is, 1.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.color.NumpyColorMap`
+        """
+
+        if isinstance(breaks, dict):
+            return cls(list(breaks.keys()), list(breaks.values()), no_data_color, fallback,
+                       classification_strategy, band, compress_level)
+
+        color_list = _get_color_list(colors)
+
+        if isinstance(breaks, Histogram):
+            breaks = breaks.quantile_breaks(len(color_list))
+
+        return cls(breaks, color_list, no_data_color, fallback, classification_strategy, band, compress_level)
+
+    def render(self, cells, no_data_value=None):
+        """Colors a 2D array of cells.
+
+        Args:
+            cells (np.ndarray): The cells to color.
+            no_data_value (optional): The NODATA value of the cells. ``NaN`` cells are always
+                treated as NODATA.
+
+        Returns:
+            np.ndarray: An array of ``uint8`` RGBA values with the shape ``(rows, cols, 4)``.
+        """
+
+        breaks = self.breaks
+        fallback = len(breaks)
+        strategy = self.classification_strategy
+
+        if strategy == ClassificationStrategy.LESS_THAN_OR_EQUAL_TO:
+            indices = np.searchsorted(breaks, cells, side='left')
+        elif strategy == ClassificationStrategy.LESS_THAN:
+            indices = np.searchsorted(breaks, cells, side='right')
+        elif strategy == ClassificationStrategy.GREATER_THAN_OR_EQUAL_TO:
+            indices = np.searchsorted(breaks, cells, side='right') - 1
+            indices[indices < 0] = fallback
+        elif strategy == ClassificationStrategy.GREATER_THAN:
+            indices = np.searchsorted(breaks, cells, side='left') - 1
+            indices[indices < 0] = fallback
+        else:
+            indices = np.searchsorted(breaks, cells, side='left')
+            found = indices < fallback
+            found[found] = breaks[indices[found]] == cells[found]
+            indices[~found] = fallback
+
+        if cells.dtype.kind == 'f':
+            indices[np.isnan(cells)] = fallback + 1
+
+        if no_data_value is not None:
+            indices[cells == no_data_value] = fallback + 1
+
+        return self._lookup_table[indices]
+
+    def render_tile(self, tile):
+        """Colors a band of a ``Tile``.
+
+        Args:
+            tile (:class:`~geopyspark.geotrellis.Tile`): The tile to color.
+
+        Returns:
+            np.ndarray: An array of ``uint8`` RGBA values with the shape ``(rows, cols, 4)``.
+        """
+
+        cells = tile.cells
+
+        if cells.ndim == 3:
+            cells = cells[self.band]
+
+        return self.render(cells, tile.no_data_value)
+
+    def __call__(self, tiles):
+        """Colors a ``Tile``, or composites a list of them, and encodes the result as a PNG.
+
+        When given a list, the tiles are colored and then drawn over each other in order, so
+        the last tile is on top.
+
+        Args:
+            tiles (:class:`~geopyspark.geotrellis.Tile` or [:class:`~geopyspark.geotrellis.Tile`]):
+                The tile or tiles to render.
+
+        Returns:
+            bytes: The PNG.
+        """
+
+        if not isinstance(tiles, list):
+            return _encode_png(self.render_tile(tiles), self.compress_level)
+
+        images = [self.render_tile(tile) for tile in tiles if tile is not None]
+
+        if not images:
+            raise ValueError("There are no tiles to render")
+
+        composite = images[0].astype(np.float32)
+
+        for image in images[1:]:
+            if image.shape != composite.shape:
+                raise ValueError("The tiles must all be the same size. Recieved", image.shape[:2],
+                                 "and", composite.shape[:2], "instead.")
+
+            # Draws the image over the composite, with colors that are not premultiplied
+            top_alpha = image[:, :, 3:].astype(np.float32) / 255
+            bottom_alpha = composite[:, :, 3:] / 255 * (1 - top_alpha)
+            alpha = top_alpha + bottom_alpha
+
+            color = image[:, :, :3] * top_alpha + composite[:, :, :3] * bottom_alpha
+            composite[:, :, :3] = np.divide(color, alpha, out=np.zeros_like(color), where=alpha > 0)
+            composite[:, :, 3:] = 255 * alpha
+
+        return _encode_png(np.round(composite).astype(np.uint8), self.compress_level)
@@ -6,7 +6,8 @@ __all__ = ['NO_DATA_INT', 'LayerType', 'IndexingMethod', 'ResampleMethod', 'Time
            'Operation', 'Neighborhood', 'ClassificationStrategy', 'CellType', 'ColorRamp',
            'DEFAULT_MAX_TILE_SIZE', 'DEFAULT_PARTITION_BYTES', 'DEFAULT_CHUNK_SIZE',
            'DEFAULT_GEOTIFF_TIME_TAG', 'DEFAULT_GEOTIFF_TIME_FORMAT', 'DEFAULT_S3_CLIENT',
-           'StorageMethod', 'ColorSpace', 'Compression', 'Unit', 'ReadMethod']
+           'StorageMethod', 'ColorSpace', 'Compression', 'Unit', 'ReadMethod', 'Transport',
+           'FrameCodec']
 
 
 """The NoData value for ints in GeoTrellis."""
@@ -297,3 +298,19 @@ class ReadMethod(Enum):
 
     GEOTRELLIS = "GeoTrellis"
     GDAL = "GDAL"
+
+
+class Transport(Enum):
+    """The formats that tiles can be sent in between the JVM and Python."""
+
+    PROTOBUF = "protobuf"
+    ARROW = "arrow"
+
+
+class FrameCodec(Enum):
+    """The codecs that can compress frames of tiles sent between the JVM and Python."""
+
+    NONE = "none"
+    ZLIB = "zlib"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
@@ -0,0 +1,206 @@
+"""Compression of the frames of values that are sent between the JVM and Python.
+
+A compressed frame starts with a one byte codec id and the length of the uncompressed frame as
+a little-endian int, followed by the payload. This is the same layout that
+``geopyspark.util.FrameCompression`` uses on the JVM.
+"""
+import struct
+import zlib
+from collections import namedtuple
+
+from geopyspark import get_spark_context
+from geopyspark.geotrellis.constants import FrameCodec
+
+
+__all__ = ['FrameCompression', 'CompressionStats']
+
+
+_CODEC_IDS = {
+    FrameCodec.NONE: 0,
+    FrameCodec.ZLIB: 1,
+    FrameCodec.LZ4: 2,
+    FrameCodec.ZSTD: 3
+}
+
+_CODECS = {codec_id: codec for codec, codec_id in _CODEC_IDS.items()}
+
+_HEADER = struct.Struct('<Bi')
+
+# Frames that compress to more than this fraction of their size are stored as is
+_MAX_RATIO = 0.9
+
+# The number of bytes compressed when probing whether a frame is worth compressing
+_PROBE_SIZE = 64 * 1024
+
+
+def _encode(codec, level, data):
+    if codec == FrameCodec.ZLIB:
+        return zlib.compress(data, level if level is not None else -1)
+
+    elif codec == FrameCodec.LZ4:
+        try:
+            import lz4.block
+        except ImportError:
+            raise ImportError("lz4 must be installed in order to use FrameCodec.LZ4")
+
+        if level:
+            return lz4.block.compress(data, mode='high_compression', compression=level, store_size=False)
+        else:
+            return lz4.block.compress(data, store_size=False)
+
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstandard must be installed in order to use FrameCodec.ZSTD")
+
+        return zstandard.ZstdCompressor(level=level or 3).compress(data)
+
+
+def _decode(codec, raw_length, payload):
+    if codec == FrameCodec.NONE:
+        return payload
+
+    elif codec == FrameCodec.ZLIB:
+        return zlib.decompress(payload)
+
+    elif codec == FrameCodec.LZ4:
+        import lz4.block
+        return lz4.block.decompress(payload, uncompressed_size=raw_length)
+
+    else:
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(payload, max_output_size=raw_length)
+
+
+def compress_frame(frame, codec, level=None, probe=False):
+    """Compresses a single frame.
+
+    Args:
+        frame (bytes): The frame to compress.
+        codec (str or :class:`~geopyspark.geotrellis.constants.FrameCodec`): The codec to use.
+        level (int, optional): The compression level. If ``None``, the codec's default is used.
+        probe (bool, optional): If ``True``, a sample of the frame is compressed first, and the
+            whole frame is only compressed if the sample shrank. Default is, ``False``.
+
+    Returns:
+        bytes
+    """
+
+    codec = FrameCodec(codec)
+    frame = bytes(frame)
+
+    if codec != FrameCodec.NONE and (not probe or
+                                     len(frame) <= 2 * _PROBE_SIZE or
+                                     len(_encode(codec, level, frame[:_PROBE_SIZE])) <= _PROBE_SIZE * _MAX_RATIO):
+        compressed = _encode(codec, level, frame)
+
+        if len(compressed) <= len(frame) * _MAX_RATIO:
+            return _HEADER.pack(_CODEC_IDS[codec], len(frame)) + compressed
+
+    return _HEADER.pack(_CODEC_IDS[FrameCodec.NONE], len(frame)) + frame
+
+
+def decompress_frame(frame):
+    """Decompresses a frame made by :meth:`~geopyspark.geotrellis.framecompression.compress_frame`
+    or by the JVM.
+
+    Args:
+        frame (bytes): The compressed frame.
+
+    Returns:
+        bytes
+    """
+
+    codec_id, raw_length = _HEADER.unpack_from(frame)
+
+    return _decode(_CODECS[codec_id], raw_length, frame[_HEADER.size:])
+
+
+class CompressionStats(object):
+    """Keeps track of how well the frames that were decompressed or compressed in Python
+    compressed.
+
+    The totals are kept in Spark accumulators, so they are only complete once an action
+    has been run on the RDD that used them.
+
+    Attributes:
+        raw_bytes (pyspark.Accumulator): The total size of the frames before compression.
+        compressed_bytes (pyspark.Accumulator): The total size of the frames after compression.
+    """
+
+    def __init__(self):
+        pysc = get_spark_context()
+
+        self.raw_bytes = pysc.accumulator(0)
+        self.compressed_bytes = pysc.accumulator(0)
+
+    def add(self, raw_size, compressed_size):
+        self.raw_bytes += raw_size
+        self.compressed_bytes += compressed_size
+
+    @property
+    def ratio(self):
+        """float: The compressed size as a fraction of the raw size. ``None`` if nothing has
+        been recorded yet.
+        """
+
+        if not self.raw_bytes.value:
+            return None
+
+        return self.compressed_bytes.value / self.raw_bytes.value
+
+    def __repr__(self):
+        return "CompressionStats(raw_bytes={}, compressed_bytes={}, ratio={})".format(
+            self.raw_bytes.value, self.compressed_bytes.value, self.ratio)
+
+
+class FrameCompression(namedtuple("FrameCompression", "codec level stats")):
+    """Describes how the frames of a layer should be compressed while they are moved between
+    the JVM and Python.
+
+    Compressing frames is worthwhile for layers whose tiles have many repeated values, such as
+    land cover, masks, or tiles that are mostly NoData. Frames that do not shrink by at least
+    10% are sent uncompressed. Floating point tiles rarely compress, so for those only a
+    sample of each frame is compressed before deciding whether to compress the rest.
+
+    Note:
+        ``FrameCodec.LZ4`` requires the ``lz4`` package and ``FrameCodec.ZSTD`` requires the
+        ``zstandard`` package. Both are installed with ``pip install geopyspark[compression]``.
+
+    Args:
+        codec (str or :class:`~geopyspark.geotrellis.constants.FrameCodec`, optional): The
+            codec to use. Default is, ``FrameCodec.LZ4``.
+        level (int, optional): The compression level. If ``None``, the codec's default level is
+            used. For ``FrameCodec.LZ4`` any level turns on its high compression mode.
+        stats (:class:`~geopyspark.geotrellis.framecompression.CompressionStats`, optional): If
+            set, records the sizes of the frames that are compressed or decompressed in Python.
+            Default is, ``None``.
+
+    Attributes:
+        codec (str or :class:`~geopyspark.geotrellis.constants.FrameCodec`): The codec to use.
+        level (int): The compression level.
+        stats (:class:`~geopyspark.geotrellis.framecompression.CompressionStats`): Records the
+            sizes of the frames.
+    """
+
+    __slots__ = []
+
+    def __new__(cls, codec=FrameCodec.LZ4, level=None, stats=None):
+        return super(cls, FrameCompression).__new__(cls, FrameCodec(codec), level, stats)
+
+    def compress(self, frame, probe=False):
+        compressed = compress_frame(frame, self.codec, self.level, probe)
+
+        if self.stats:
+            self.stats.add(len(frame), len(compressed))
+
+        return compressed
+
+    def decompress(self, frame):
+        decompressed = decompress_frame(frame)
+
+        if self.stats:
+            self.stats.add(len(decompressed), len(frame))
+
+        return decompressed
@@ -57,8 +57,8 @@ class KeyTransform(object):
             if cellsize and not dimensions:
                 tilewidth = layout.tile_cols * cellsize[0]
                 tileheight = layout.tile_rows * cellsize[1]
-                rows = ceil((extent.xmax - extent.xmin) / tilewidth)
-                cols = ceil((extent.ymax - extent.ymin) / tileheight)
+                cols = ceil((extent.xmax - extent.xmin) / tilewidth)
+                rows = ceil((extent.ymax - extent.ymin) / tileheight)
                 extent = gps.Extent(extent.xmin, extent.ymax - rows * tileheight, extent.xmin + cols * tilewidth, extent.ymax)
                 tl = gps.TileLayout(cols, rows, layout.tile_cols, layout.tile_rows)
             else:
@@ -69,7 +69,7 @@ class KeyTransform(object):
             except:
                 raise ImportError('pyproj is required for GlobalLayout')
 
-            if not layout.zoom:
+            if layout.zoom is None:
                 raise ValueError("Must specify a zoom level when using GlobalLayout")
 
             if not crs:
@@ -5,6 +5,8 @@ when performing operations.
 '''
 import json
 import datetime
+import itertools
+import numpy as np
 from dateutil import parser
 import pytz
 from  shapely import wkb
@@ -15,7 +17,8 @@ from geopyspark.geotrellis.protobufcodecs import (multibandtile_decoder,
                                                   temporal_projected_extent_decoder,
                                                   spatial_key_decoder,
                                                   space_time_key_decoder)
-from geopyspark.geotrellis.protobufserializer import ProtoBufSerializer
+from geopyspark.geotrellis.protobufserializer import ProtoBufSerializer, DEFAULT_BATCH_BYTES
+from geopyspark.geotrellis.arrowserializer import ArrowSerializer
 from geopyspark.geopyspark_utils import ensure_pyspark
 ensure_pyspark()
 
@@ -49,7 +52,8 @@ from geopyspark.geotrellis.constants import (IndexingMethod,
                                              Compression,
                                              TimeUnit,
                                              NO_DATA_INT,
-                                             ReadMethod)
+                                             ReadMethod,
+                                             Transport)
 from geopyspark.geotrellis.neighborhood import Neighborhood
 
 
@@ -183,6 +187,44 @@ def _to_spatial_layer(layer, target_time):
         return layer.srdd.toSpatialLayer()
 
 
+def _tile_batches(tuples, batch_size):
+    """Groups (key, ``Tile``) tuples into lists of at most ``batch_size`` tuples whose tiles
+    have the same cell type, ``no_data_value``, and shape.
+    """
+
+    def signature(tup):
+        tile = tup[1]
+        return (tile.cell_type, str(tile.no_data_value), tile.cells.shape)
+
+    for _, group in itertools.groupby(tuples, key=signature):
+        while True:
+            batch = list(itertools.islice(group, batch_size))
+
+            if not batch:
+                break
+
+            yield batch
+
+
+def _compress_frames(pysc, jrdd, compression, probe):
+    """Compresses the frames of a JavaRDD[Array[Byte]] on the JVM before they are sent to Python."""
+
+    if not compression:
+        return jrdd
+
+    return pysc._gateway.jvm.geopyspark.util.FrameCompression.compress(
+        jrdd, compression.codec.value, -1 if compression.level is None else compression.level, probe)
+
+
+def _decompress_frames(pysc, jrdd, compression):
+    """Decompresses, on the JVM, the frames of a JavaRDD[Array[Byte]] sent from Python."""
+
+    if not compression:
+        return jrdd
+
+    return pysc._gateway.jvm.geopyspark.util.FrameCompression.decompress(jrdd)
+
+
 class TileLayer(object):
     """
     Wrapper for Scala RDD instance of GeoTrellis multiband tiles through a py4j reference.
@@ -472,7 +514,7 @@ class RasterLayer(CachableLayer, TileLayer):
         return cls(layer_type, srdd)
 
     @classmethod
-    def from_numpy_rdd(cls, layer_type, numpy_rdd):
+    def from_numpy_rdd(cls, layer_type, numpy_rdd, compression=None):
         """Create a ``RasterLayer`` from a numpy RDD.
 
         Args:
@@ -483,6 +525,8 @@ class RasterLayer(CachableLayer, TileLayer):
                 :class:`~geopyspark.geotrellis.ProjectedExtent`\s or
                 :class:`~geopyspark.geotrellis.TemporalProjectedExtent`\s and rasters that
                 are represented by a numpy array.
+            compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+                If set, the frames sent to the JVM are compressed with it. Default is, ``None``.
 
         Returns:
             :class:`~geopyspark.geotrellis.layer.RasterLayer`
@@ -490,34 +534,44 @@ class RasterLayer(CachableLayer, TileLayer):
 
         pysc = get_spark_context()
         key = LayerType(layer_type)._key_name(False)
-        ser = ProtoBufSerializer.create_tuple_serializer(key_type=key)
-        reserialized_rdd = numpy_rdd._reserialize(ser)
+        # The cell types of the rasters are not known, so every frame is probed
+        ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type=key, compression=compression,
+                                                               probe=True)
+        jrdd = _decompress_frames(pysc, numpy_rdd._reserialize(ser)._jrdd, compression)
 
         if layer_type == LayerType.SPATIAL:
             srdd = \
-                    pysc._gateway.jvm.geopyspark.geotrellis.ProjectedRasterLayer.fromProtoEncodedRDD(
-                        reserialized_rdd._jrdd)
+                    pysc._gateway.jvm.geopyspark.geotrellis.ProjectedRasterLayer.fromProtoBatchedRDD(
+                        jrdd)
         else:
             srdd = \
-                    pysc._gateway.jvm.geopyspark.geotrellis.TemporalRasterLayer.fromProtoEncodedRDD(
-                        reserialized_rdd._jrdd)
+                    pysc._gateway.jvm.geopyspark.geotrellis.TemporalRasterLayer.fromProtoBatchedRDD(
+                        jrdd)
 
         return cls(layer_type, srdd)
 
-    def to_numpy_rdd(self):
+    def to_numpy_rdd(self, compression=None):
         """Converts a ``RasterLayer`` to a numpy RDD.
 
         Note:
             Depending on the size of the data stored within the RDD, this can be an exspensive
             operation and should be used with caution.
 
+        Args:
+            compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+                If set, the frames sent to Python are compressed with it. Frames of floating
+                point tiles are only compressed if a sample of them compresses well.
+                Default is, ``None``.
+
         Returns:
             RDD
         """
 
-        result = self.srdd.toProtoRDD()
+        pysc = get_spark_context()
+        result = _compress_frames(pysc, self.srdd.toProtoBatchedRDD(DEFAULT_BATCH_BYTES),
+                                  compression, probe=True)
         key = LayerType(self.layer_type)._key_name(False)
-        ser = ProtoBufSerializer.create_tuple_serializer(key_type=key)
+        ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type=key, compression=compression)
 
         return create_python_rdd(result, ser)
 
@@ -1194,7 +1248,8 @@ class TiledRasterLayer(CachableLayer, TileLayer):
         return cls(layer_type, srdd)
 
     @classmethod
-    def from_numpy_rdd(cls, layer_type, numpy_rdd, metadata, zoom_level=None):
+    def from_numpy_rdd(cls, layer_type, numpy_rdd, metadata, zoom_level=None,
+                       transport=Transport.PROTOBUF, compression=None):
         """Creates a ``TiledRasterLayer`` from a numpy RDD.
 
         Args:
@@ -1209,6 +1264,12 @@ class TiledRasterLayer(CachableLayer, TileLayer):
                 the ``TiledRasterLayer`` instance.
             zoom_level(int, optional): The ``zoom_level`` the resulting `TiledRasterLayer` should
                 have. If ``None``, then the returned layer's ``zoom_level`` will be ``None``.
+            transport (str or :class:`~geopyspark.geotrellis.constants.Transport`, optional): The
+                format used to send the tiles to the JVM. ``Transport.ARROW`` requires ``pyarrow``
+                older than 0.15 and works best when all of the tiles have the same cell type and shape.
+                Default is, ``Transport.PROTOBUF``.
+            compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+                If set, the frames sent to the JVM are compressed with it. Default is, ``None``.
 
         Returns:
             :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
@@ -1216,31 +1277,31 @@ class TiledRasterLayer(CachableLayer, TileLayer):
 
         pysc = get_spark_context()
         key = LayerType(layer_type)._key_name(True)
-        ser = ProtoBufSerializer.create_tuple_serializer(key_type=key)
-        reserialized_rdd = numpy_rdd._reserialize(ser)
 
         if isinstance(metadata, Metadata):
             metadata = metadata.to_dict()
 
-        spatial_tiled_raster_layer = pysc._gateway.jvm.geopyspark.geotrellis.SpatialTiledRasterLayer
-        temporal_tiled_raster_layer = pysc._gateway.jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
+        if LayerType(layer_type) == LayerType.SPATIAL:
+            tiled_raster_layer = pysc._gateway.jvm.geopyspark.geotrellis.SpatialTiledRasterLayer
+        else:
+            tiled_raster_layer = pysc._gateway.jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
 
-        if layer_type == LayerType.SPATIAL:
-            if zoom_level:
-                srdd = spatial_tiled_raster_layer.fromProtoEncodedRDD(reserialized_rdd._jrdd,
-                                                                      zoom_level,
-                                                                      json.dumps(metadata))
-            else:
-                srdd = spatial_tiled_raster_layer.fromProtoEncodedRDD(reserialized_rdd._jrdd,
-                                                                      json.dumps(metadata))
+        if Transport(transport) == Transport.ARROW:
+            ser = ArrowSerializer(key_type=key, compression=compression)
+            from_encoded_rdd = tiled_raster_layer.fromArrowEncodedRDD
         else:
-            if zoom_level:
-                srdd = temporal_tiled_raster_layer.fromProtoEncodedRDD(reserialized_rdd._jrdd,
-                                                                       zoom_level,
-                                                                       json.dumps(metadata))
-            else:
-                srdd = temporal_tiled_raster_layer.fromProtoEncodedRDD(reserialized_rdd._jrdd,
-                                                                       json.dumps(metadata))
+            probe = metadata['cellType'].startswith('float')
+            ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type=key,
+                                                                   compression=compression,
+                                                                   probe=probe)
+            from_encoded_rdd = tiled_raster_layer.fromProtoBatchedRDD
+
+        jrdd = _decompress_frames(pysc, numpy_rdd._reserialize(ser)._jrdd, compression)
+
+        if zoom_level:
+            srdd = from_encoded_rdd(jrdd, zoom_level, json.dumps(metadata))
+        else:
+            srdd = from_encoded_rdd(jrdd, json.dumps(metadata))
 
         return cls(layer_type, srdd)
 
@@ -1306,38 +1367,63 @@ class TiledRasterLayer(CachableLayer, TileLayer):
         else:
             raise AttributeError("RasterFrames has not been enabled in the active SparkSession")
 
-    def to_numpy_rdd(self):
+    def to_numpy_rdd(self, transport=Transport.PROTOBUF, compression=None):
         """Converts a ``TiledRasterLayer`` to a numpy RDD.
 
         Note:
             Depending on the size of the data stored within the RDD, this can be an exspensive
             operation and should be used with caution.
 
+        Args:
+            transport (str or :class:`~geopyspark.geotrellis.constants.Transport`, optional): The
+                format used to send the tiles to Python. ``Transport.ARROW`` requires ``pyarrow``
+                older than 0.15 and does not copy the cells when decoding them, so the cells of each ``Tile``
+                will be read-only. Default is, ``Transport.PROTOBUF``.
+            compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+                If set, the frames sent to Python are compressed with it. Frames of floating
+                point tiles are only compressed if a sample of them compresses well.
+                Default is, ``None``.
+
         Returns:
             RDD
         """
 
-        result = self.srdd.toProtoRDD()
         key = LayerType(self.layer_type)._key_name(True)
-        ser = ProtoBufSerializer.create_tuple_serializer(key_type=key)
+
+        if Transport(transport) == Transport.ARROW:
+            result = self.srdd.toArrowRDD(DEFAULT_BATCH_BYTES)
+            ser = ArrowSerializer(key_type=key, compression=compression)
+        else:
+            result = self.srdd.toProtoBatchedRDD(DEFAULT_BATCH_BYTES)
+            ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type=key,
+                                                                   compression=compression)
+
+        probe = self.layer_metadata.cell_type.startswith('float')
+        result = _compress_frames(get_spark_context(), result, compression, probe)
 
         return create_python_rdd(result, ser)
 
-    def to_png_rdd(self, color_map):
+    def to_png_rdd(self, color_map, skip_empty=False):
         """Converts the rasters within this layer to PNGs which are then converted to bytes.
         This is returned as a RDD[(K, bytes)].
 
         Args:
             color_map (:class:`~geopyspark.geotrellis.color.ColorMap`): A ``ColorMap`` instance
                 used to color the PNGs.
+            skip_empty (bool, optional): If ``True``, rasters whose bands are all NoData are left
+                out instead of being rendered. Default is, ``False``.
 
         Returns:
             RDD[(K, bytes)]
         """
 
-        result = self.srdd.toPngRDD(color_map.cmap)
+        if skip_empty:
+            result = self.srdd.toNonEmptyPngRDD(color_map.cmap)
+        else:
+            result = self.srdd.toPngRDD(color_map.cmap)
+
         key = LayerType(self.layer_type)._key_name(True)
-        ser = ProtoBufSerializer.create_image_rdd_serializer(key_type=key)
+        ser = ProtoBufSerializer.create_keyed_bytes_serializer(key_type=key)
 
         return create_python_rdd(result, ser)
 
@@ -1446,7 +1532,7 @@ class TiledRasterLayer(CachableLayer, TileLayer):
 
         return TiledRasterLayer(self.layer_type, result)
 
-    def map_tiles(self, func):
+    def map_tiles(self, func, transport=Transport.PROTOBUF):
         """Maps over each ``Tile`` within the layer with a given function.
 
         Note:
@@ -1457,19 +1543,23 @@ class TiledRasterLayer(CachableLayer, TileLayer):
         Args:
             func (:class:`~geopyspark.geotrellis.Tile` => :class:`~geopyspark.geotrellis.Tile`): A
                 function that takes a ``Tile`` and returns a ``Tile``.
+            transport (str or :class:`~geopyspark.geotrellis.constants.Transport`, optional): The
+                format used to move the tiles between the JVM and Python. Default is,
+                ``Transport.PROTOBUF``.
 
         Returns:
             :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
         """
 
-        python_rdd = self.to_numpy_rdd()
+        python_rdd = self.to_numpy_rdd(transport)
 
         return TiledRasterLayer.from_numpy_rdd(self.layer_type,
                                                python_rdd.mapValues(lambda tile: func(tile)),
                                                self.layer_metadata,
-                                               self.zoom_level)
+                                               self.zoom_level,
+                                               transport)
 
-    def map_cells(self, func):
+    def map_cells(self, func, transport=Transport.PROTOBUF):
         """Maps over the cells of each ``Tile`` within the layer with a given function.
 
         Note:
@@ -1482,12 +1572,15 @@ class TiledRasterLayer(CachableLayer, TileLayer):
                 ``nd``. Where ``cells`` is the numpy array and ``nd`` is the ``no_data_value`` of
                 the tile. It returns ``cells`` which are the new cells values of the tile
                 represented as a numpy array.
+            transport (str or :class:`~geopyspark.geotrellis.constants.Transport`, optional): The
+                format used to move the tiles between the JVM and Python. Default is,
+                ``Transport.PROTOBUF``.
 
         Returns:
             :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
         """
 
-        python_rdd = self.to_numpy_rdd()
+        python_rdd = self.to_numpy_rdd(transport)
 
         def tile_func(cells, cell_type, no_data_value):
             return Tile(func(cells, no_data_value), cell_type, no_data_value)
@@ -1495,7 +1588,64 @@ class TiledRasterLayer(CachableLayer, TileLayer):
         return TiledRasterLayer.from_numpy_rdd(self.layer_type,
                                                python_rdd.mapValues(lambda tile: tile_func(*tile)),
                                                self.layer_metadata,
-                                               self.zoom_level)
+                                               self.zoom_level,
+                                               transport)
+
+    def map_partitions_numpy(self, func, batch_size=256, transport=Transport.PROTOBUF):
+        """Maps over batches of ``Tile``\s within each partition of the layer with a given function.
+
+        Unlike ``map_tiles`` and ``map_cells``, ``func`` is called once per batch of tiles
+        rather than once per tile. This allows expensive setup to be shared across many tiles
+        and for the computation to be vectorized over the whole batch.
+
+        Note:
+            This operation first needs to deserialize the wrapped ``RDD`` into Python and then
+            serialize the ``RDD`` back into a ``TiledRasterRDD`` once the mapping is done. Thus,
+            it is advised to chain together operations to reduce performance cost.
+
+        Args:
+            func (cells, keys => cells): A function that takes two arguments: ``cells`` and
+                ``keys``. Where ``cells`` is a numpy array with the shape
+                ``(n_tiles, bands, rows, cols)`` and ``keys`` is a list of the ``n_tiles`` keys
+                of those tiles, in the same order. It returns a numpy array with the same shape
+                as ``cells``. Every tile in a batch has the same cell type, ``no_data_value``,
+                and shape, which the resulting tiles will keep.
+            batch_size (int, optional): The maximum number of tiles given to ``func`` at once.
+                Default is, 256.
+            transport (str or :class:`~geopyspark.geotrellis.constants.Transport`, optional): The
+                format used to move the tiles between the JVM and Python. Default is,
+                ``Transport.PROTOBUF``.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1. Recieved", batch_size, "instead.")
+
+        python_rdd = self.to_numpy_rdd(transport)
+
+        def map_partition(partition):
+            for batch in _tile_batches(partition, batch_size):
+                keys = [key for key, _ in batch]
+                cell_type, no_data_value = batch[0][1].cell_type, batch[0][1].no_data_value
+
+                cells = np.stack([tile.cells.reshape((-1,) + tile.cells.shape[-2:])
+                                  for _, tile in batch])
+                result = func(cells, keys)
+
+                if result.shape != cells.shape:
+                    raise ValueError("func must return an array with the shape", cells.shape,
+                                     "Recieved", result.shape, "instead.")
+
+                for key, result_cells in zip(keys, result):
+                    yield key, Tile(result_cells, cell_type, no_data_value)
+
+        return TiledRasterLayer.from_numpy_rdd(self.layer_type,
+                                               python_rdd.mapPartitions(map_partition, True),
+                                               self.layer_metadata,
+                                               self.zoom_level,
+                                               transport)
 
     def aggregate_by_cell(self, operation):
         """Computes an aggregate summary for each cell of all of the values for each key.
@@ -1605,7 +1755,7 @@ class TiledRasterLayer(CachableLayer, TileLayer):
                                  band_tags)
 
         key = LayerType(self.layer_type)._key_name(True)
-        ser = ProtoBufSerializer.create_image_rdd_serializer(key_type=key)
+        ser = ProtoBufSerializer.create_keyed_bytes_serializer(key_type=key)
 
         return create_python_rdd(result, ser)
 
@@ -2690,6 +2840,44 @@ class Pyramid(CachableLayer):
                   time_resolution=time_resolution,
                   store=store)
 
+    def write_async(self, uri, layer_name, index_strategy=IndexingMethod.ZORDER, time_unit=None,
+                    time_resolution=None, store=None, scheduler_pool=None, max_concurrent=None):
+        """Writes each tiled layer of the pyramid to a specified destination in the background.
+
+        The levels are independent, so they are written by concurrent Spark jobs. This returns
+        right away, and the driver can submit other work while the levels are written.
+
+        Note:
+            Jobs are only given a fair share of the cluster when the ``SparkContext`` was created
+            with ``spark.scheduler.mode`` set to ``FAIR``. Otherwise they are run first in, first out.
+
+        Args:
+            uri (str): The Uniform Resource Identifier used to point towards the desired location for
+                the tile layer to written to. The shape of this string varies depending on backend.
+            layer_name (str): The name of the new, tile layer.
+            index_strategy (str or :class:`~geopyspark.geotrellis.constants.IndexingMethod`):
+                See :meth:`~geopyspark.geotrellis.layer.Pyramid.write`.
+            time_unit (str or :class:`~geopyspark.geotrellis.constants.TimeUnit`, optional):
+                See :meth:`~geopyspark.geotrellis.layer.Pyramid.write`.
+            time_resolution (str or int, optional): See :meth:`~geopyspark.geotrellis.layer.Pyramid.write`.
+            store (str or :class:`~geopyspark.geotrellis.catalog.AttributeStore`, optional):
+                ``AttributeStore`` instance or URI for layer metadata lookup.
+            scheduler_pool (str, optional): The name of the fair scheduler pool the jobs are run
+                in. If ``None``, then the default pool is used. Default is, ``None``.
+            max_concurrent (int, optional): The number of levels that are written at the same
+                time. If ``None``, then every level is written at once. Default is, ``None``.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.catalog.WriteHandle`
+        """
+        from geopyspark.geotrellis.catalog import _write_async
+
+        # The largest levels are started first, as they take the longest to write
+        levels = [self.levels[zoom] for zoom in sorted(self.levels, reverse=True)]
+
+        return _write_async(uri, layer_name, levels, index_strategy, time_unit, time_resolution,
+                            store, False, scheduler_pool, max_concurrent)
+
     def __add__(self, value):
         if isinstance(value, Pyramid):
             return Pyramid({k: l.__add__(r) for k, l, r in _common_entries(self.levels, value.levels)})
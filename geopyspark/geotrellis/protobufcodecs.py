@@ -1,6 +1,7 @@
 """Contains the various encoding/decoding methods to bring values to/from Python from Scala."""
-from functools import partial
+from functools import lru_cache
 import datetime
+import struct
 import numpy as np
 from shapely.wkb import loads, dumps
 from geopyspark.geopyspark_utils import ensure_pyspark
@@ -28,13 +29,39 @@ _mapped_data_types = {
     7: 'DOUBLE'
 }
 
+_buffer_dtypes = {
+    'BIT': np.dtype('<i1'),
+    'BYTE': np.dtype('<i1'),
+    'UBYTE': np.dtype('<u1'),
+    'SHORT': np.dtype('<i2'),
+    'USHORT': np.dtype('<u2'),
+    'INT': np.dtype('<i4'),
+    'FLOAT': np.dtype('<f4'),
+    'DOUBLE': np.dtype('<f8')
+}
+
 
 # DECODERS
 
 
+def _constant_cells(value, shape, dtype):
+    # np.zeros gets its memory already zeroed from the allocator, so NoData
+    # and empty tiles, which are usually 0, are nearly free to create
+    if value == 0:
+        return np.zeros(shape, dtype=dtype)
+
+    return np.full(shape, value, dtype=dtype)
+
+
 def from_pb_tile(tile, no_data_value=None, data_type=None):
     """Creates a ``Tile`` from ``ProtoTile``.
 
+    Note:
+        If the cells were sent as a raw ``cellBuffer``, then the returned array is a
+        read-only view of the message's bytes. If the tile is constant, then the array is
+        filled with its value. Otherwise, the cells are read from the repeated fields used
+        by older encoders.
+
     Args:
         tile (ProtoTile): The ``ProtoTile`` instance to be converted.
 
@@ -45,7 +72,11 @@ def from_pb_tile(tile, no_data_value=None, data_type=None):
     if not data_type:
         data_type = _mapped_data_types[tile.cellType.dataType]
 
-    if data_type == 'BIT':
+    if tile.isConstant:
+        return _constant_cells(tile.constantValue, (tile.rows, tile.cols), _buffer_dtypes[data_type])
+    elif tile.cellBuffer:
+        cells = np.frombuffer(tile.cellBuffer, dtype=_buffer_dtypes[data_type])
+    elif data_type == 'BIT':
         cells = np.int8(tile.uint32Cells[:])
     elif data_type == 'BYTE':
         cells = np.int8(tile.sint32Cells[:])
@@ -93,7 +124,35 @@ def from_pb_multibandtile(multibandtile):
         :class:`~geopyspark.geotrellis.Tile`
     """
 
-    cell_type = _mapped_data_types[multibandtile.tiles[0].cellType.dataType]
+    if multibandtile.cellBuffer:
+        cell_type = _mapped_data_types[multibandtile.cellType.dataType]
+        nd = multibandtile.cellType.nd if multibandtile.cellType.hasNoData else None
+
+        # The cells of every band are in one buffer, so they are copied out with a single
+        # allocation. The copy keeps the cells writable.
+        bands = np.frombuffer(multibandtile.cellBuffer, dtype=_buffer_dtypes[cell_type])
+        bands = bands.reshape(multibandtile.bandCount, multibandtile.rows, multibandtile.cols).copy()
+
+        return Tile(bands, cell_type, nd)
+
+    tiles = multibandtile.tiles
+    cell_type = _mapped_data_types[tiles[0].cellType.dataType]
+
+    if all(tile.isConstant for tile in tiles):
+        first = tiles[0]
+        nd = first.cellType.nd if first.cellType.hasNoData else None
+        values = [tile.constantValue for tile in tiles]
+
+        if values.count(values[0]) == len(values):
+            bands = _constant_cells(values[0], (len(tiles), first.rows, first.cols),
+                                    _buffer_dtypes[cell_type])
+        else:
+            bands = np.empty((len(tiles), first.rows, first.cols), dtype=_buffer_dtypes[cell_type])
+
+            for band, value in zip(bands, values):
+                band.fill(value)
+
+        return Tile(bands, cell_type, nd)
 
     if multibandtile.tiles[0].cellType.hasNoData:
         nd = multibandtile.tiles[0].cellType.nd
@@ -170,18 +229,29 @@ def projected_extent_decoder(proto_bytes):
     pb_projected_extent = extentMessages_pb2.ProtoProjectedExtent.FromString(proto_bytes)
     return from_pb_projected_extent(pb_projected_extent)
 
-def from_pb_temporal_projected_extent(pb_temporal_projected_extent):
+@lru_cache(maxsize=4096)
+def _instant_from_millis(millis):
+    # Tiles of a layer tend to share a handful of instants, so the conversion is cached
+    return datetime.datetime.utcfromtimestamp(millis / 1000)
+
+def from_pb_temporal_projected_extent(pb_temporal_projected_extent, instants_as_millis=False):
     """Creates a ``TemporalProjectedExtent`` from a ``ProtoTemporalProjectedExtent``.
 
     Args:
         pb_temporal_projected_extent (ProtoTemporalProjectedExtent): An instance of
             ``ProtoTemporalProjectedExtent``.
+        instants_as_millis (bool, optional): If ``True``, the ``instant`` is left as an int of
+            the milliseconds since the epoch instead of being converted to a
+            ``datetime.datetime``. Default is, ``False``.
 
     Returns:
         :class:`~geopyspark.geotrellis.TemporalProjectedExtent`
     """
 
-    instant = datetime.datetime.utcfromtimestamp(pb_temporal_projected_extent.instant / 1000)
+    if instants_as_millis:
+        instant = pb_temporal_projected_extent.instant
+    else:
+        instant = _instant_from_millis(pb_temporal_projected_extent.instant)
 
     if pb_temporal_projected_extent.crs.epsg is not 0:
         return TemporalProjectedExtent(extent=from_pb_extent(pb_temporal_projected_extent.extent),
@@ -230,18 +300,25 @@ def spatial_key_decoder(proto_bytes):
     pb_spatial_key = keyMessages_pb2.ProtoSpatialKey.FromString(proto_bytes)
     return from_pb_spatial_key(pb_spatial_key)
 
-def from_pb_space_time_key(pb_space_time_key):
+def from_pb_space_time_key(pb_space_time_key, instants_as_millis=False):
     """Creates a ``SpaceTimeKey`` from a ``ProtoSpaceTimeKey``.
 
     Args:
         pb_space_time_key (ProtoSpaceTimeKey): An instance of ``ProtoSpaceTimeKey``.
+        instants_as_millis (bool, optional): If ``True``, the ``instant`` is left as an int of
+            the milliseconds since the epoch instead of being converted to a
+            ``datetime.datetime``. Default is, ``False``.
 
     Returns:
         :class:`~geopyspark.geotrellis.SpaceTimeKey`
     """
 
-    return SpaceTimeKey(col=pb_space_time_key.col, row=pb_space_time_key.row,
-                        instant=datetime.datetime.utcfromtimestamp(pb_space_time_key.instant / 1000))
+    if instants_as_millis:
+        instant = pb_space_time_key.instant
+    else:
+        instant = _instant_from_millis(pb_space_time_key.instant)
+
+    return SpaceTimeKey(col=pb_space_time_key.col, row=pb_space_time_key.row, instant=instant)
 
 def space_time_key_decoder(proto_bytes):
     """Deserializes ``ProtoSpaceTime`` bytes into Python.
@@ -256,7 +333,68 @@ def space_time_key_decoder(proto_bytes):
     pb_space_time_key = keyMessages_pb2.ProtoSpaceTimeKey.FromString(proto_bytes)
     return from_pb_space_time_key(pb_space_time_key)
 
-def tuple_decoder(proto_bytes, key_decoder):
+@lru_cache(maxsize=None)
+def _tuple_key_decoder(key_type, instants_as_millis=False):
+    """Resolves the function that decodes the key of a ``ProtoTuple`` once, so that decoding
+    a record does not need to compare the name of the key type.
+
+    Args:
+        key_type (str): The name of the key type of the tuple.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
+
+    Returns:
+        A function that takes a ``ProtoTuple`` and returns its decoded key.
+    """
+
+    if key_type == "ProjectedExtent":
+        def decode_key(tup):
+            return from_pb_projected_extent(tup.projectedExtent)
+
+    elif key_type == "TemporalProjectedExtent":
+        def decode_key(tup):
+            return from_pb_temporal_projected_extent(tup.temporalProjectedExtent, instants_as_millis)
+
+    elif key_type == "SpatialKey":
+        def decode_key(tup):
+            key = tup.spatialKey
+            return SpatialKey(key.col, key.row)
+
+    elif key_type == "SpaceTimeKey":
+        if instants_as_millis:
+            def decode_key(tup):
+                key = tup.spaceTimeKey
+                return SpaceTimeKey(key.col, key.row, key.instant)
+        else:
+            def decode_key(tup):
+                key = tup.spaceTimeKey
+                return SpaceTimeKey(key.col, key.row, _instant_from_millis(key.instant))
+
+    else:
+        raise ValueError("Could not find key type that matches", key_type)
+
+    return decode_key
+
+def from_pb_tuple(tup, key_decoder, instants_as_millis=False):
+    """Creates a tuple from a ``ProtoTuple``.
+
+    Note:
+        The value of the tuple is always assumed to be a :class:`~geopyspark.geotrellis.Tile`
+        thus, only the decoding method of the key is required.
+
+    Args:
+        tup (ProtoTuple): An instance of ``ProtoTuple``.
+        key_decoder (str): The name of the key type of the tuple.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
+
+    Returns:
+        tuple
+    """
+
+    return (_tuple_key_decoder(key_decoder, instants_as_millis)(tup), from_pb_multibandtile(tup.tiles))
+
+def tuple_decoder(proto_bytes, key_decoder, instants_as_millis=False):
     """Deserializes ``ProtoTuple`` bytes into Python.
 
     Note:
@@ -266,35 +404,78 @@ def tuple_decoder(proto_bytes, key_decoder):
     Args:
         proto_bytes (bytes): The ProtoBuf encoded bytes of the ProtoBuf class.
         key_decoder (str): The name of the key type of the tuple.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
 
     Returns:
         tuple
     """
 
-    tup = tupleMessages_pb2.ProtoTuple.FromString(proto_bytes)
-    multiband = from_pb_multibandtile(tup.tiles)
-
-    if key_decoder == "ProjectedExtent":
-        return (from_pb_projected_extent(tup.projectedExtent), multiband)
-    elif key_decoder == "TemporalProjectedExtent":
-        return (from_pb_temporal_projected_extent(tup.temporalProjectedExtent), multiband)
-    elif key_decoder == "SpatialKey":
-        return (from_pb_spatial_key(tup.spatialKey), multiband)
-    else:
-        return (from_pb_space_time_key(tup.spaceTimeKey), multiband)
+    return from_pb_tuple(tupleMessages_pb2.ProtoTuple.FromString(proto_bytes),
+                         key_decoder,
+                         instants_as_millis)
 
-def create_partial_tuple_decoder(key_type):
-    """Creates a partial, tuple decoder function.
+def create_partial_tuple_decoder(key_type, instants_as_millis=False):
+    """Creates a tuple decoder function that is specialized for ``key_type``.
 
     Args:
-        value_type (str): The type of the value in the tuple.
+        key_type (str): The type of the key in the tuple.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
+
+    Returns:
+        A :meth:`~geopyspark.geotrellis.protobufcodecs.tuple_decoder` function that requires
+        ``proto_bytes`` to execute.
+    """
+
+    decode_key = _tuple_key_decoder(key_type, instants_as_millis)
+    from_string = tupleMessages_pb2.ProtoTuple.FromString
+
+    def specialized_tuple_decoder(proto_bytes):
+        tup = from_string(proto_bytes)
+        return (decode_key(tup), from_pb_multibandtile(tup.tiles))
+
+    return specialized_tuple_decoder
+
+def tuple_batch_decoder(proto_bytes, key_decoder, instants_as_millis=False):
+    """Deserializes ``ProtoTupleBatch`` bytes into a list of tuples.
+
+    Args:
+        proto_bytes (bytes): The ProtoBuf encoded bytes of the ProtoBuf class.
+        key_decoder (str): The name of the key type of the tuples.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
 
     Returns:
-        A partial :meth:`~geopyspark.protobufregistry.ProtoBufRegistry.tuple_decoder`
-        function that requires ``proto_bytes`` to execute.
+        [tuple]
     """
 
-    return partial(tuple_decoder, key_decoder=key_type)
+    decode_key = _tuple_key_decoder(key_decoder, instants_as_millis)
+    batch = tupleMessages_pb2.ProtoTupleBatch.FromString(proto_bytes)
+
+    return [(decode_key(tup), from_pb_multibandtile(tup.tiles)) for tup in batch.tuples]
+
+def create_partial_tuple_batch_decoder(key_type, instants_as_millis=False):
+    """Creates a tuple batch decoder function that is specialized for ``key_type``.
+
+    Args:
+        key_type (str): The type of the key in the tuples.
+        instants_as_millis (bool, optional): Whether the instants of temporal keys should be
+            left as ints of the milliseconds since the epoch. Default is, ``False``.
+
+    Returns:
+        A :meth:`~geopyspark.geotrellis.protobufcodecs.tuple_batch_decoder` function that
+        requires ``proto_bytes`` to execute.
+    """
+
+    decode_key = _tuple_key_decoder(key_type, instants_as_millis)
+    from_string = tupleMessages_pb2.ProtoTupleBatch.FromString
+
+    def specialized_tuple_batch_decoder(proto_bytes):
+        return [(decode_key(tup), from_pb_multibandtile(tup.tiles))
+                for tup in from_string(proto_bytes).tuples]
+
+    return specialized_tuple_batch_decoder
 
 def image_rdd_decoder(proto_bytes, key_decoder):
     """Decodes tuple of ``(K, bytes)`` where the bytes are the PNG bytes of the raster and
@@ -309,29 +490,70 @@ def image_rdd_decoder(proto_bytes, key_decoder):
     """
 
     tup = tupleMessages_pb2.ProtoTuple.FromString(proto_bytes)
-    image_bytes = tup.imageBytes
-
-    if key_decoder == "ProjectedExtent":
-        return (from_pb_projected_extent(tup.projectedExtent), image_bytes)
-    elif key_decoder == "TemporalProjectedExtent":
-        return (from_pb_temporal_projected_extent(tup.temporalProjectedExtent), image_bytes)
-    elif key_decoder == "SpatialKey":
-        return (from_pb_spatial_key(tup.spatialKey), image_bytes)
-    else:
-        return (from_pb_space_time_key(tup.spaceTimeKey), image_bytes)
+
+    return (_tuple_key_decoder(key_decoder)(tup), tup.imageBytes)
 
 def create_partial_image_rdd_decoder(key_type):
-    """Creates a partial, tuple decoder function.
+    """Creates an image decoder function that is specialized for ``key_type``.
+
+    Args:
+        key_type (str): The type of the key in the tuple.
+
+    Returns:
+        A :meth:`~geopyspark.geotrellis.protobufcodecs.image_rdd_decoder` function that
+        requires ``proto_bytes`` to execute.
+    """
+
+    decode_key = _tuple_key_decoder(key_type)
+    from_string = tupleMessages_pb2.ProtoTuple.FromString
+
+    def specialized_image_rdd_decoder(proto_bytes):
+        tup = from_string(proto_bytes)
+        return (decode_key(tup), tup.imageBytes)
+
+    return specialized_image_rdd_decoder
+
+_spatial_key_struct = struct.Struct('<ii')
+_space_time_key_struct = struct.Struct('<iiq')
+
+def create_partial_keyed_bytes_decoder(key_type):
+    """Creates a decoder for ``(K, bytes)`` tuples that were packed as a fixed-width,
+    little-endian key followed by the untouched bytes.
+
+    A ``SpatialKey`` is packed as two int32s, ``col`` and ``row``. A ``SpaceTimeKey``
+    also has an int64 ``instant`` in milliseconds.
 
     Args:
-        value_type (str): The type of the value in the tuple.
+        key_type (str): The type of the key in the tuples. Either ``"SpatialKey"`` or
+            ``"SpaceTimeKey"``.
 
     Returns:
-        A partial :meth:`~geopyspark.protobufregistry.ProtoBufRegistry.image_rdd_decoder`
-        function that requires ``proto_bytes`` to execute.
+        A function that requires ``packed_bytes`` to execute.
     """
 
-    return partial(image_rdd_decoder, key_decoder=key_type)
+    if key_type == "SpatialKey":
+        unpack_spatial_key = _spatial_key_struct.unpack_from
+        spatial_key_size = _spatial_key_struct.size
+
+        def spatial_keyed_bytes_decoder(packed_bytes):
+            col, row = unpack_spatial_key(packed_bytes)
+            return (SpatialKey(col, row), packed_bytes[spatial_key_size:])
+
+        return spatial_keyed_bytes_decoder
+
+    elif key_type == "SpaceTimeKey":
+        unpack_space_time_key = _space_time_key_struct.unpack_from
+        space_time_key_size = _space_time_key_struct.size
+
+        def space_time_keyed_bytes_decoder(packed_bytes):
+            col, row, instant = unpack_space_time_key(packed_bytes)
+            return (SpaceTimeKey(col, row, _instant_from_millis(instant)),
+                    packed_bytes[space_time_key_size:])
+
+        return space_time_keyed_bytes_decoder
+
+    else:
+        raise ValueError("Keyed bytes can only be decoded for SpatialKey or SpaceTimeKey, not", key_type)
 
 def from_pb_feature_cellvalue(pb_feature_cellvalue):
     """Creates a ``Feature`` with ``properties`` of ``CellValue``
@@ -384,6 +606,58 @@ def _get_decoder(name):
 
 # ENCODERS
 
+# The number of evenly spaced cells checked before the whole tile is scanned
+_CONSTANT_SAMPLE_SIZE = 64
+
+
+def _constant_value(cells):
+    """Returns the value of every cell in ``cells`` if they are all the same, otherwise ``None``.
+
+    A sample of the cells is checked first, so that most tiles that are not constant are
+    rejected without scanning all of them.
+    """
+
+    if not cells.size:
+        return None
+
+    # An array made with np.broadcast_to repeats a single value
+    if not any(cells.strides):
+        return cells.flat[0]
+
+    flat = cells.ravel()
+    first = flat[0]
+    sample = flat[::max(1, flat.size // _CONSTANT_SAMPLE_SIZE)]
+
+    if first != first:
+        if np.isnan(sample).all() and np.isnan(flat).all():
+            return first
+    elif (sample == first).all() and (flat == first).all():
+        return first
+
+    return None
+
+
+def _to_pb_cell_type(obj, cell_type):
+    """Fills in ``cell_type``, a ``ProtoCellType``, from a ``Tile`` and returns the name of
+    the data type its cells are sent as.
+    """
+
+    data_type = obj.cell_type
+
+    if obj.no_data_value is not None and obj.no_data_value is not False:
+        cell_type.hasNoData = True
+        cell_type.nd = obj.no_data_value
+    else:
+        cell_type.hasNoData = False
+
+    if data_type not in _buffer_dtypes:
+        data_type = "DOUBLE"
+
+    cell_type.dataType = ProtoCellType.DataType.Value(data_type)
+
+    return data_type
+
+
 def to_pb_tile(obj):
     """Converts an instance of ``Tile`` to ``ProtoTile``.
 
@@ -395,7 +669,6 @@ def to_pb_tile(obj):
     """
 
     cells = obj.cells
-    data_type = obj.cell_type
 
     if len(cells.shape) > 2:
         (_, rows, cols) = cells.shape
@@ -408,37 +681,16 @@ def to_pb_tile(obj):
     tile.cols = cols
     tile.rows = rows
 
-    if obj.no_data_value is not None and obj.no_data_value is not False:
-        cell_type.hasNoData = True
-        cell_type.nd = obj.no_data_value
-    else:
-        cell_type.hasNoData = False
+    data_type = _to_pb_cell_type(obj, cell_type)
 
-    if data_type == "BIT":
-        cell_type.dataType = ProtoCellType.BIT
-        tile.uint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "BYTE":
-        cell_type.dataType = ProtoCellType.BYTE
-        tile.sint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "UBYTE":
-        cell_type.dataType = ProtoCellType.UBYTE
-        tile.uint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "SHORT":
-        cell_type.dataType = ProtoCellType.SHORT
-        tile.sint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "USHORT":
-        cell_type.dataType = ProtoCellType.USHORT
-        tile.uint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "INT":
-        cell_type.dataType = ProtoCellType.INT
-        tile.sint32Cells.extend(cells.flatten().tolist())
-    elif data_type == "FLOAT":
-        ctype = tile.cellType
-        ctype.dataType = ProtoCellType.FLOAT
-        tile.floatCells.extend(cells.flatten().tolist())
+    cells = cells.astype(_buffer_dtypes[data_type], copy=False)
+    constant_value = _constant_value(cells)
+
+    if constant_value is not None:
+        tile.isConstant = True
+        tile.constantValue = constant_value
     else:
-        cell_type.dataType = ProtoCellType.DOUBLE
-        tile.doubleCells.extend(cells.flatten().tolist())
+        tile.cellBuffer = cells.tobytes()
 
     return tile
 
@@ -470,13 +722,40 @@ def to_pb_multibandtile(obj):
     if cells.ndim == 2:
         cells = np.expand_dims(cells, 0)
 
-    band_count = cells.shape[0]
+    band_count, rows, cols = cells.shape
+
+    cell_type = ProtoCellType()
+    data_type = _to_pb_cell_type(obj, cell_type)
+    cells = cells.astype(_buffer_dtypes[data_type], copy=False)
+
+    constant_values = []
+
+    for band in cells:
+        value = _constant_value(band)
+
+        if value is None:
+            break
 
-    def create_tile(index):
-        return Tile(cells[index, :, :], obj.cell_type, obj.no_data_value)
+        constant_values.append(value)
 
     multibandtile = ProtoMultibandTile()
-    multibandtile.tiles.extend([to_pb_tile(create_tile(x)) for x in range(band_count)])
+
+    # Bands that are all constant are smaller when sent as tiles, otherwise every
+    # band is written into a single buffer.
+    if band_count and len(constant_values) == band_count:
+        for value in constant_values:
+            tile = multibandtile.tiles.add()
+            tile.cols = cols
+            tile.rows = rows
+            tile.cellType.CopyFrom(cell_type)
+            tile.isConstant = True
+            tile.constantValue = value
+    else:
+        multibandtile.cols = cols
+        multibandtile.rows = rows
+        multibandtile.bandCount = band_count
+        multibandtile.cellType.CopyFrom(cell_type)
+        multibandtile.cellBuffer = cells.tobytes()
 
     return multibandtile
 
@@ -661,6 +940,65 @@ def space_time_key_encoder(obj):
 
     return to_pb_space_time_key(obj).SerializeToString()
 
+@lru_cache(maxsize=None)
+def _tuple_key_encoder(key_type):
+    """Resolves the function that sets the key of a ``ProtoTuple`` once, so that encoding
+    a record does not need to compare the name of the key type.
+
+    Args:
+        key_type (str): The name of the key type of the tuple.
+
+    Returns:
+        A function that takes a ``ProtoTuple`` and a key, and sets the key on the ``ProtoTuple``.
+    """
+
+    if key_type == "ProjectedExtent":
+        def encode_key(tup, key):
+            tup.projectedExtent.CopyFrom(to_pb_projected_extent(key))
+
+    elif key_type == "TemporalProjectedExtent":
+        def encode_key(tup, key):
+            tup.temporalProjectedExtent.CopyFrom(to_pb_temporal_projected_extent(key))
+
+    elif key_type == "SpatialKey":
+        def encode_key(tup, key):
+            spatial_key = tup.spatialKey
+            spatial_key.col = key.col
+            spatial_key.row = key.row
+
+    elif key_type == "SpaceTimeKey":
+        def encode_key(tup, key):
+            space_time_key = tup.spaceTimeKey
+            space_time_key.col = key.col
+            space_time_key.row = key.row
+            space_time_key.instant = _convert_to_unix_time(key.instant)
+
+    else:
+        raise ValueError("Could not find key type that matches", key_type)
+
+    return encode_key
+
+def to_pb_tuple(obj, key_encoder):
+    """Converts a tuple to ``ProtoTuple``.
+
+    Note:
+        The value of the tuple is always assumed to be a :class:`~geopyspark.geotrellis.Tile`,
+        thus, only the encoding method of the key is required.
+
+    Args:
+        obj (tuple): The tuple to convert.
+        key_encoder (str): The name of the key type of the tuple.
+
+    Returns:
+       ProtoTuple
+    """
+
+    tup = tupleMessages_pb2.ProtoTuple()
+    tup.tiles.CopyFrom(to_pb_multibandtile(obj[1]))
+    _tuple_key_encoder(key_encoder)(tup, obj[0])
+
+    return tup
+
 def tuple_encoder(obj, key_encoder):
     """Encodes a tuple into ``ProtoTuple`` bytes.
 
@@ -676,19 +1014,28 @@ def tuple_encoder(obj, key_encoder):
        bytes
     """
 
-    tup = tupleMessages_pb2.ProtoTuple()
-    tup.tiles.CopyFrom(to_pb_multibandtile(obj[1]))
+    return to_pb_tuple(obj, key_encoder).SerializeToString()
 
-    if key_encoder == "ProjectedExtent":
-        tup.projectedExtent.CopyFrom(to_pb_projected_extent(obj[0]))
-    elif key_encoder == "TemporalProjectedExtent":
-        tup.temporalProjectedExtent.CopyFrom(to_pb_temporal_projected_extent(obj[0]))
-    elif key_encoder == "SpatialKey":
-        tup.spatialKey.CopyFrom(to_pb_spatial_key(obj[0]))
-    else:
-        tup.spaceTimeKey.CopyFrom(to_pb_space_time_key(obj[0]))
+def tuple_batch_encoder(objs, key_encoder):
+    """Encodes a list of tuples into ``ProtoTupleBatch`` bytes.
 
-    return tup.SerializeToString()
+    Args:
+        objs ([tuple]): The tuples to encode.
+        key_encoder (str): The name of the key type of the tuples.
+
+    Returns:
+       bytes
+    """
+
+    encode_key = _tuple_key_encoder(key_encoder)
+    batch = tupleMessages_pb2.ProtoTupleBatch()
+
+    for obj in objs:
+        tup = batch.tuples.add()
+        tup.tiles.CopyFrom(to_pb_multibandtile(obj[1]))
+        encode_key(tup, obj[0])
+
+    return batch.SerializeToString()
 
 def to_pb_cellvalue(cv):
     """Converts an instance of ``CellValue`` to ``ProtoCellValue``.
@@ -734,17 +1081,51 @@ def feature_cellvalue_encoder(feature):
     return to_pb_feature_cellvalue(feature).SerializeToString()
 
 def create_partial_tuple_encoder(key_type):
-    """Creates a partial, tuple encoder function.
+    """Creates a tuple encoder function that is specialized for ``key_type``.
 
     Args:
         key_type (str): The type of the key in the tuple.
 
     Returns:
-        A partial :meth:`~geopyspark.protobufregistry.tuple_encoder` function that requires an
+        A :meth:`~geopyspark.geotrellis.protobufcodecs.tuple_encoder` function that requires an
         obj to execute.
     """
 
-    return partial(tuple_encoder, key_encoder=key_type)
+    encode_key = _tuple_key_encoder(key_type)
+
+    def specialized_tuple_encoder(obj):
+        tup = tupleMessages_pb2.ProtoTuple()
+        tup.tiles.CopyFrom(to_pb_multibandtile(obj[1]))
+        encode_key(tup, obj[0])
+
+        return tup.SerializeToString()
+
+    return specialized_tuple_encoder
+
+def create_partial_tuple_batch_encoder(key_type):
+    """Creates a tuple batch encoder function that is specialized for ``key_type``.
+
+    Args:
+        key_type (str): The type of the key in the tuples.
+
+    Returns:
+        A :meth:`~geopyspark.geotrellis.protobufcodecs.tuple_batch_encoder` function that
+        requires a list of objs to execute.
+    """
+
+    encode_key = _tuple_key_encoder(key_type)
+
+    def specialized_tuple_batch_encoder(objs):
+        batch = tupleMessages_pb2.ProtoTupleBatch()
+
+        for obj in objs:
+            tup = batch.tuples.add()
+            tup.tiles.CopyFrom(to_pb_multibandtile(obj[1]))
+            encode_key(tup, obj[0])
+
+        return batch.SerializeToString()
+
+    return specialized_tuple_batch_encoder
 
 def _get_encoder(name):
     if name == "Tile":
@@ -1,43 +1,81 @@
 """The class which serializes/deserializes values in a RDD to/from Python."""
+import itertools
+
 from geopyspark.geopyspark_utils import ensure_pyspark
 ensure_pyspark()
 from geopyspark.geotrellis.protobufcodecs import (create_partial_tuple_decoder,
                                                   create_partial_tuple_encoder,
+                                                  create_partial_tuple_batch_decoder,
+                                                  create_partial_tuple_batch_encoder,
                                                   create_partial_image_rdd_decoder,
+                                                  create_partial_keyed_bytes_decoder,
                                                   _get_encoder,
                                                   _get_decoder)
 
-from pyspark.serializers import FramedSerializer
+from pyspark.serializers import FramedSerializer, write_int
 from pyspark.serializers import AutoBatchedSerializer
 
 
+DEFAULT_BATCH_BYTES = 1 << 20
+
+
 class ProtoBufSerializer(FramedSerializer):
     """The serializer used by a RDD to encode/decode values to/from Python.
 
     Args:
         decoding_method (func): The decocding function for the values within the RDD.
         encoding_method (func): The encocding function for the values within the RDD.
+        batch_bytes (int, optional): If set, then each frame holds a batch of values instead
+            of a single one. ``decoding_method`` must then return a list of values and
+            ``encoding_method`` must accept one. When writing, the number of values per
+            frame is adjusted so that each frame is close to ``batch_bytes`` in size.
+            Default is, ``None``.
+        compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`, optional):
+            If set, then every frame is compressed when written and decompressed when read.
+            Default is, ``None``.
+        probe (bool, optional): If ``True``, a sample of each written frame is compressed first,
+            and the whole frame is only compressed if the sample shrank. Used for frames of
+            floating point tiles, which rarely compress. Default is, ``False``.
 
     Attributes:
         decoding_method (func): The decocding function for the values within the RDD.
         encoding_method (func): The encocding function for the values within the RDD.
+        batch_bytes (int): The target size of each frame in bytes. ``None`` if the
+            serializer is not batched.
+        compression (:class:`~geopyspark.geotrellis.framecompression.FrameCompression`): How
+            the frames are compressed. ``None`` if they are not.
+        probe (bool): Whether a sample of each written frame is compressed first.
     """
 
-    __slots__ = ['decoding_method', 'encoding_method']
+    __slots__ = ['decoding_method', 'encoding_method', 'batch_bytes', 'compression', 'probe']
 
-    def __init__(self, decoding_method, encoding_method):
+    def __init__(self, decoding_method, encoding_method, batch_bytes=None, compression=None,
+                 probe=False):
         FramedSerializer.__init__(self)
 
         self.decoding_method = decoding_method
         self.encoding_method = encoding_method
+        self.batch_bytes = batch_bytes
+        self.compression = compression
+        self.probe = probe
 
     @classmethod
-    def create_tuple_serializer(cls, key_type):
-        decoder = create_partial_tuple_decoder(key_type=key_type)
+    def create_tuple_serializer(cls, key_type, instants_as_millis=False):
+        decoder = create_partial_tuple_decoder(key_type=key_type,
+                                               instants_as_millis=instants_as_millis)
         encoder = create_partial_tuple_encoder(key_type=key_type)
 
         return cls(decoder, encoder)
 
+    @classmethod
+    def create_tuple_batch_serializer(cls, key_type, batch_bytes=DEFAULT_BATCH_BYTES,
+                                      instants_as_millis=False, compression=None, probe=False):
+        decoder = create_partial_tuple_batch_decoder(key_type=key_type,
+                                                     instants_as_millis=instants_as_millis)
+        encoder = create_partial_tuple_batch_encoder(key_type=key_type)
+
+        return cls(decoder, encoder, batch_bytes, compression, probe)
+
     @classmethod
     def create_value_serializer(cls, value_type):
         decoder = _get_decoder(value_type)
@@ -52,9 +90,22 @@ class ProtoBufSerializer(FramedSerializer):
 
         return cls(decoder, encoder)
 
+    @classmethod
+    def create_keyed_bytes_serializer(cls, key_type):
+        decoder = create_partial_keyed_bytes_decoder(key_type=key_type)
+        encoder = None
+
+        return cls(decoder, encoder)
+
     def _dumps(self, obj):
         return self.encoding_method(obj)
 
+    def _compress(self, encoded):
+        if self.compression:
+            return self.compression.compress(encoded, self.probe)
+
+        return encoded
+
     def dumps(self, obj):
         """Serialize an object into a byte array.
 
@@ -68,12 +119,55 @@ class ProtoBufSerializer(FramedSerializer):
             The byte array representation of the ``obj``.
         """
 
+        if self.batch_bytes:
+            if isinstance(obj, list):
+                return self._compress(self._dumps(obj))
+            else:
+                return self._compress(self._dumps([obj]))
+
         if isinstance(obj, list):
             for x in obj:
                 return self._dumps(x)
         else:
             return self._dumps(obj)
 
+    def dump_stream(self, iterator, stream):
+        """Serializes a stream of objects into frames.
+
+        If this serializer is batched, then the number of objects in each frame grows
+        or shrinks with the encoded size of the previous frame, in the same way as
+        ``pyspark.serializers.AutoBatchedSerializer``. The size used is the one before
+        compression.
+
+        Args:
+            iterator: The objects to be serialized.
+            stream: The stream the frames are written to.
+        """
+
+        if not self.batch_bytes:
+            return FramedSerializer.dump_stream(self, iterator, stream)
+
+        batch, best = 1, self.batch_bytes
+        iterator = iter(iterator)
+
+        while True:
+            values = list(itertools.islice(iterator, batch))
+
+            if not values:
+                break
+
+            encoded = self._dumps(values)
+            size = len(encoded)
+            frame = self._compress(encoded)
+
+            write_int(len(frame), stream)
+            stream.write(frame)
+
+            if size < best:
+                batch *= 2
+            elif size > best * 10 and batch > 1:
+                batch //= 2
+
     def loads(self, obj):
         """Deserializes a byte array into a collection of Python objects.
 
@@ -83,4 +177,11 @@ class ProtoBufSerializer(FramedSerializer):
         Returns:
             A list of deserialized objects.
         """
+
+        if self.compression:
+            obj = self.compression.decompress(obj)
+
+        if self.batch_bytes:
+            return self.decoding_method(obj)
+
         return [self.decoding_method(obj)]
@@ -1,8 +1,14 @@
 import os
 import math
+import threading
+import contextlib
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 import geopyspark as gps
-from geopyspark.geotrellis.constants import DEFAULT_MAX_TILE_SIZE
+from geopyspark.geotrellis.constants import DEFAULT_MAX_TILE_SIZE, LayerType, ResampleMethod, CellType
 
 try:
     import rasterio
@@ -10,11 +16,34 @@ except ImportError:
     raise ImportError("rasterio must be installed in order to use the features in the geopyspark.geotrellis.rasterio package")
 
 
-__all__ = ['get']
+__all__ = ['get', 'get_tiled', 'get_pyramid', 'DatasetCacheStats']
 
 # On driver
 _GDAL_DATA = os.environ.get("GDAL_DATA")
 
+# The number of threads each task uses to read windows
+_DEFAULT_MAX_WORKERS = 4
+
+# The number of datasets each Python worker keeps open between tasks
+_DEFAULT_MAX_OPEN_DATASETS = 32
+
+# The widths of the extents that GlobalLayouts span, by EPSG code
+_WORLD_WIDTHS = {
+    3857: 2 * 20037508.342789244,
+    4326: 360.0
+}
+
+# The CellTypes of the Tiles made by get_tiled, and the dtypes of their cells
+_TILE_CELL_TYPES = {
+    'BYTE': (CellType.INT8, 'int8'),
+    'UBYTE': (CellType.UINT8, 'uint8'),
+    'SHORT': (CellType.INT16, 'int16'),
+    'USHORT': (CellType.UINT16, 'uint16'),
+    'INT': (CellType.INT32, 'int32'),
+    'FLOAT': (CellType.FLOAT32, 'float32'),
+    'DOUBLE': (CellType.FLOAT64, 'float64')
+}
+
 def crs_to_proj4(crs):
     """Converts a ``rasterio.crsCRS`` to a proj4 str using osgeo library.
 
@@ -35,48 +64,409 @@ def crs_to_proj4(crs):
     proj4 = srs.ExportToProj4()
     return proj4
 
-def _read_windows(uri, xcols, ycols, bands, crs_to_proj4):
+# The proj4 strings of the CRSs of datasets, keyed by their WKT
+_proj4_strings = {}
+
+def _proj4(crs, crs_to_proj4):
+    """Returns the proj4 string of a CRS, only converting it the first time it is seen.
+
+    The strings are keyed by the WKT of the CRS alone, as crs_to_proj4 is a new function in
+    every task run on an executor.
+    """
+
+    key = crs.wkt if hasattr(crs, 'wkt') else str(crs)
+    proj4 = _proj4_strings.get(key)
 
+    if proj4 is None:
+        proj4 = _proj4_strings[key] = crs_to_proj4(crs)
+
+    return proj4
+
+def _set_gdal_data():
     if ("GDAL_DATA" not in os.environ) and (_GDAL_DATA is not None):
         os.environ["GDAL_DATA"] = _GDAL_DATA
 
-    with rasterio.open(uri) as dataset:
-        bounds = dataset.bounds
-        height = dataset.height
-        width = dataset.width
-        if rasterio.__version__ >= '1.0':
-            proj4 = crs_to_proj4(dataset.crs)
-        else:
-            proj4 = crs_to_proj4(dataset.get_crs())
-        nodata = dataset.nodata
-        tile_cols = (int)(math.ceil(width/xcols)) * xcols
-        tile_rows = (int)(math.ceil(height/ycols)) * ycols
-        windows = [((x, min(width-1, x + xcols)), (y, min(height-1, y + ycols)))
-                   for x in range(0, tile_cols, xcols)
-                   for y in range(0, tile_rows, ycols)]
-
-        for window in windows:
-            ((row_start, row_stop), (col_start, col_stop)) = window
-
-            left = bounds.left + (bounds.right - bounds.left)*(float(col_start)/width)
-            right = bounds.left + (bounds.right - bounds.left)*(float(col_stop)/ width)
-            bottom = bounds.top + (bounds.bottom - bounds.top)*(float(row_stop)/height)
-            top = bounds.top + (bounds.bottom - bounds.top)*(float(row_start)/height)
-            extent = gps.Extent(left, bottom, right, top)
-            projected_extent = gps.ProjectedExtent(extent=extent, proj4=proj4)
-
-            data = dataset.read(bands, window=window)
-            tile = gps.Tile.from_numpy_array(data, no_data_value=nodata)
-            yield (projected_extent, tile)
+
+class DatasetCacheStats(object):
+    """Counts how often the datasets read by :meth:`~geopyspark.geotrellis.rasterio.get` were
+    already open in the Python worker that read them.
+
+    The counts are kept in Spark accumulators, so they are only complete once an action
+    has been run on the RDD that used them.
+
+    Attributes:
+        hits (pyspark.Accumulator): The number of windows read from a dataset that was
+            already open.
+        misses (pyspark.Accumulator): The number of windows that needed a dataset to be opened.
+    """
+
+    def __init__(self):
+        pysc = gps.get_spark_context()
+
+        self.hits = pysc.accumulator(0)
+        self.misses = pysc.accumulator(0)
+
+    def add(self, hits, misses):
+        self.hits += hits
+        self.misses += misses
+
+    @property
+    def hit_rate(self):
+        """float: The fraction of windows read from a dataset that was already open. ``None``
+        if nothing has been read yet.
+        """
+
+        total = self.hits.value + self.misses.value
+
+        if not total:
+            return None
+
+        return self.hits.value / total
+
+    def __repr__(self):
+        return "DatasetCacheStats(hits={}, misses={}, hit_rate={})".format(
+            self.hits.value, self.misses.value, self.hit_rate)
+
+
+_DatasetInfo = collections.namedtuple("_DatasetInfo", 'width height count dtype crs transform nodata '
+                                                      'proj4 bounds res block_shapes overviews')
+
+
+class _DatasetCache(object):
+    """A process-local cache of open datasets and of the metadata read from their headers.
+
+    Python workers are reused between tasks, so the datasets opened by one task can be read
+    by the next one. A dataset can only be used by one thread at a time, so handles are
+    checked out while they are read and then returned. The least recently returned handles
+    are closed once more than ``max_size`` are open.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._idle = collections.OrderedDict()
+        self._idle_count = 0
+        self._infos = collections.OrderedDict()
+
+    def checkout(self, uri):
+        """Returns an open dataset for ``uri`` and whether it was already open."""
+
+        with self._lock:
+            handles = self._idle.get(uri)
+
+            if handles:
+                self._idle_count -= 1
+                dataset = handles.pop()
+
+                if not handles:
+                    del self._idle[uri]
+
+                return (dataset, True)
+
+        return (rasterio.open(uri), False)
+
+    def checkin(self, uri, dataset):
+        evicted = []
+
+        with self._lock:
+            self._idle.setdefault(uri, []).append(dataset)
+            self._idle.move_to_end(uri)
+            self._idle_count += 1
+
+            while self._idle_count > self.max_size:
+                (oldest, handles) = next(iter(self._idle.items()))
+                evicted.append(handles.pop(0))
+                self._idle_count -= 1
+
+                if not handles:
+                    del self._idle[oldest]
+
+        for handle in evicted:
+            handle.close()
+
+    def grow(self, max_size):
+        """Raises ``max_size`` to at least ``max_size``, so that tasks that share a process do
+        not shrink the cache for each other."""
+
+        with self._lock:
+            self.max_size = max(self.max_size, max_size)
+
+    def info(self, uri, crs_to_proj4):
+        """Returns the ``_DatasetInfo`` of ``uri``, reading its header if it is not cached."""
+
+        # Headers are cached by uri alone, as crs_to_proj4 is a new function in every task
+        # run on an executor
+        with self._lock:
+            if uri in self._infos:
+                self._infos.move_to_end(uri)
+                info = self._infos[uri]
+            else:
+                info = None
+
+        if info is not None:
+            return info._replace(proj4=_proj4(info.crs, crs_to_proj4))
+
+        (dataset, _) = self.checkout(uri)
+
+        try:
+            if rasterio.__version__ >= '1.0':
+                crs = dataset.crs
+                transform = dataset.transform
+            else:
+                crs = dataset.get_crs()
+                transform = dataset.affine
+
+            info = _DatasetInfo(dataset.width, dataset.height, dataset.count, dataset.dtypes[0],
+                                crs, transform, dataset.nodata,
+                                None, tuple(dataset.bounds), dataset.res,
+                                dataset.block_shapes, dataset.overviews(1))
+        finally:
+            self.checkin(uri, dataset)
+
+        with self._lock:
+            self._infos[uri] = info
+
+            while len(self._infos) > self.max_size * 8:
+                self._infos.popitem(last=False)
+
+        return info._replace(proj4=_proj4(info.crs, crs_to_proj4))
+
+    def clear(self):
+        with self._lock:
+            handles = [handle for handles in self._idle.values() for handle in handles]
+            self._idle.clear()
+            self._idle_count = 0
+            self._infos.clear()
+
+        for handle in handles:
+            handle.close()
+
+
+_datasets = _DatasetCache(_DEFAULT_MAX_OPEN_DATASETS)
+
+def _aligned_size(size, block, total):
+    """Returns the largest window size, no larger than ``size``, whose windows do not cross
+    the edges of the file's internal blocks.
+    """
+
+    # Blocks that span the whole file, such as strips, can not be aligned to
+    if block >= total:
+        return size
+    elif block <= size:
+        return size // block * block
+    else:
+        for count in range(int(math.ceil(block / size)), block + 1):
+            if block % count == 0:
+                return block // count
+
+def _overview_factor(info, resolution, resolution_crs):
+    """Returns the decimation factor of the coarsest overview of a dataset whose cells are
+    no larger than ``resolution``, or 1 if there is no such overview.
+    """
+
+    if not resolution:
+        return 1
+
+    if resolution_crs:
+        from rasterio.warp import transform_bounds
+
+        if isinstance(resolution_crs, int):
+            resolution_crs = "EPSG:{}".format(resolution_crs)
+
+        (left, _, right, _) = transform_bounds(info.crs, resolution_crs, *info.bounds)
+        cell_size = (right - left) / info.width
+    else:
+        cell_size = info.res[0]
+
+    # Allows for floating point error in cell sizes that should match exactly
+    factors = [factor for factor in info.overviews
+               if cell_size * factor <= resolution * (1 + 1e-6)]
+
+    return max(factors) if factors else 1
+
+def _plan_windows(uri, xcols, ycols, crs_to_proj4, resolution=None, resolution_crs=None):
+    """Reads the header of a dataset and returns the units of work needed to read it.
+
+    Each unit is a ``(uri, header, window)`` tuple where ``header`` is the
+    ``(proj4, nodata, transform, factor)`` of the dataset and ``window`` is a
+    ``(col_off, row_off, width, height)`` tuple aligned to the dataset's ``block_shapes``.
+    ``factor`` is the decimation of the overview that the windows are read from. Windows
+    are in the pixels of the full resolution image, and are aligned in those of the overview.
+    """
+
+    _set_gdal_data()
+
+    info = _datasets.info(uri, crs_to_proj4)
+    height = info.height
+    width = info.width
+    factor = _overview_factor(info, resolution, resolution_crs)
+    header = (info.proj4, info.nodata, info.transform, factor)
+    (block_rows, block_cols) = info.block_shapes[0]
+
+    # Overviews are assumed to have the same block size as the full resolution image,
+    # which is the case for Cloud Optimized GeoTiffs
+    overview_width = int(math.ceil(width / factor))
+    overview_height = int(math.ceil(height / factor))
+    window_cols = _aligned_size(xcols, block_cols, overview_width)
+    window_rows = _aligned_size(ycols, block_rows, overview_height)
+
+    return [(uri, header, (col * factor,
+                           row * factor,
+                           min(window_cols * factor, width - col * factor),
+                           min(window_rows * factor, height - row * factor)))
+            for row in range(0, overview_height, window_rows)
+            for col in range(0, overview_width, window_cols)]
+
+def _window_bytes(info, window, factor, bands):
+    """Returns the number of bytes of the cells read for a window of a dataset."""
+
+    (_, _, width, height) = window
+
+    if bands is None:
+        band_count = info.count
+    elif isinstance(bands, int):
+        band_count = 1
+    else:
+        band_count = len(bands)
+
+    return (int(math.ceil(width / factor)) * int(math.ceil(height / factor)) *
+            band_count * np.dtype(info.dtype).itemsize)
+
+def _pack_units(units, sizes, partition_bytes):
+    """Packs units into partitions of at most ``partition_bytes``, keeping them in order so
+    that the windows of a file are read by as few tasks as possible. Units that are larger
+    than ``partition_bytes`` are given a partition of their own.
+    """
+
+    partitions = []
+    partition = []
+    partition_size = 0
+
+    for (unit, size) in zip(units, sizes):
+        if partition and partition_size + size > partition_bytes:
+            partitions.append(partition)
+            partition = []
+            partition_size = 0
+
+        partition.append(unit)
+        partition_size += size
+
+    if partition:
+        partitions.append(partition)
+
+    return partitions
+
+def _read_window(dataset, header, window, bands):
+    (proj4, nodata, transform, factor) = header
+    (col, row, width, height) = window
+
+    (left, top) = transform * (col, row)
+    (right, bottom) = transform * (col + width, row + height)
+    extent = gps.Extent(min(left, right), min(bottom, top), max(left, right), max(bottom, top))
+    projected_extent = gps.ProjectedExtent(extent=extent, proj4=proj4)
+
+    if factor > 1:
+        # GDAL reads decimated windows from the matching overview
+        out_shape = (int(math.ceil(height / factor)), int(math.ceil(width / factor)))
+
+        if bands is None:
+            out_shape = (dataset.count,) + out_shape
+        elif not isinstance(bands, int):
+            out_shape = (len(bands),) + out_shape
+
+        data = dataset.read(bands, window=((row, row + height), (col, col + width)), out_shape=out_shape)
+    else:
+        data = dataset.read(bands, window=((row, row + height), (col, col + width)))
+    tile = gps.Tile.from_numpy_array(data, no_data_value=nodata)
+    return (projected_extent, tile)
+
+def _read_in_threads(read, units, max_workers, max_open_datasets, cache_stats):
+    """Calls ``read(unit, checkout)`` on each unit with a pool of threads, yielding the
+    results in the same order as the units.
+
+    ``checkout(uri)`` is a context manager that takes a dataset from the process-local dataset
+    cache, and returns it once the block ends. At most ``2 * max_workers`` units are read
+    ahead of the consumer.
+    """
+
+    _set_gdal_data()
+    _datasets.grow(max_open_datasets)
+
+    # Accumulators are not thread-safe, so the counts are added to them once at the end
+    counts = collections.Counter()
+    lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def checkout(uri):
+        (dataset, hit) = _datasets.checkout(uri)
+
+        with lock:
+            counts['hits' if hit else 'misses'] += 1
+
+        try:
+            yield dataset
+        finally:
+            _datasets.checkin(uri, dataset)
+
+    pending = collections.deque()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for unit in units:
+                pending.append(pool.submit(read, unit, checkout))
+
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        if cache_stats:
+            cache_stats.add(counts['hits'], counts['misses'])
+
+def _read_units(units, bands, max_workers, max_open_datasets=_DEFAULT_MAX_OPEN_DATASETS,
+                cache_stats=None):
+    """Reads units made by ``_plan_windows`` with a pool of threads, yielding the
+    ``(ProjectedExtent, Tile)`` tuples in the same order as the units.
+    """
+
+    def read(unit, checkout):
+        (uri, header, window) = unit
+
+        with checkout(uri) as dataset:
+            return _read_window(dataset, header, window, bands)
+
+    return _read_in_threads(read, units, max_workers, max_open_datasets, cache_stats)
 
 def get(data_source,
         xcols=DEFAULT_MAX_TILE_SIZE,
         ycols=DEFAULT_MAX_TILE_SIZE,
         bands=None,
-        crs_to_proj4=crs_to_proj4):
+        crs_to_proj4=crs_to_proj4,
+        num_partitions=None,
+        max_workers=_DEFAULT_MAX_WORKERS,
+        resolution=None,
+        resolution_crs=None,
+        max_open_datasets=_DEFAULT_MAX_OPEN_DATASETS,
+        cache_stats=None,
+        partition_bytes=None):
     """Creates an ``RDD`` of windows represented as the key value pair: ``(ProjectedExtent, Tile)``
     from URIs using rasterio.
 
+    The header of each file is read first, and its windows are aligned to the file's internal
+    blocks so that no window crosses the edge of a block. A block is then decoded once, unless
+    it is larger than the windows, in which case it is split between several windows which
+    each decode it. The windows are then spread across the partitions, so a single large file
+    is read by many tasks. Within a task, windows are read by a pool of threads.
+
+    Each Python process keeps the datasets it opened, and the metadata read from their
+    headers, in a bounded cache. Tasks that run in a reused Python worker
+    (``spark.python.worker.reuse``) read from those datasets without opening them again.
+
+    Note:
+        When ``data_source`` is a list of URIs, the headers are read on the driver. When it
+        is an ``RDD``, they are read on the executors.
+
     Args:
         data_source (str or [str] or RDD): The source of the data to be windowed.
             Can either be URI or list of URIs which point to where the source data can be found;
@@ -91,19 +481,416 @@ def get(data_source,
             of ``int``\s. Defaults to ``None`` which causes all bands to be read.
         crs_to_proj4 (``rasterio.crs.CRS`` => str, optional) A funtion that takes a :class:`rasterio.crs.CRS`
             and returns a Proj4 string. Default is :func:`geopyspark.geotrellis.rasterio.crs_to_proj4`.
+        num_partitions (int, optional): The number of partitions the windows are read in. If
+            ``None`` and ``data_source`` is a list of URIs, then the greater of the number of
+            URIs and the default parallelism of the ``SparkContext`` is used, up to the number
+            of windows. If ``None`` and ``data_source`` is an ``RDD``, then its partitioning
+            is kept.
+        max_workers (int, optional): The number of threads each task uses to read windows.
+            Default is, 4.
+        resolution (float, optional): If set, each file is read from its coarsest overview
+            whose cells are no larger than ``resolution``. Files without such an overview are
+            read at full resolution. Default is, ``None``, which reads every file at full
+            resolution.
+        resolution_crs (str or int, optional): The CRS that ``resolution`` is in, given as
+            anything ``rasterio`` accepts as a CRS, or as an EPSG code. If ``None``, then
+            ``resolution`` is in the units of each file's own CRS. Default is, ``None``.
+        max_open_datasets (int, optional): The number of datasets each Python process keeps
+            open between reads. Default is, 32.
+        cache_stats (:class:`~geopyspark.geotrellis.rasterio.DatasetCacheStats`, optional): If
+            set, counts how many windows were read from datasets that were already open.
+            Default is, ``None``.
+        partition_bytes (int, optional): If set, and ``num_partitions`` is not, the windows
+            are packed into partitions that each read about this many bytes of cells, as
+            computed from the headers of the files. Large files are then spread over many
+            partitions while small ones share them. Only used when ``data_source`` is a list
+            of URIs. Default is, ``None``.
 
     Returns:
         RDD
     """
 
     pysc = gps.get_spark_context()
+    plan = lambda uri: _plan_windows(uri, xcols, ycols, crs_to_proj4, resolution, resolution_crs)
 
     if isinstance(data_source, (list, str)):
         if isinstance(data_source, str):
             data_source = [data_source]
 
-        return pysc.\
-                parallelize(data_source, len(data_source)).\
-                flatMap(lambda ds: _read_windows(ds, xcols, ycols, bands, crs_to_proj4))
+        units = [unit for uri in data_source for unit in plan(uri)]
+
+        if partition_bytes and not num_partitions:
+            infos = {uri: _datasets.info(uri, crs_to_proj4) for uri in data_source}
+            sizes = [_window_bytes(infos[uri], window, factor, bands)
+                     for (uri, (_, _, _, factor), window) in units]
+            partitions = _pack_units(units, sizes, partition_bytes)
+
+            # Each partition is given its own slice, and then flattened back into units
+            units = pysc.parallelize(partitions, max(len(partitions), 1)).flatMap(lambda units: units)
+        else:
+            if not num_partitions:
+                num_partitions = min(len(units), max(len(data_source), pysc.defaultParallelism))
+
+            units = pysc.parallelize(units, max(num_partitions, 1))
+    else:
+        units = data_source.flatMap(plan)
+
+        if num_partitions:
+            units = units.repartition(num_partitions)
+
+    return units.mapPartitions(
+        lambda part: _read_units(part, bands, max_workers, max_open_datasets, cache_stats))
+
+def _to_rasterio_crs(crs):
+    from rasterio.crs import CRS
+
+    if isinstance(crs, int):
+        return CRS.from_epsg(crs)
+    else:
+        return CRS.from_string(crs)
+
+def _same_nodata(left, right):
+    if left is None or right is None:
+        return left is right
+
+    return left == right or (math.isnan(left) and math.isnan(right))
+
+def _tile_spans(start, end, cell_size, tile_size, count):
+    """Returns the ``(index, first, last)`` spans of the tiles, along one axis of a layout, that
+    have pixels whose centers are between ``start`` and ``end``. ``start`` and ``end`` are in
+    pixels of the layout, and ``first`` and ``last`` are pixels of the tile.
+    """
+
+    first_pixel = max(int(math.ceil(start / cell_size - 0.5)), 0)
+    last_pixel = min(int(math.ceil(end / cell_size - 0.5)), tile_size * count)
+
+    if last_pixel <= first_pixel:
+        return []
+
+    return [(index,
+             max(first_pixel - index * tile_size, 0),
+             min(last_pixel - index * tile_size, tile_size))
+            for index in range(first_pixel // tile_size, (last_pixel - 1) // tile_size + 1)]
+
+def _plan_tiles(uri, info, layout_definition):
+    """Returns the ``(SpatialKey, (uri, window, target))`` parts of the tiles of a layout that
+    cover a dataset.
+
+    ``window`` is the ``(col_off, row_off, width, height)`` of the dataset's pixels that are read
+    for the tile, and ``target`` is the ``(col_min, row_min, col_max, row_max)`` of the tile's
+    pixels that they are resampled to. When the cells of the dataset and of the layout are the
+    same size and aligned, the two are the same size.
+    """
+
+    transform = info.transform
+
+    if transform.b or transform.d:
+        raise ValueError("Rotated rasters can not be read into a layout. Recieved", uri)
+
+    (extent, tile_layout) = layout_definition
+    cell_width = (extent.xmax - extent.xmin) / (tile_layout.layoutCols * tile_layout.tileCols)
+    cell_height = (extent.ymax - extent.ymin) / (tile_layout.layoutRows * tile_layout.tileRows)
+    (left, bottom, right, top) = info.bounds
+    (res_x, res_y) = (transform.a, -transform.e)
+
+    col_spans = _tile_spans(left - extent.xmin, right - extent.xmin,
+                            cell_width, tile_layout.tileCols, tile_layout.layoutCols)
+    row_spans = _tile_spans(extent.ymax - top, extent.ymax - bottom,
+                            cell_height, tile_layout.tileRows, tile_layout.layoutRows)
+
+    def window(start, end, cell_size, origin, res, total):
+        # Rounding only moves the window when the cells of the dataset and layout differ
+        first = int(round((start * cell_size - origin) / res))
+        last = int(round((end * cell_size - origin) / res))
+
+        first = min(max(first, 0), total - 1)
+        return (first, max(min(last, total), first + 1))
+
+    parts = []
+
+    for (row, row_min, row_max) in row_spans:
+        (row_off, row_end) = window(row * tile_layout.tileRows + row_min,
+                                    row * tile_layout.tileRows + row_max,
+                                    cell_height, extent.ymax - top, res_y, info.height)
+
+        for (col, col_min, col_max) in col_spans:
+            (col_off, col_end) = window(col * tile_layout.tileCols + col_min,
+                                        col * tile_layout.tileCols + col_max,
+                                        cell_width, left - extent.xmin, res_x, info.width)
+
+            parts.append((gps.SpatialKey(col, row),
+                          (uri,
+                           (col_off, row_off, col_end - col_off, row_end - row_off),
+                           (col_min, row_min, col_max, row_max))))
+
+    return parts
+
+def _read_tiles(units, bands, tile_shape, cell_type, nodata, max_workers,
+                max_open_datasets=_DEFAULT_MAX_OPEN_DATASETS, cache_stats=None):
+    """Reads units made by ``get_tiled`` with a pool of threads, yielding the
+    ``(SpatialKey, Tile)`` tuples in the same order as the units.
+
+    Where the parts of a tile overlap, the cells of the later datasets are only used where
+    they are not NoData.
+    """
+
+    (_, dtype) = _TILE_CELL_TYPES[cell_type]
+
+    def read(unit, checkout):
+        (key, parts) = unit
+        cells = np.full((len(bands),) + tile_shape, 0 if nodata is None else nodata, dtype=dtype)
+
+        for (uri, (col, row, width, height), (col_min, row_min, col_max, row_max)) in parts:
+            with checkout(uri) as dataset:
+                data = dataset.read(bands,
+                                    window=((row, row + height), (col, col + width)),
+                                    out_shape=(len(bands), row_max - row_min, col_max - col_min))
+
+            target = cells[:, row_min:row_max, col_min:col_max]
+
+            if nodata is None or len(parts) == 1:
+                target[:] = data
+            else:
+                valid = ~np.isnan(data) if math.isnan(nodata) else data != nodata
+                target[valid] = data[valid]
+
+        return (key, gps.Tile(cells, cell_type, nodata))
+
+    return _read_in_threads(read, units, max_workers, max_open_datasets, cache_stats)
+
+def _global_zoom(layout, crs, res):
+    """Returns the zoom of a ``GlobalLayout`` whose cells are closest to ``res``, snapping to
+    the coarser zoom when within the layout's ``threshold``, as GeoTrellis does.
+    """
+
+    world = gps.KeyTransform(layout._replace(zoom=1), crs=crs).layout.extent
+    level = max(math.log((world.xmax - world.xmin) / (res[0] * layout.tile_size), 2),
+                math.log((world.ymax - world.ymin) / (res[1] * layout.tile_size), 2))
+
+    if level - math.floor(level) <= layout.threshold:
+        return max(int(math.floor(level)), 0)
     else:
-        return data_source.flatMap(lambda ds: _read_windows(ds, xcols, ycols, bands, crs_to_proj4))
+        return max(int(math.ceil(level)), 0)
+
+def get_tiled(data_source,
+              layout,
+              crs=None,
+              bands=None,
+              crs_to_proj4=crs_to_proj4,
+              num_partitions=None,
+              max_workers=_DEFAULT_MAX_WORKERS,
+              max_open_datasets=_DEFAULT_MAX_OPEN_DATASETS,
+              cache_stats=None):
+    """Creates a ``TiledRasterLayer`` from URIs using rasterio, by reading the pixels of each
+    tile of ``layout`` straight from the files.
+
+    This is the same as reading the files with :meth:`~geopyspark.geotrellis.rasterio.get`
+    and calling :meth:`~geopyspark.geotrellis.layer.RasterLayer.tile_to_layout`, but the
+    ``LayoutDefinition`` is computed on the driver from the headers of the files, so every
+    tile is read by a single task and no shuffle is needed. Tiles that span several files
+    are read from all of them by the same task.
+
+    The files are not reprojected, so they must all be in ``crs``. When their cells are not
+    the same size as those of the layout, they are resampled using the nearest neighbor, and
+    GDAL reads them from the closest overview if they have any.
+
+    Note:
+        The headers of the files are read on the driver. All of the files must have the same
+        data type, number of bands, and NoData value.
+
+    Args:
+        data_source (str or [str]): The URI or list of URIs which point to where the source
+            data can be found.
+        layout (:class:`~geopyspark.geotrellis.LayoutDefinition` or
+            :class:`~geopyspark.geotrellis.GlobalLayout` or :class:`~geopyspark.geotrellis.LocalLayout`):
+            The layout of the layer. A ``LocalLayout`` spans the files, and has cells the size
+            of those of the first file. If a ``GlobalLayout`` has no ``zoom``, then the zoom
+            whose cells are closest to those of the first file is used.
+        crs (str or int, optional): The CRS of the files, given as anything ``rasterio``
+            accepts as a CRS, or as an EPSG code. If ``None``, then the CRS of the first file
+            is used. Default is, ``None``.
+        bands ([int], opitonal): The bands to read given as a list of ``int``\s. Defaults to
+            ``None`` which causes all bands to be read.
+        crs_to_proj4 (``rasterio.crs.CRS`` => str, optional) A funtion that takes a :class:`rasterio.crs.CRS`
+            and returns a Proj4 string. Default is :func:`geopyspark.geotrellis.rasterio.crs_to_proj4`.
+        num_partitions (int, optional): The number of partitions the tiles are read in. If
+            ``None``, then the greater of the number of URIs and the default parallelism of
+            the ``SparkContext`` is used, up to the number of tiles.
+        max_workers (int, optional): The number of threads each task uses to read tiles.
+            Default is, 4.
+        max_open_datasets (int, optional): The number of datasets each Python process keeps
+            open between reads. Default is, 32.
+        cache_stats (:class:`~geopyspark.geotrellis.rasterio.DatasetCacheStats`, optional): If
+            set, counts how many reads were from datasets that were already open.
+            Default is, ``None``.
+
+    Returns:
+        :class:`~geopyspark.geotrellis.layer.TiledRasterLayer`
+
+    Raises:
+        ValueError: If a file is not in ``crs``, is rotated, or differs from the others in
+            its data type, number of bands, or NoData value.
+    """
+
+    pysc = gps.get_spark_context()
+    _set_gdal_data()
+
+    if isinstance(data_source, str):
+        data_source = [data_source]
+
+    infos = [_datasets.info(uri, crs_to_proj4) for uri in data_source]
+    first = infos[0]
+
+    target_crs = _to_rasterio_crs(crs) if crs is not None else first.crs
+
+    for (uri, info) in zip(data_source, infos):
+        if info.crs != target_crs:
+            raise ValueError("The files must be in the target CRS, use get and tile_to_layout to reproject them.",
+                             "Recieved", uri, "in", info.proj4, "instead.")
+
+        if (info.count, info.dtype) != (first.count, first.dtype) or not _same_nodata(info.nodata, first.nodata):
+            raise ValueError("The files must all have the same data type, band count, and NoData value.",
+                             "Recieved", uri, "with", (info.count, info.dtype, info.nodata), "instead.")
+
+    if bands is None:
+        bands = list(range(1, first.count + 1))
+    elif isinstance(bands, int):
+        bands = [bands]
+
+    extent = gps.Extent(min(info.bounds[0] for info in infos), min(info.bounds[1] for info in infos),
+                        max(info.bounds[2] for info in infos), max(info.bounds[3] for info in infos))
+
+    if isinstance(layout, gps.GlobalLayout) and layout.zoom is None:
+        layout = layout._replace(zoom=_global_zoom(layout, crs or first.proj4, first.res))
+
+    if isinstance(layout, gps.LocalLayout):
+        layout_definition = gps.KeyTransform(layout, extent=extent, cellsize=first.res).layout
+    else:
+        layout_definition = gps.KeyTransform(layout, crs=crs or first.proj4).layout
+
+    tiles = collections.OrderedDict()
+
+    for (uri, info) in zip(data_source, infos):
+        for (key, part) in _plan_tiles(uri, info, layout_definition):
+            tiles.setdefault(key, []).append(part)
+
+    units = list(tiles.items())
+
+    if not units:
+        raise ValueError("The files do not overlap the layout", layout_definition.extent)
+
+    cell_type = gps.Tile.dtype_to_cell_type(np.dtype(first.dtype))
+    (base_cell_type, _) = _TILE_CELL_TYPES[cell_type]
+    nodata = first.nodata
+
+    if nodata is None:
+        metadata_cell_type = base_cell_type.value + "raw"
+    elif math.isnan(nodata):
+        metadata_cell_type = base_cell_type.value
+    else:
+        if base_cell_type not in (CellType.FLOAT32, CellType.FLOAT64):
+            nodata = int(nodata)
+
+        metadata_cell_type = CellType.create_user_defined_celltype(base_cell_type, nodata)
+
+    tile_layout = layout_definition.tileLayout
+    tile_shape = (tile_layout.tileRows, tile_layout.tileCols)
+
+    metadata = {
+        'cellType': metadata_cell_type,
+        'extent': extent._asdict(),
+        'crs': first.proj4,
+        'bounds': {
+            'minKey': {'col': min(key.col for key in tiles), 'row': min(key.row for key in tiles)},
+            'maxKey': {'col': max(key.col for key in tiles), 'row': max(key.row for key in tiles)}},
+        'layoutDefinition': {
+            'extent': layout_definition.extent._asdict(),
+            'tileLayout': tile_layout._asdict()}}
+
+    if not num_partitions:
+        num_partitions = min(len(units), max(len(data_source), pysc.defaultParallelism))
+
+    rdd = pysc.parallelize(units, num_partitions).mapPartitions(
+        lambda part: _read_tiles(part, bands, tile_shape, cell_type, nodata, max_workers,
+                                 max_open_datasets, cache_stats))
+
+    zoom = layout.zoom if isinstance(layout, gps.GlobalLayout) else None
+
+    return gps.TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd, metadata, zoom_level=zoom)
+
+def get_pyramid(data_source,
+                max_zoom,
+                min_zoom=0,
+                tile_size=256,
+                target_crs=3857,
+                bands=None,
+                crs_to_proj4=crs_to_proj4,
+                resample_method=ResampleMethod.NEAREST_NEIGHBOR,
+                num_partitions=None,
+                max_workers=_DEFAULT_MAX_WORKERS,
+                partition_bytes=None):
+    """Creates a ``Pyramid`` from URIs using rasterio, where each level is read from the
+    overviews of the files closest to its resolution.
+
+    Unlike :meth:`~geopyspark.geotrellis.layer.TiledRasterLayer.pyramid`, the lower levels are
+    not resampled from the full resolution layer. Instead, the files are read again for each
+    level at the resolution of that level's zoom, so files with internal overviews, such as
+    Cloud Optimized GeoTiffs, only have their small overviews read for the coarse levels.
+
+    Args:
+        data_source (str or [str] or RDD): The source of the data. Can either be URI or list
+            of URIs which point to where the source data can be found; or it can be an ``RDD``
+            that contains the URIs.
+        max_zoom (int): The zoom of the highest resolution level of the ``Pyramid``.
+        min_zoom (int, optional): The zoom of the lowest resolution level of the ``Pyramid``.
+            Default is, 0.
+        tile_size (int, optional): The number of columns and rows of pixels in each tile.
+            Default is, 256.
+        target_crs (int, optional): The EPSG code of the CRS of the ``Pyramid``. Either 3857
+            or 4326. Default is, 3857.
+        bands ([int], opitonal): The bands to read given as a list of ``int``\s. Defaults to
+            ``None`` which causes all bands to be read.
+        crs_to_proj4 (``rasterio.crs.CRS`` => str, optional) A funtion that takes a :class:`rasterio.crs.CRS`
+            and returns a Proj4 string. Default is :func:`geopyspark.geotrellis.rasterio.crs_to_proj4`.
+        resample_method (str or :class:`~geopyspark.geotrellis.constants.ResampleMethod`, optional):
+            The resample method used when tiling each level to its layout.
+            Default is, ``ResampleMethods.NEAREST_NEIGHBOR``.
+        num_partitions (int, optional): The number of partitions each level is read in.
+            See :meth:`~geopyspark.geotrellis.rasterio.get`.
+        max_workers (int, optional): The number of threads each task uses to read windows.
+            Default is, 4.
+        partition_bytes (int, optional): The number of bytes of cells each partition of a
+            level reads. See :meth:`~geopyspark.geotrellis.rasterio.get`.
+
+    Returns:
+        :class:`~geopyspark.geotrellis.layer.Pyramid`
+
+    Raises:
+        ValueError: If ``target_crs`` is not 3857 or 4326.
+    """
+
+    if target_crs not in _WORLD_WIDTHS:
+        raise ValueError("target_crs must be one of", list(_WORLD_WIDTHS.keys()), "Recieved", target_crs, "instead.")
+
+    levels = []
+
+    for zoom in range(min_zoom, max_zoom + 1):
+        resolution = _WORLD_WIDTHS[target_crs] / (tile_size * 2 ** zoom)
+
+        rdd = get(data_source,
+                  xcols=tile_size,
+                  ycols=tile_size,
+                  bands=bands,
+                  crs_to_proj4=crs_to_proj4,
+                  num_partitions=num_partitions,
+                  max_workers=max_workers,
+                  resolution=resolution,
+                  resolution_crs=target_crs,
+                  partition_bytes=partition_bytes)
+
+        raster_layer = gps.RasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd)
+        levels.append(raster_layer.tile_to_layout(gps.GlobalLayout(tile_size, zoom=zoom),
+                                                  target_crs=target_crs,
+                                                  resample_method=resample_method))
+
+    return gps.Pyramid(levels)
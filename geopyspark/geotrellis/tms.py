@@ -1,14 +1,307 @@
 import io
+import os
+import math
+import uuid
 import socket
+import sqlite3
+import weakref
+import threading
+import multiprocessing
+from collections import namedtuple
 import numpy as np
 
 from geopyspark import get_spark_context, _ensure_callback_gateway_initialized
+from geopyspark.geotrellis import catalog
 from geopyspark.geotrellis.color import ColorMap
-from geopyspark.geotrellis.layer import Pyramid
+from geopyspark.geotrellis.constants import LayerType
+from geopyspark.geotrellis.layer import Pyramid, TiledRasterLayer
 from geopyspark.geotrellis.protobufcodecs import multibandtile_decoder
 
 
-__all__ = ['TileRender', 'TMS']
+__all__ = ['TileRender', 'TMS', 'RenderedTileCache', 'RenderedTileCacheStats']
+
+
+"""The ids of the sources and displays that rendered tiles are cached under"""
+_cache_ids = weakref.WeakKeyDictionary()
+
+"""Returned to the JVM in place of an image when the render processes are all busy"""
+_BUSY = b''
+
+"""The render function of a render process"""
+_process_render_function = None
+
+
+def _encode_image(image):
+    # Render functions, such as NumpyColorMap, may encode the image themselves
+    if isinstance(image, (bytes, bytearray)):
+        return bytes(image)
+
+    bio = io.BytesIO()
+    image.save(bio, 'PNG')
+    return bio.getvalue()
+
+
+def _cache_id(obj):
+    """Returns the id that the rendered tiles of a source or display are cached under."""
+
+    if isinstance(obj, tuple):
+        return "catalog:{}:{}".format(*obj)
+
+    try:
+        return _cache_ids.setdefault(obj, str(uuid.uuid4()))
+    except TypeError:
+        # Objects that cannot be weakly referenced are never shared between servers
+        return str(uuid.uuid4())
+
+
+class RenderedTileCacheStats(namedtuple("RenderedTileCacheStats", 'hits misses evictions size_bytes')):
+    """The statistics of a :class:`~geopyspark.geotrellis.tms.RenderedTileCache`.
+
+    Attributes:
+        hits (int): The number of requests that were served from the cache.
+        misses (int): The number of requests whose tile had to be rendered.
+        evictions (int): The number of images that were removed from memory to stay within the
+            cache's size.
+        size_bytes (int): The total size of the images in memory.
+    """
+
+    __slots__ = []
+
+    @property
+    def hit_rate(self):
+        """float: The fraction of requests that were served from the cache. ``None`` if nothing
+        has been requested yet.
+        """
+
+        total = self.hits + self.misses
+
+        if not total:
+            return None
+
+        return self.hits / total
+
+
+class RenderedTileCache(object):
+    """A least recently used cache of the PNGs rendered by TMS servers.
+
+    Images are cached by the source, display, zoom, x and y of the tile, so a cache can be shared
+    between servers. Cached images are served with ``ETag`` and ``Last-Modified`` headers, so
+    browsers and proxies can revalidate them without the tile being sent again.
+
+    Note:
+        Images are cached until they are evicted or invalidated. If a source changes, its
+        images need to be invalidated with
+        :meth:`~geopyspark.geotrellis.tms.RenderedTileCache.invalidate` or
+        :meth:`~geopyspark.geotrellis.tms.TMS.invalidate`.
+
+    Args:
+        max_bytes (int, optional): The most bytes of images that are kept in memory.
+            Default is, 256 MiB.
+        spill_directory (str, optional): A local directory that images evicted from memory are
+            written to, and read back from. It should not be used for anything else.
+            If ``None``, evicted images are dropped. Default is, ``None``.
+
+    Attributes:
+        max_bytes (int): The most bytes of images that are kept in memory.
+        spill_directory (str): The directory that evicted images are written to.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, spill_directory=None):
+        self.max_bytes = max_bytes
+        self.spill_directory = spill_directory
+
+        pysc = get_spark_context()
+        self.cache = pysc._jvm.geopyspark.geotrellis.tms.RenderedTileCache(max_bytes, spill_directory)
+
+    def invalidate(self, source=None, zoom=None):
+        """Drops the cached images of a source.
+
+        Args:
+            source ((str, str) or :class:`~geopyspark.geotrellis.layer.Pyramid`, optional): A
+                source given to :meth:`~geopyspark.geotrellis.tms.TMS.build`. If ``None``, the
+                images of every source are dropped.
+            zoom (int, optional): The zoom level whose images are dropped. If ``None``, every
+                zoom level is dropped.
+        """
+
+        self.cache.invalidate(_cache_id(source) if source is not None else None, None, zoom)
+
+    def clear(self):
+        """Drops every cached image, including those in the spill directory."""
+
+        self.cache.clear()
+
+    def stats(self):
+        """Returns the statistics of the cache.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.tms.RenderedTileCacheStats`
+        """
+
+        return RenderedTileCacheStats(*self.cache.stats())
+
+    def __repr__(self):
+        return "RenderedTileCache(max_bytes={}, spill_directory={})".format(self.max_bytes,
+                                                                           self.spill_directory)
+
+
+def _init_render_process(render_function):
+    global _process_render_function
+    _process_render_function = render_function
+
+
+def _render_in_process(encoded):
+    if isinstance(encoded, list):
+        tiles = [multibandtile_decoder(tile) for tile in encoded]
+    else:
+        tiles = multibandtile_decoder(encoded)
+
+    return _encode_image(_process_render_function(tiles))
+
+
+class _RenderPool(object):
+    """A pool of processes that run a render function, so that renders are not serialized by the
+    GIL of the driver's Python process.
+
+    The processes are started when the pool is made, rather than in the thread of the first
+    render, and are spawned by default since forking the driver, which runs many threads, can
+    deadlock them. At most ``processes + queue_depth`` renders are accepted at a time, further
+    ones are rejected.
+    """
+
+    def __init__(self, render_function, processes, queue_depth=None, start_method='spawn'):
+        self.render_function = render_function
+        self.processes = processes
+        self.queue_depth = queue_depth if queue_depth is not None else processes
+        self.start_method = start_method
+        self.rejected = 0
+
+        self._slots = threading.BoundedSemaphore(self.processes + self.queue_depth)
+        self._lock = threading.Lock()
+        self._pool = None
+
+        self.start()
+
+    def start(self):
+        """Starts the processes if they are not running, and returns the pool."""
+
+        with self._lock:
+            if self._pool is None:
+                if self.start_method:
+                    context = multiprocessing.get_context(self.start_method)
+                else:
+                    context = multiprocessing
+
+                self._pool = context.Pool(self.processes, _init_render_process, (self.render_function,))
+
+            return self._pool
+
+    def render(self, encoded):
+        """Renders encoded tiles in one of the processes.
+
+        Returns:
+            bytes: The image, or ``_BUSY`` if the pool had no capacity left.
+        """
+
+        if not self._slots.acquire(False):
+            with self._lock:
+                self.rejected += 1
+
+            return _BUSY
+
+        try:
+            return self.start().apply(_render_in_process, (encoded,))
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+
+def _is_empty_tile(tile):
+    """Returns whether every cell of a tile is NoData."""
+
+    cells = tile.cells
+
+    if cells.dtype.kind == 'f':
+        empty = np.isnan(cells)
+
+        if tile.no_data_value is not None and not math.isnan(tile.no_data_value):
+            empty |= cells == tile.no_data_value
+
+        return bool(empty.all())
+    elif tile.no_data_value is None:
+        return False
+    else:
+        return bool((cells == tile.no_data_value).all())
+
+
+def _seed_key_bounds(layout_definition, bbox):
+    """Returns the (col_min, row_min, col_max, row_max) of the tiles that intersect bbox."""
+
+    (xmin, ymin, xmax, ymax) = bbox.bounds if hasattr(bbox, 'bounds') else bbox
+    extent = layout_definition.extent
+    tile_layout = layout_definition.tileLayout
+
+    tile_width = (extent.xmax - extent.xmin) / tile_layout.layoutCols
+    tile_height = (extent.ymax - extent.ymin) / tile_layout.layoutRows
+
+    return (max(int(math.floor((xmin - extent.xmin) / tile_width)), 0),
+            max(int(math.floor((extent.ymax - ymax) / tile_height)), 0),
+            min(int(math.ceil((xmax - extent.xmin) / tile_width)), tile_layout.layoutCols) - 1,
+            min(int(math.ceil((extent.ymax - ymin) / tile_height)), tile_layout.layoutRows) - 1)
+
+
+class _DirectoryTileWriter(object):
+    """Writes tiles to a z/x/y.png directory tree."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, zoom, col, row, png):
+        directory = os.path.join(self.path, str(zoom), str(col))
+        os.makedirs(directory, exist_ok=True)
+
+        with open(os.path.join(directory, "{}.png".format(row)), 'wb') as f:
+            f.write(png)
+
+    def close(self):
+        pass
+
+
+class _MBTilesWriter(object):
+    """Writes tiles to an MBTiles file, whose rows count from the bottom of the layout."""
+
+    def __init__(self, path, name):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, tile_column INTEGER,
+                                              tile_row INTEGER, tile_data BLOB);
+            CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+        """)
+        self.name = name
+
+    def write(self, zoom, col, row, png):
+        self.connection.execute("INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)",
+                                (zoom, col, (1 << zoom) - 1 - row, sqlite3.Binary(png)))
+
+    def close(self):
+        metadata = {'name': self.name, 'format': 'png', 'type': 'overlay'}
+        (min_zoom, max_zoom) = self.connection.execute(
+            "SELECT MIN(zoom_level), MAX(zoom_level) FROM tiles").fetchone()
+
+        if min_zoom is not None:
+            metadata.update({'minzoom': str(min_zoom), 'maxzoom': str(max_zoom)})
+
+        self.connection.execute("DELETE FROM metadata WHERE name IN ({})".format(
+            ", ".join("?" * len(metadata))), list(metadata))
+        self.connection.executemany("INSERT INTO metadata VALUES (?, ?)", list(metadata.items()))
+        self.connection.commit()
+        self.connection.close()
 
 
 class TileRender(object):
@@ -17,17 +310,36 @@ class TileRender(object):
     rendering functions.
 
     Args:
-        render_function (Tile => PIL.Image.Image): A function to convert geopyspark.geotrellis.Tile
-            to a PIL Image.
+        render_function (Tile => PIL.Image.Image or bytes): A function to convert
+            geopyspark.geotrellis.Tile to a PIL Image, or to the bytes of a PNG.
+        processes (int, optional): If set, the render function is run in a pool of this many
+            processes instead of in the driver's Python process. The render function then
+            needs to be picklable. Default is, ``None``.
+        queue_depth (int, optional): The number of renders that may wait for a process when
+            they are all busy. Renders beyond that are rejected, and answered with 503. If
+            ``None``, it is the same as ``processes``.
+        start_method (str, optional): The ``multiprocessing`` start method of the processes. If
+            ``None``, the platform's default is used. Default is, ``'spawn'``.
 
     Attributes:
-        render_function (Tile => PIL.Image.Image): A function to convert geopyspark.geotrellis.Tile
-            to a PIL Image.
+        render_function (Tile => PIL.Image.Image or bytes): A function to convert
+            geopyspark.geotrellis.Tile to a PIL Image, or to the bytes of a PNG.
     """
 
-    def __init__(self, render_function):
+    def __init__(self, render_function, processes=None, queue_depth=None, start_method='spawn'):
         self.render_function = render_function
 
+        if processes:
+            self._pool = _RenderPool(render_function, processes, queue_depth, start_method)
+        else:
+            self._pool = None
+
+    def close(self):
+        """Stops the render processes, if there are any."""
+
+        if self._pool:
+            self._pool.close()
+
     def requiresEncoding(self):
         return True
 
@@ -42,11 +354,11 @@ class TileRender(object):
             bytes representing an image
         """
         try:
+            if self._pool:
+                return self._pool.render(bytes(scala_array))
+
             tile = multibandtile_decoder(scala_array)
-            image = self.render_function(tile)
-            bio = io.BytesIO()
-            image.save(bio, 'PNG')
-            return bio.getvalue()
+            return _encode_image(self.render_function(tile))
         except Exception:
             from traceback import print_exc
             print_exc()
@@ -61,18 +373,37 @@ class TileCompositer(object):
     compositing functions.
 
     Args:
-        composite_function (list[Tile] => PIL.Image.Image): A function to convert
-            a list of geopyspark.geotrellis.Tile to a PIL Image.
+        composite_function (list[Tile] => PIL.Image.Image or bytes): A function to convert
+            a list of geopyspark.geotrellis.Tile to a PIL Image, or to the bytes of a PNG.
+        processes (int, optional): If set, the composite function is run in a pool of this many
+            processes instead of in the driver's Python process. The composite function then
+            needs to be picklable. Default is, ``None``.
+        queue_depth (int, optional): The number of composites that may wait for a process when
+            they are all busy. Composites beyond that are rejected, and answered with 503. If
+            ``None``, it is the same as ``processes``.
+        start_method (str, optional): The ``multiprocessing`` start method of the processes. If
+            ``None``, the platform's default is used. Default is, ``'spawn'``.
 
     Attributes:
-        composite_function (list[Tile] => PIL.Image.Image): A function to convert
-            a list of geopyspark.geotrellis.Tile to a PIL Image.
+        composite_function (list[Tile] => PIL.Image.Image or bytes): A function to convert
+            a list of geopyspark.geotrellis.Tile to a PIL Image, or to the bytes of a PNG.
             image file.
     """
 
-    def __init__(self, composite_function):
+    def __init__(self, composite_function, processes=None, queue_depth=None, start_method='spawn'):
         self.composite_function = composite_function
 
+        if processes:
+            self._pool = _RenderPool(composite_function, processes, queue_depth, start_method)
+        else:
+            self._pool = None
+
+    def close(self):
+        """Stops the render processes, if there are any."""
+
+        if self._pool:
+            self._pool.close()
+
     def requiresEncoding(self):
         return True
 
@@ -88,11 +419,11 @@ class TileCompositer(object):
         """
 
         try:
+            if self._pool:
+                return self._pool.render([bytes(scala_array) for scala_array in all_scala_arrays])
+
             tiles = [multibandtile_decoder(scala_array) for scala_array in all_scala_arrays]
-            image = self.composite_function(tiles)
-            bio = io.BytesIO()
-            image.save(bio, 'PNG')
-            return bio.getvalue()
+            return _encode_image(self.composite_function(tiles))
         except Exception:
             from traceback import print_exc
             print_exc()
@@ -110,6 +441,8 @@ class TMS(object):
 
     Args:
         server (JavaObject): The Java TMSServer instance
+        cache (:class:`~geopyspark.geotrellis.tms.RenderedTileCache`, optional): The cache of
+            the server's rendered tiles.
 
     Attributes:
         pysc (pyspark.SparkContext): The ``SparkContext`` being used this session.
@@ -119,11 +452,17 @@ class TMS(object):
         url_pattern (string): The URI pattern for the current TMS service, with
             {z}, {x}, {y} tokens.  Can be copied directly to services such as
             `geojson.io`.
+        cache (:class:`~geopyspark.geotrellis.tms.RenderedTileCache`): The cache of the server's
+            rendered tiles, if there is one.
     """
 
-    def __init__(self, server):
+    def __init__(self, server, cache=None, source_ids=None, display_id=None, renderer=None):
         self.pysc = get_spark_context()
         self.server = server
+        self._renderer = renderer
+        self.cache = cache
+        self._source_ids = source_ids or []
+        self._display_id = display_id
         self.bound = False
         self._host = None
         self._port = None
@@ -175,6 +514,10 @@ class TMS(object):
             raise RuntimeError("Cannot unbind TMS server: Not bound!")
 
         self.server.unbind()
+
+        if isinstance(self._renderer, (TileRender, TileCompositer)):
+            self._renderer.close()
+
         self._port = None
         self._host = None
         self.bound = False
@@ -207,8 +550,31 @@ class TMS(object):
         else:
             return "http://{}:{}/tile/{{z}}/{{x}}/{{y}}.png".format(self._host, self._port)
 
+    def invalidate(self, zoom=None, source=None):
+        """Drops the cached images of this server, so they are rendered again when they are next
+        requested.
+
+        Args:
+            zoom (int, optional): The zoom level whose images are dropped. If ``None``, every
+                zoom level is dropped.
+            source ((str, str) or :class:`~geopyspark.geotrellis.layer.Pyramid`, optional): One
+                of the server's sources. If set, only the images made from it are dropped.
+                Default is, ``None``.
+        """
+
+        if not self.cache:
+            return
+
+        if source is not None:
+            self.cache.cache.invalidate(_cache_id(source), self._display_id, zoom)
+        else:
+            for source_id in self._source_ids:
+                self.cache.cache.invalidate(source_id, self._display_id, zoom)
+
     @classmethod
-    def build(cls, source, display, allow_overzooming=True):
+    def build(cls, source, display, allow_overzooming=True, cache=None,
+              processes=None, queue_depth=None, start_method='spawn', metatile_size=4,
+              coalesce_window=0.15):
         """Builds a TMS server from one or more layers.
 
         This function takes a SparkContext, a source or list of sources, and a
@@ -230,20 +596,52 @@ class TMS(object):
                 of numpy arrays for multiple sources. In the case of multiple
                 inputs, resampling may be required if the tile sources have
                 different tile sizes. Returns bytes representing the resulting
-                image.
+                image. A :class:`~geopyspark.geotrellis.color.NumpyColorMap` is a
+                callable that colors tiles in Python, and can be used for multiband
+                sources or to composite multiple sources.
             allow_overzooming (bool): If set, viewing at zoom levels above the
                 highest available zoom level will produce tiles that are
                 resampled from the highest zoom level present in the data set.
+            cache (:class:`~geopyspark.geotrellis.tms.RenderedTileCache`, optional): If set,
+                rendered tiles are kept in, and served from, this cache. Default is, ``None``.
+            processes (int, optional): If set, a callable ``display`` is run in a pool of this
+                many processes, so that tiles are rendered in parallel rather than one at a
+                time in the driver's Python process. The processes are started by this method.
+                The ``display`` then needs to be picklable. It has no effect on a ``ColorMap``,
+                which is applied on the JVM. Default is, ``None``.
+            queue_depth (int, optional): The number of tiles that may wait for a render process.
+                Requests beyond that are answered with 503 rather than waiting. If ``None``, it
+                is the same as ``processes``.
+            start_method (str, optional): The ``multiprocessing`` start method of the render
+                processes. Spawned processes import the module of ``display`` rather than
+                inheriting the driver's memory, so ``display`` needs to be importable from a
+                module. Forking the driver, which runs many threads, can deadlock the processes.
+                Default is, ``'spawn'``.
+            metatile_size (int, optional): Tiles of a ``Pyramid`` are read in aligned blocks of
+                ``metatile_size`` x ``metatile_size`` tiles. The tiles that were not requested
+                are kept for a short while, so that panning a map needs fewer Spark jobs.
+                ``1`` reads only the requested tiles. Default is, 4.
+            coalesce_window (float, optional): The number of seconds that requests for the tiles
+                of a ``Pyramid`` are gathered for before they are read by one Spark job.
+                Concurrent requests for the same tile are always read once. Default is, 0.15.
+
+        Returns:
+            :class:`~geopyspark.geotrellis.tms.TMS`
         """
 
         pysc = get_spark_context()
 
+        if metatile_size < 1:
+            raise ValueError("metatile_size must be at least 1. Recieved", metatile_size, "instead.")
+
         def makeReader(arg):
             if isinstance(arg, Pyramid):
                 reader = pysc._gateway.jvm.geopyspark.geotrellis.tms.TileReaders.createSpatialRddReader(
                     {z: lvl.srdd for z, lvl in arg.levels.items()},
                     pysc._gateway.jvm.geopyspark.geotrellis.tms.AkkaSystem.system(),
-                    allow_overzooming)
+                    allow_overzooming,
+                    metatile_size,
+                    int(coalesce_window * 1000))
             elif isinstance(arg, tuple) and isinstance(arg[0], str) and isinstance(arg[1], str):
                 reader = pysc._gateway.jvm.geopyspark.geotrellis.tms.TileReaders.createCatalogReader(arg[0], arg[1], allow_overzooming)
             else:
@@ -254,23 +652,171 @@ class TMS(object):
         if isinstance(source, list) and len(source) == 1:
             source = source[0]
 
+        sources = source if isinstance(source, list) else [source]
+        source_ids = [_cache_id(arg) for arg in sources]
+        display_id = _cache_id(display)
+        routes = pysc._jvm.geopyspark.geotrellis.tms.TMSServerRoutes
+
         if isinstance(display, ColorMap):
             if isinstance(source, list):
                 raise ValueError("May only apply color maps to a single input source")
             else:
-                reader = makeReader(source)
-                wrapped_display = pysc._jvm.geopyspark.geotrellis.tms.RenderSinglebandFromCM.apply(display.cmap)
-                route = pysc._jvm.geopyspark.geotrellis.tms.TMSServerRoutes.renderingTileRoute(reader, wrapped_display)
+                renderer = pysc._jvm.geopyspark.geotrellis.tms.RenderSinglebandFromCM.apply(display.cmap)
         elif callable(display):
             _ensure_callback_gateway_initialized(pysc._gateway)
             if isinstance(source, list):
-                readers = [makeReader(arg) for arg in source]
-                route = pysc._jvm.geopyspark.geotrellis.tms.TMSServerRoutes.compositingTileRoute(readers, TileCompositer(display))
+                renderer = TileCompositer(display, processes, queue_depth, start_method)
             else:
-                reader = makeReader(source)
-                route = pysc._jvm.geopyspark.geotrellis.tms.TMSServerRoutes.renderingTileRoute(reader, TileRender(display))
+                renderer = TileRender(display, processes, queue_depth, start_method)
         else:
             raise ValueError("Display method must be callable or a ColorMap")
 
+        if isinstance(source, list):
+            readers = [makeReader(arg) for arg in source]
+
+            if cache:
+                route = routes.compositingTileRoute(readers, renderer, cache.cache, source_ids, display_id)
+            else:
+                route = routes.compositingTileRoute(readers, renderer)
+        else:
+            reader = makeReader(source)
+
+            if cache:
+                route = routes.renderingTileRoute(reader, renderer, cache.cache, source_ids[0], display_id)
+            else:
+                route = routes.renderingTileRoute(reader, renderer)
+
         server = pysc._jvm.geopyspark.geotrellis.tms.TMSServer.createServer(route)
-        return cls(server)
+        return cls(server, cache, source_ids, display_id, renderer)
+
+    @classmethod
+    def seed(cls, source, display, output, zooms=None, bbox=None):
+        """Renders every tile of one or more layers ahead of time, instead of when they are
+        requested from a server.
+
+        The tiles are rendered in parallel by a Spark job, in the same way as they would be by a
+        server made by :meth:`~geopyspark.geotrellis.tms.TMS.build`, and are then written by the
+        driver. Tiles whose bands are all NoData are skipped, whether ``display`` is a
+        ``ColorMap`` or a callable.
+
+        Note:
+            A callable ``display`` is run on the executors, so it needs to be picklable.
+
+        Note:
+            MBTiles count rows from the bottom of the layout, so the layers need to be laid out
+            with a ``GlobalLayout`` whose zoom levels match the layout's rows, as they are for a
+            TMS server.
+
+        Args:
+            source (tuple or list or :class:`~geopyspark.geotrellis.layer.Pyramid`): The tile
+                sources to render. See :meth:`~geopyspark.geotrellis.tms.TMS.build`.
+            display (ColorMap, callable): Method for mapping tiles to images. See
+                :meth:`~geopyspark.geotrellis.tms.TMS.build`.
+            output (str): Where the tiles are written. If it ends with ``.mbtiles`` or
+                ``.sqlite``, the tiles are written to an MBTiles file. Otherwise, they are written
+                to a ``z/x/y.png`` directory tree.
+            zooms (int or [int], optional): The zoom levels to render. If ``None``, every zoom
+                level that all of the sources have is rendered.
+            bbox (:class:`~geopyspark.geotrellis.Extent` or shapely.geometry, optional): If set,
+                only the tiles that intersect it are rendered. It needs to be in the CRS of the
+                layers. Default is, ``None``.
+
+        Returns:
+            int: The number of tiles that were written.
+        """
+
+        pysc = get_spark_context()
+
+        if isinstance(source, list) and len(source) == 1:
+            source = source[0]
+
+        sources = source if isinstance(source, list) else [source]
+
+        if isinstance(display, ColorMap):
+            if isinstance(source, list):
+                raise ValueError("May only apply color maps to a single input source")
+        elif not callable(display):
+            raise ValueError("Display method must be callable or a ColorMap")
+
+        def source_zooms(arg):
+            if isinstance(arg, Pyramid):
+                return set(arg.levels)
+            elif isinstance(arg, tuple) and isinstance(arg[0], str) and isinstance(arg[1], str):
+                return set(layer.layer_zoom for layer in catalog.AttributeStore.cached(arg[0]).layers()
+                           if layer.layer_name == arg[1])
+            else:
+                raise ValueError('Arguments must be of type Pyramid or (string, string)')
+
+        available_zooms = set.intersection(*[source_zooms(arg) for arg in sources])
+
+        if zooms is None:
+            zooms = sorted(available_zooms)
+        elif isinstance(zooms, int):
+            zooms = [zooms]
+
+        def read_level(arg, zoom):
+            if isinstance(arg, Pyramid):
+                layer = arg.levels[zoom]
+            else:
+                layer = catalog.query(arg[0], arg[1], zoom, query_geom=bbox)
+
+            if layer.layer_type != LayerType.SPATIAL:
+                raise ValueError("Only spatial layers can be seeded. Recieved", layer.layer_type,
+                                 "instead.")
+
+            if bbox is not None:
+                (col_min, row_min, col_max, row_max) = _seed_key_bounds(
+                    layer.layer_metadata.layout_definition, bbox)
+
+                if col_min > col_max or row_min > row_max:
+                    return None
+
+                layer = TiledRasterLayer(layer.layer_type,
+                                         layer.srdd.filterByKeyBounds(col_min, row_min, col_max, row_max))
+
+            return layer
+
+        def render_level(zoom):
+            layers = [read_level(arg, zoom) for arg in sources]
+
+            if any(layer is None for layer in layers):
+                return pysc.emptyRDD()
+
+            if isinstance(display, ColorMap):
+                return layers[0].to_png_rdd(display, skip_empty=True)
+
+            if len(layers) == 1:
+                return (layers[0].to_numpy_rdd()
+                        .filter(lambda kv: not _is_empty_tile(kv[1]))
+                        .mapValues(lambda tile: _encode_image(display(tile))))
+
+            count = len(layers)
+            indexed = [layer.to_numpy_rdd().mapValues(lambda tile, index=index: (index, tile))
+                       for index, layer in enumerate(layers)]
+
+            return (pysc.union(indexed)
+                    .groupByKey()
+                    .filter(lambda kv: len(kv[1]) == count)
+                    .mapValues(lambda tiles: [tile for _, tile in sorted(tiles, key=lambda x: x[0])])
+                    .filter(lambda kv: not all(_is_empty_tile(tile) for tile in kv[1]))
+                    .mapValues(lambda tiles: _encode_image(display(tiles))))
+
+        if output.endswith('.mbtiles') or output.endswith('.sqlite'):
+            writer = _MBTilesWriter(output, os.path.splitext(os.path.basename(output))[0])
+        else:
+            writer = _DirectoryTileWriter(output)
+
+        written = 0
+
+        try:
+            for zoom in zooms:
+                if zoom not in available_zooms:
+                    raise ValueError("Not every source has zoom level", zoom)
+
+                for key, png in render_level(zoom).toLocalIterator():
+                    writer.write(zoom, key.col, key.row, png)
+                    written += 1
+        finally:
+            writer.close()
+
+        return written
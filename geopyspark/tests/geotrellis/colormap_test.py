@@ -3,9 +3,10 @@ import pytest
 import struct
 import sys
 import unittest
+import zlib
 
 from colortools import Color
-from geopyspark.geotrellis.color import get_colors_from_colors, get_colors_from_matplotlib, ColorMap
+from geopyspark.geotrellis.color import get_colors_from_colors, get_colors_from_matplotlib, ColorMap, NumpyColorMap
 from geopyspark.geotrellis.constants import LayerType
 from geopyspark.geotrellis import SpatialKey, Tile
 from geopyspark.geotrellis.layer import TiledRasterLayer
@@ -153,5 +154,67 @@ class ColormapTest(BaseTestClass):
         result = ColorMap.build(breaks=hist, colors=color_list)
         self.assertTrue(isinstance(result, ColorMap))
 
+    def test_numpy_color_map(self):
+        cmap = NumpyColorMap.build(breaks={1: 0xff0000ff, 3: 0x00ff00ff, 5: 0x0000ffff},
+                                   no_data_color=0x11111111,
+                                   fallback=0x22222222)
+        cells = np.array([[0, 1, 2, 3],
+                          [4, 5, 6, -1]], dtype='int16')
+
+        result = cmap.render(cells, no_data_value=-1)
+
+        self.assertEqual(result.shape, (2, 4, 4))
+        self.assertEqual(result[0, 0].tolist(), [255, 0, 0, 255])
+        self.assertEqual(result[0, 2].tolist(), [0, 255, 0, 255])
+        self.assertEqual(result[1, 1].tolist(), [0, 0, 255, 255])
+        self.assertEqual(result[1, 2].tolist(), [0x22] * 4)
+        self.assertEqual(result[1, 3].tolist(), [0x11] * 4)
+
+    def test_numpy_color_map_exact(self):
+        cmap = NumpyColorMap([1.0, 3.0], [0xff0000ff, 0x00ff00ff],
+                             fallback=0x22222222,
+                             classification_strategy='Exact')
+        cells = np.array([[1.0, 2.0, 3.0, np.nan]])
+
+        result = cmap.render(cells)
+
+        self.assertEqual(result[0, :, 0].tolist(), [255, 0x22, 0, 0])
+
+    def test_numpy_color_map_png(self):
+        cmap = NumpyColorMap.build(breaks=[1, 2, 3, 4], colors=self.color_list)
+        tile = Tile(np.array([[[1, 2], [3, 4]], [[4, 3], [2, 1]]], dtype='int16'), 'SHORT', -1)
+
+        png = cmap(tile)
+
+        self.assertEqual(png[:8], b'\x89PNG\r\n\x1a\n')
+        self.assertEqual(struct.unpack('>II', png[16:24]), (2, 2))
+
+        idat_length = struct.unpack('>I', png[33:37])[0]
+        scanlines = zlib.decompress(png[41:41 + idat_length])
+        expected = cmap.render(tile.cells[0])
+
+        self.assertEqual(scanlines, b''.join(b'\x00' + row.tobytes() for row in expected))
+
+        composite = cmap([tile, tile])
+        self.assertEqual(composite, png)
+
+    def test_numpy_color_map_composite(self):
+        cmap = NumpyColorMap.build(breaks={1: 0xff000080, 2: 0x0000ffff})
+        no_data = Tile(np.array([[[-1, -1]]], dtype='int16'), 'SHORT', -1)
+        tile = Tile(np.array([[[1, 2]]], dtype='int16'), 'SHORT', -1)
+
+        def pixels(png):
+            idat_length = struct.unpack('>I', png[33:37])[0]
+            scanline = zlib.decompress(png[41:41 + idat_length])
+            return [list(scanline[1:5]), list(scanline[5:9])]
+
+        # The transparent NoData color does not darken the semi-transparent color over it
+        self.assertEqual(pixels(cmap([no_data, tile])), [[255, 0, 0, 128], [0, 0, 255, 255]])
+        self.assertEqual(pixels(cmap([tile, no_data])), [[255, 0, 0, 128], [0, 0, 255, 255]])
+
+        # Half-transparent red over opaque blue
+        over = Tile(np.array([[[2, 2]]], dtype='int16'), 'SHORT', -1)
+        self.assertEqual(pixels(cmap([over, tile])), [[128, 0, 127, 255], [0, 0, 255, 255]])
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ import pytest
 from shapely.geometry import box
 
 from geopyspark.geotrellis import Extent, SpatialKey, GlobalLayout, LocalLayout
-from geopyspark.geotrellis.catalog import read_value, query, read_layer_metadata, AttributeStore
+from geopyspark.geotrellis.catalog import read_value, query, explain_query, read_layer_metadata, AttributeStore, ValueReader, TileCache
 from geopyspark.geotrellis.constants import LayerType
 from geopyspark.geotrellis.geotiff import get
 from geopyspark.tests.base_test_class import BaseTestClass
@@ -40,6 +40,31 @@ class CatalogTest(BaseTestClass):
 
         self.assertEqual(tiled, None)
 
+    def test_read_many(self):
+        reader = ValueReader(self.uri, self.layer_name, 11)
+        tiles = reader.read_many([SpatialKey(1450, 966), (1450, 2000)])
+
+        self.assertEqual(list(tiles.keys()), [SpatialKey(1450, 966)])
+        self.assertTrue((tiles[SpatialKey(1450, 966)].cells == reader.read(1450, 966).cells).all())
+
+    def test_read_cached(self):
+        reader = ValueReader(self.uri, self.layer_name, 11, cache=TileCache())
+
+        first = reader.read(1450, 966)
+        second = reader.read(1450, 966)
+        self.assertIs(first, second)
+        self.assertFalse(first.cells.flags.writeable)
+
+        self.assertEqual(reader.read_many([(1450, 966), (1450, 2000)]), {SpatialKey(1450, 966): first})
+        self.assertEqual(reader.read(1450, 2000), None)
+
+        stats = reader.cache_stats
+        self.assertEqual((stats.hits, stats.misses), (3, 2))
+        self.assertEqual(stats.size_bytes, first.cells.nbytes + 64)
+
+        reader.cache.invalidate(self.uri, self.layer_name, 11)
+        self.assertEqual(reader.cache_stats.size_bytes, 0)
+
     @pytest.mark.skipif('TRAVIS' in os.environ,
                         reason="test_query_1 causes issues on Travis")
     def test_query1(self):
@@ -84,6 +109,22 @@ class CatalogTest(BaseTestClass):
 
         self.assertEqual(queried.to_numpy_rdd().first()[0], SpatialKey(1450, 996))
 
+    def test_explain_query(self):
+        intersection = Extent(8348915.46680623, 543988.943201519, 8348915.4669, 543988.943201520)
+        explanation = explain_query(self.uri, self.layer_name, 11, intersection, query_proj=3857)
+
+        self.assertEqual(explanation.tile_count, 1)
+        self.assertEqual(explanation.key_bounds[0].minKey, SpatialKey(1450, 996))
+        self.assertEqual(explanation.estimated_bytes, explanation.tile_bytes)
+        self.assertEqual(explanation.num_partitions, 1)
+
+    def test_query_partition_bytes(self):
+        explanation = explain_query(self.uri, self.layer_name, 11, partition_bytes=1)
+        queried = query(self.uri, self.layer_name, 11, partition_bytes=1)
+
+        self.assertEqual(explanation.num_partitions, explanation.tile_count)
+        self.assertTrue(queried.getNumPartitions() >= query(self.uri, self.layer_name, 11).getNumPartitions())
+
     def test_read_metadata_exception(self):
         uri = "abcxyz://123"
         with pytest.raises(ValueError):
@@ -120,6 +161,51 @@ class CatalogTest(BaseTestClass):
         with pytest.raises(KeyError):
             store.layer(layer_name, 34)["val"]
 
+    def test_memoized_attributes(self):
+        store = AttributeStore(self.uri)
+        layer = store.layer(self.layer_name, 5)
+
+        self.assertIs(layer.layer_metadata(), layer.layer_metadata())
+        self.assertEqual(len(store._values), 1)
+
+        store.layer("boop-epsg-bop", 34).write("val", {"first": 1})
+        self.assertEqual(store.layer("boop-epsg-bop", 34)["val"], {"first": 1})
+
+        # Callers are given copies, so they can not change the memoized value
+        store.layer("boop-epsg-bop", 34)["val"]["first"] = 3
+        self.assertEqual(store.layer("boop-epsg-bop", 34)["val"], {"first": 1})
+
+        store.layer("boop-epsg-bop", 34).write("val", {"first": 2})
+        self.assertEqual(store.layer("boop-epsg-bop", 34)["val"], {"first": 2})
+
+        store.invalidate(self.layer_name)
+        self.assertEqual(len(store._values), 1)
+
+    def test_memoized_attributes_other_stores(self):
+        store = AttributeStore(self.uri)
+        other = AttributeStore.build(self.uri)
+        cached = AttributeStore.cached(self.uri)
+
+        for attribute_store in (other, cached):
+            with pytest.raises(KeyError):
+                attribute_store.layer("boop-epsg-bop", 35)["val"]
+
+        store.layer("boop-epsg-bop", 35).write("val", {"first": 1})
+
+        for attribute_store in (other, cached):
+            self.assertEqual(attribute_store.layer("boop-epsg-bop", 35)["val"], {"first": 1})
+
+        store.layer("boop-epsg-bop", 35).write("val", {"first": 2})
+
+        for attribute_store in (other, cached):
+            self.assertEqual(attribute_store.layer("boop-epsg-bop", 35)["val"], {"first": 2})
+
+        other.layer("boop-epsg-bop", 35).delete("val")
+
+        for attribute_store in (store, cached):
+            with pytest.raises(KeyError):
+                attribute_store.layer("boop-epsg-bop", 35)["val"]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,10 @@ class CatalogTest(BaseTestClass):
 
     @pytest.fixture(autouse=True)
     def tearDown(self):
+        from geopyspark.geotrellis import rasterio as gps_rasterio
+
+        # The tests convert the same CRSs with different functions
+        gps_rasterio._proj4_strings.clear()
         yield
         BaseTestClass.pysc._gateway.close()
 
@@ -20,9 +24,96 @@ class CatalogTest(BaseTestClass):
     def test_tiles(self):
         import geopyspark as gps
         from geopyspark.geotrellis import rasterio
-        tiles = rasterio._read_windows(self.uri, xcols=256, ycols=256, bands=None, crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+        units = rasterio._plan_windows(self.uri, 256, 256, crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+        tiles = rasterio._read_units(units, None, 1)
         self.assertEqual(len(list(tiles)), 144)
 
+    def test_planned_windows(self):
+        import tempfile
+        import numpy as np
+        from rasterio.transform import from_origin
+        from geopyspark.geotrellis import rasterio as gps_rasterio
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "blocks.tif")
+
+            with rasterio.open(path, 'w', driver='GTiff', width=1000, height=700, count=1,
+                               dtype='uint8', crs='EPSG:4326', transform=from_origin(10, 50, 0.01, 0.01),
+                               tiled=True, blockxsize=512, blockysize=512) as dataset:
+                dataset.write(np.ones((1, 700, 1000), dtype='uint8'))
+
+            # Blocks are larger than the requested windows, so each is split into windows
+            units = gps_rasterio._plan_windows(path, 256, 256, crs_to_proj4=lambda n: '')
+
+        windows = [window for (_, _, window) in units]
+        self.assertEqual(sum(w * h for (_, _, w, h) in windows), 1000 * 700)
+
+        blocks = {}
+
+        for (col, row, width, height) in windows:
+            block = (col // 512, row // 512)
+
+            # No window crosses the edge of a block
+            self.assertEqual(block, ((col + width - 1) // 512, (row + height - 1) // 512))
+            blocks[block] = blocks.get(block, 0) + width * height
+
+        # The windows of each block cover all of it
+        for (block_col, block_row), area in blocks.items():
+            block_width = min(512, 1000 - block_col * 512)
+            block_height = min(512, 700 - block_row * 512)
+            self.assertEqual(area, block_width * block_height)
+
+        self.assertEqual(len(blocks), 4)
+        self.assertEqual(len(windows), 12)
+
+    def test_dataset_cache(self):
+        from geopyspark.geotrellis import rasterio as gps_rasterio
+
+        cache = gps_rasterio._DatasetCache(4)
+        conversions = []
+
+        def convert(crs):
+            conversions.append(crs)
+            return 'first'
+
+        # Each task on an executor unpickles a new crs_to_proj4, which should still hit
+        first = cache.info(self.uri, convert)
+        second = cache.info(self.uri, lambda crs: 'second')
+
+        self.assertEqual((first.proj4, second.proj4), ('first', 'first'))
+        self.assertEqual(len(conversions), 1)
+        self.assertEqual(len(cache._infos), 1)
+
+        cache.grow(2)
+        self.assertEqual(cache.max_size, 4)
+        cache.grow(8)
+        self.assertEqual(cache.max_size, 8)
+
+        cache.clear()
+
+    def test_overview_windows(self):
+        import tempfile
+        import numpy as np
+        from rasterio.enums import Resampling
+        from rasterio.transform import from_origin
+        from geopyspark.geotrellis import rasterio as gps_rasterio
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "overviews.tif")
+
+            with rasterio.open(path, 'w', driver='GTiff', width=1000, height=700, count=1,
+                               dtype='uint8', crs='EPSG:4326', transform=from_origin(10, 50, 0.01, 0.01),
+                               tiled=True, blockxsize=256, blockysize=256) as dataset:
+                dataset.write(np.ones((1, 700, 1000), dtype='uint8'))
+                dataset.build_overviews([2, 4, 8], Resampling.nearest)
+
+            units = gps_rasterio._plan_windows(path, 256, 256, crs_to_proj4=lambda n: '', resolution=0.05)
+            tiles = list(gps_rasterio._read_units(units, None, 2))
+
+        self.assertEqual(len(tiles), 1)
+        self.assertEqual(tiles[0][1].cells.shape, (1, 175, 250))
+        self.assertEqual(tiles[0][0].extent, gps_rasterio.gps.Extent(10.0, 43.0, 20.0, 50.0))
+
     @pytest.mark.skipif('TRAVIS_PYTHON_VERSION' in os.environ.keys(),
                         reason="Travis produces different results than local")
     def test_layer(self):
@@ -32,5 +123,126 @@ class CatalogTest(BaseTestClass):
         rdd1 = gps.RasterLayer.from_numpy_rdd(gps.LayerType.SPATIAL, rdd0)
         self.assertEqual(rdd1.count(), 144)
 
+    def test_cache_stats(self):
+        import geopyspark as gps
+        stats = gps.rasterio.DatasetCacheStats()
+        rdd = gps.rasterio.get(self.uri, num_partitions=2, max_workers=2, cache_stats=stats)
+
+        self.assertEqual(rdd.count(), 144)
+        self.assertEqual(stats.hits.value + stats.misses.value, 144)
+        self.assertTrue(stats.hit_rate > 0.5)
+
+    def test_num_partitions(self):
+        import geopyspark as gps
+        rdd = gps.rasterio.get(self.uri, num_partitions=8, max_workers=2)
+        self.assertEqual(rdd.getNumPartitions(), 8)
+        self.assertEqual(rdd.count(), 144)
+
+    def test_pack_units(self):
+        from geopyspark.geotrellis import rasterio as gps_rasterio
+        partitions = gps_rasterio._pack_units(list(range(6)), [10, 60, 40, 200, 5, 5], 100)
+
+        self.assertEqual(partitions, [[0, 1], [2], [3], [4, 5]])
+
+    def test_partition_bytes(self):
+        import geopyspark as gps
+        rdd = gps.rasterio.get(self.uri, partition_bytes=256 * 256 * 2 * 16, max_workers=2)
+
+        self.assertEqual(rdd.count(), 144)
+        self.assertTrue(1 < rdd.getNumPartitions() < 144)
+
+    def test_get_tiled(self):
+        import numpy as np
+        import geopyspark as gps
+        layer = gps.rasterio.get_tiled(self.uri, gps.LocalLayout(256),
+                                       crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+
+        with rasterio.open(self.uri) as dataset:
+            cells = dataset.read()
+            nodata = dataset.nodata
+
+        bounds = layer.layer_metadata.bounds
+        tiles = layer.to_numpy_rdd().collect()
+
+        self.assertEqual(len(tiles), (bounds.maxKey.col + 1) * (bounds.maxKey.row + 1))
+        self.assertEqual(sum(tile.cells[tile.cells != nodata].sum() for _, tile in tiles),
+                         cells[cells != nodata].sum())
+
+    def _write_tif(self, path, cells, left, top, res):
+        from rasterio.transform import from_origin
+
+        with rasterio.open(path, 'w', driver='GTiff', width=cells.shape[1], height=cells.shape[0],
+                           count=1, dtype=cells.dtype, crs='EPSG:4326', nodata=-1,
+                           transform=from_origin(left, top, res, res)) as dataset:
+            dataset.write(cells, 1)
+
+    def _stitch(self, layer):
+        import numpy as np
+
+        tile_layout = layer.layer_metadata.layout_definition.tileLayout
+        result = np.zeros((tile_layout.layoutRows * tile_layout.tileRows,
+                           tile_layout.layoutCols * tile_layout.tileCols), dtype='int16')
+
+        for key, tile in layer.to_numpy_rdd().collect():
+            result[key.row * tile_layout.tileRows:(key.row + 1) * tile_layout.tileRows,
+                   key.col * tile_layout.tileCols:(key.col + 1) * tile_layout.tileCols] = tile.cells[0]
+
+        return result
+
+    def test_get_tiled_overlapping_files(self):
+        import tempfile
+        import numpy as np
+        import geopyspark as gps
+
+        first = np.ones((8, 8), dtype='int16')
+        first[:, 6:] = -1
+        second = np.full((8, 8), 2, dtype='int16')
+        second[:, :2] = -1
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, "first.tif"), os.path.join(directory, "second.tif")]
+            self._write_tif(paths[0], first, 0, 8, 1)
+            self._write_tif(paths[1], second, 4, 8, 1)
+
+            layer = gps.rasterio.get_tiled(paths, gps.LocalLayout(4),
+                                           crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+            actual = self._stitch(layer)
+
+        # NoData in the later file does not replace the cells of the earlier one
+        expected = np.full((8, 12), 2, dtype='int16')
+        expected[:, :6] = 1
+
+        self.assertTrue((actual == expected).all())
+
+    def test_get_tiled_resampled(self):
+        import tempfile
+        import numpy as np
+        import geopyspark as gps
+
+        cells = np.arange(256, dtype='int16').reshape(16, 16)
+        layout = gps.LayoutDefinition(gps.Extent(0.0, 0.0, 8.0, 8.0), gps.TileLayout(2, 2, 4, 4))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fine.tif")
+            self._write_tif(path, cells, 0, 8, 0.5)
+
+            layer = gps.rasterio.get_tiled(path, layout,
+                                           crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+            actual = self._stitch(layer)
+
+        # Each cell of the layout takes the value of the file's cell nearest its center
+        self.assertTrue((actual == cells[1::2, 1::2]).all())
+
+    def test_get_tiled_global_layout_zoom(self):
+        import geopyspark as gps
+
+        layer = gps.rasterio.get_tiled(self.uri, gps.GlobalLayout(256),
+                                       crs_to_proj4=lambda n: '+proj=longlat +datum=WGS84 +no_defs ')
+
+        self.assertIsNotNone(layer.zoom_level)
+        self.assertEqual(layer.layer_metadata.layout_definition.tileLayout.layoutCols,
+                         2 ** layer.zoom_level)
+
+
 if __name__ == "__main__":
     unittest.main()
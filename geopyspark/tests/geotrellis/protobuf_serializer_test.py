@@ -0,0 +1,73 @@
+import io
+import unittest
+
+import numpy as np
+
+from pyspark.serializers import read_int
+from geopyspark.geotrellis import SpatialKey, Tile
+from geopyspark.geotrellis.protobufserializer import ProtoBufSerializer
+
+
+class ProtoBufSerializerStreamTest(unittest.TestCase):
+    # Constant tiles encode to a few bytes, the others to about 16 KiB each
+    small = [(SpatialKey(col, 0), Tile(np.zeros((1, 4, 4), dtype='int8'), 'BYTE', -128))
+             for col in range(60)]
+    large = [(SpatialKey(col, 1), Tile(np.arange(64 * 64, dtype='int32').reshape(1, 64, 64), 'INT', -1))
+             for col in range(60)]
+
+    ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type='SpatialKey', batch_bytes=1024)
+
+    def frames(self, values):
+        stream = io.BytesIO()
+        self.ser.dump_stream(values, stream)
+        stream.seek(0)
+
+        frames = []
+
+        while True:
+            try:
+                length = read_int(stream)
+            except EOFError:
+                return frames
+
+            frames.append(stream.read(length))
+
+    def test_round_trip(self):
+        values = self.small + self.large
+
+        stream = io.BytesIO()
+        self.ser.dump_stream(values, stream)
+        stream.seek(0)
+
+        actual = [value for batch in self.ser.load_stream(stream) for value in batch]
+
+        self.assertEqual([key for (key, _) in actual], [key for (key, _) in values])
+
+        for ((_, actual_tile), (_, expected_tile)) in zip(actual, values):
+            self.assertTrue((actual_tile.cells == expected_tile.cells).all())
+
+    def test_batch_size_adapts(self):
+        counts = [len(self.ser.loads(frame)) for frame in self.frames(self.small + self.large)]
+
+        self.assertEqual(sum(counts), len(self.small) + len(self.large))
+
+        # Batches of small frames grow
+        self.assertEqual(counts[:5], [1, 2, 4, 8, 16])
+
+        # and then shrink once frames are more than ten times batch_bytes
+        largest = counts.index(max(counts))
+        self.assertEqual(counts[largest + 1:largest + 4],
+                         [counts[largest] // 2, counts[largest] // 4, counts[largest] // 8])
+
+    def test_unbatched(self):
+        ser = ProtoBufSerializer.create_tuple_serializer(key_type='SpatialKey')
+        stream = io.BytesIO()
+        ser.dump_stream(self.small[:3], stream)
+        stream.seek(0)
+
+        self.assertEqual([value[0][0] for value in ser.load_stream(stream)],
+                         [key for (key, _) in self.small[:3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import time
+import unittest
+import threading
+
+import numpy as np
+
+from geopyspark.geotrellis import Tile
+from geopyspark.geotrellis.protobufcodecs import multibandtile_encoder
+from geopyspark.geotrellis.tms import _RenderPool, _BUSY
+
+
+# The render functions are defined at the top level of a module that does not start a
+# SparkContext, so that spawned processes can import them.
+def _render_pid(tile):
+    return str(os.getpid()).encode()
+
+
+def _render_slowly(tile):
+    time.sleep(2)
+    return str(int(tile.cells.sum())).encode()
+
+
+class RenderPoolTest(unittest.TestCase):
+    encoded = multibandtile_encoder(Tile.from_numpy_array(np.ones((1, 4, 4), dtype='int32'), -1))
+
+    def test_render_in_processes(self):
+        pool = _RenderPool(_render_pid, 2)
+
+        try:
+            pids = {pool.render(self.encoded) for _ in range(4)}
+        finally:
+            pool.close()
+
+        self.assertTrue(pids)
+        self.assertNotIn(str(os.getpid()).encode(), pids)
+        self.assertNotIn(_BUSY, pids)
+
+    def test_render_busy(self):
+        pool = _RenderPool(_render_slowly, 1, queue_depth=1)
+        results = []
+
+        def render():
+            results.append(pool.render(self.encoded))
+
+        threads = [threading.Thread(target=render) for _ in range(pool.processes + pool.queue_depth)]
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            deadline = time.monotonic() + 10
+
+            # Waits for every slot to be taken by the renders in progress
+            while pool._slots._value and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(pool.render(self.encoded), _BUSY)
+            self.assertEqual(pool.rejected, 1)
+
+            for thread in threads:
+                thread.join()
+        finally:
+            pool.close()
+
+        self.assertEqual(results, [b'16', b'16'])
+
+
+if __name__ == "__main__":
+    unittest.main()
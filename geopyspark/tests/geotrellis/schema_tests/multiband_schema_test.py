@@ -38,20 +38,18 @@ class MultibandSchemaTest(BaseTestClass):
     def test_encoded_multibands(self):
         actual_encoded = [multibandtile_encoder(x) for x in self.collected]
 
-        proto_tile = tileMessages_pb2.ProtoTile()
         cell_type = tileMessages_pb2.ProtoCellType()
 
         cell_type.nd = self.no_data
         cell_type.hasNoData = True
         cell_type.dataType = 1
 
-        proto_tile.cols = 2
-        proto_tile.rows = 2
-        proto_tile.sint32Cells.extend(self.arr.flatten().tolist())
-        proto_tile.cellType.CopyFrom(cell_type)
-
         proto_multiband = tileMessages_pb2.ProtoMultibandTile()
-        proto_multiband.tiles.extend([proto_tile, proto_tile, proto_tile])
+        proto_multiband.cols = 2
+        proto_multiband.rows = 2
+        proto_multiband.bandCount = 3
+        proto_multiband.cellType.CopyFrom(cell_type)
+        proto_multiband.cellBuffer = self.multiband_tile.tobytes()
         bs = proto_multiband.SerializeToString()
 
         expected_encoded = [bs, bs, bs]
@@ -59,6 +57,15 @@ class MultibandSchemaTest(BaseTestClass):
         for actual, expected in zip(actual_encoded, expected_encoded):
             self.assertEqual(actual, expected)
 
+    def test_constant_multibands(self):
+        cells = np.full((3, 256, 256), self.no_data, dtype='int8')
+        encoded = tileMessages_pb2.ProtoMultibandTile.FromString(
+            multibandtile_encoder(Tile(cells, 'BYTE', self.no_data)))
+
+        self.assertFalse(encoded.cellBuffer)
+        self.assertTrue(all(tile.isConstant for tile in encoded.tiles))
+        self.assertTrue((multibandtile_decoder(encoded.SerializeToString()).cells == cells).all())
+
     def test_decoded_multibands(self):
         expected_multibands = [
             self.multiband_dict,
@@ -265,5 +265,34 @@ class FloatTileSchemaTest(BaseTestClass):
             self.assertEqual(actual.cells.shape, actual.cells.shape)
 
 
+class ConstantTileSchemaTest(BaseTestClass):
+    tiles = [
+        Tile.from_numpy_array(np.full((256, 256), -32768, dtype='int16'), -32768),
+        Tile.from_numpy_array(np.full((256, 256), 7, dtype='uint8'), 0),
+        Tile.from_numpy_array(np.full((256, 256), np.nan, dtype='float32'), float('nan'))
+    ]
+
+    def test_encoded_tiles(self):
+        for tile in self.tiles:
+            encoded = to_pb_tile(tile)
+
+            self.assertTrue(encoded.isConstant)
+            self.assertFalse(encoded.cellBuffer)
+
+    def test_decoded_tiles(self):
+        for expected in self.tiles:
+            actual = tile_decoder(tile_encoder(expected))
+
+            self.assertEqual(actual.cells.dtype, expected.cells.dtype)
+            self.assertEqual(actual.cells.shape, (1,) + expected.cells.shape)
+            self.assertTrue(np.array_equal(actual.cells[0], expected.cells, equal_nan=True))
+
+    def test_non_constant_tile(self):
+        cells = np.zeros((256, 256), dtype='int16')
+        cells[255, 255] = 1
+
+        self.assertFalse(to_pb_tile(Tile.from_numpy_array(cells, -32768)).isConstant)
+
+
 if __name__ == "__main__":
     unittest.main()
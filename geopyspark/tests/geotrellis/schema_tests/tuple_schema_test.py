@@ -1,14 +1,18 @@
 import os
+import datetime
 import unittest
 import pytest
 import numpy as np
 
 from pyspark import RDD
 from pyspark.serializers import AutoBatchedSerializer
-from geopyspark.geotrellis import Extent, ProjectedExtent, Tile
+from geopyspark.geotrellis import Extent, ProjectedExtent, SpaceTimeKey, TemporalProjectedExtent, Tile
 from geopyspark.geotrellis.protobufserializer import ProtoBufSerializer
 from geopyspark.geotrellis.protobufcodecs import (create_partial_tuple_decoder,
                                                   create_partial_tuple_encoder,
+                                                  create_partial_tuple_batch_decoder,
+                                                  create_partial_tuple_batch_encoder,
+                                                  tuple_batch_decoder,
                                                   from_pb_multibandtile,
                                                   to_pb_multibandtile,
                                                   to_pb_projected_extent)
@@ -74,5 +78,70 @@ class TupleSchemaTest(BaseTestClass):
             self.assertDictEqual(actual_extent._asdict(), expected_extent)
 
 
+class TupleBatchSchemaTest(BaseTestClass):
+    extent = {
+        'epsg': 2004,
+        'extent': {'xmax': 1.0, 'xmin': 0.0, 'ymax': 1.0, 'ymin': 0.0},
+        'proj4': None
+    }
+
+    arr = np.int8([0, 0, 1, 1]).reshape(2, 2)
+    multiband_dict = Tile(np.array([arr, arr, arr]), 'BYTE', -128)
+
+    sc = BaseTestClass.pysc._jsc.sc()
+    ew = BaseTestClass.pysc._jvm.geopyspark.geotrellis.tests.schemas.TupleWrapper
+
+    java_rdd = ew.testOutBatched(sc, 1 << 20)
+
+    ser = ProtoBufSerializer.create_tuple_batch_serializer(key_type="ProjectedExtent")
+    rdd = RDD(java_rdd, BaseTestClass.pysc, AutoBatchedSerializer(ser))
+    collected = rdd.collect()
+
+    def test_decoded_tuples(self):
+        self.assertEqual(len(self.collected), 3)
+
+        for (actual_extent, actual_tile) in self.collected:
+            self.assertTrue((actual_tile.cells == self.multiband_dict.cells).all())
+            self.assertDictEqual(actual_extent._asdict(), self.extent)
+
+    def test_encoded_tuples(self):
+        encoded = self.ser.dumps(self.collected)
+        decoded = tuple_batch_decoder(encoded, key_decoder="ProjectedExtent")
+
+        self.assertEqual(len(decoded), len(self.collected))
+
+        for actual, expected in zip(decoded, self.collected):
+            self.assertEqual(actual[0], expected[0])
+            self.assertTrue((actual[1].cells == expected[1].cells).all())
+
+
+class TupleBatchCodecTest(unittest.TestCase):
+    tile = Tile(np.int8([[[0, 1], [1, 0]]]), 'BYTE', -128)
+    instant = datetime.datetime(2017, 1, 2, 3, 4, 5)
+    millis = 1483326245000
+
+    def round_trip(self, key_type, key, instants_as_millis):
+        encoded = create_partial_tuple_batch_encoder(key_type)([(key, self.tile), (key, self.tile)])
+        decoded = create_partial_tuple_batch_decoder(key_type, instants_as_millis=instants_as_millis)(encoded)
+
+        self.assertEqual(len(decoded), 2)
+        self.assertTrue((decoded[0][1].cells == self.tile.cells).all())
+
+        return decoded[0][0]
+
+    def test_space_time_key_instants(self):
+        key = SpaceTimeKey(1, 2, self.instant)
+
+        self.assertEqual(self.round_trip("SpaceTimeKey", key, False), key)
+        self.assertEqual(self.round_trip("SpaceTimeKey", key, True), SpaceTimeKey(1, 2, self.millis))
+
+    def test_temporal_projected_extent_instants(self):
+        key = TemporalProjectedExtent(Extent(0.0, 0.0, 1.0, 1.0), self.instant, epsg=4326)
+
+        self.assertEqual(self.round_trip("TemporalProjectedExtent", key, False), key)
+        self.assertEqual(self.round_trip("TemporalProjectedExtent", key, True),
+                         key._replace(instant=self.millis))
+
+
 if __name__ == "__main__":
     unittest.main()
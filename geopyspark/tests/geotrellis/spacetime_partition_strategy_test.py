@@ -90,6 +90,18 @@ class SpaceTimePartitionStrategyTest(BaseTestClass):
 
         self.assertEqual(self.strategy, actual_strategy)
 
+    def test_partition_func_matches_space_time_partitioner(self):
+        expected = self.tiled_raster_rdd.partitionBy(self.strategy).to_numpy_rdd().keys().glom().collect()
+
+        actual = self.rdd.keys() \
+                .map(lambda key: (key, None)) \
+                .partitionBy(self.strategy.num_partitions, self.strategy.partition_func()) \
+                .keys() \
+                .glom() \
+                .collect()
+
+        self.assertEqual([sorted(keys) for keys in expected], [sorted(keys) for keys in actual])
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+
+import pytest
+
+from geopyspark.geotrellis import SpatialKey, Tile, SpatialPartitionStrategy
+from geopyspark.tests.base_test_class import BaseTestClass
+from geopyspark.geotrellis.layer import TiledRasterLayer
+from geopyspark.geotrellis.constants import LayerType
+
+
+class SpatialPartitionStrategyTest(BaseTestClass):
+    band = np.array([
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0, 1.0]])
+
+    tile = Tile.from_numpy_array(band)
+
+    layer = [(SpatialKey(col, row), tile) for col in range(4) for row in range(4)]
+
+    rdd = BaseTestClass.pysc.parallelize(layer)
+
+    extent = {'xmin': 0.0, 'ymin': 0.0, 'xmax': 33.0, 'ymax': 33.0}
+    metadata = {'cellType': 'float32ud-1.0',
+                'extent': extent,
+                'crs': '+proj=longlat +datum=WGS84 +no_defs ',
+                'bounds': {
+                    'minKey': {'col': 0, 'row': 0},
+                    'maxKey': {'col': 3, 'row': 3}},
+                'layoutDefinition': {
+                    'extent': extent,
+                    'tileLayout': {'tileCols': 5, 'tileRows': 5, 'layoutCols': 4, 'layoutRows': 4}}}
+
+    tiled_raster_rdd = TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd, metadata)
+
+    strategy = SpatialPartitionStrategy(num_partitions=4, bits=2)
+
+    @pytest.fixture(autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def test_zindex(self):
+        self.assertEqual(SpatialKey(0, 0).zindex(), 0)
+        self.assertEqual(SpatialKey(1, 0).zindex(), 1)
+        self.assertEqual(SpatialKey(0, 1).zindex(), 2)
+        self.assertEqual(SpatialKey(3, 3).zindex(), 15)
+
+    def test_partition_func_matches_spatial_partitioner(self):
+        expected = self.tiled_raster_rdd.partitionBy(self.strategy).to_numpy_rdd().keys().glom().collect()
+
+        actual = self.rdd.keys() \
+                .map(lambda key: (key, None)) \
+                .partitionBy(self.strategy.num_partitions, self.strategy.partition_func()) \
+                .keys() \
+                .glom() \
+                .collect()
+
+        self.assertEqual([sorted(keys) for keys in expected], [sorted(keys) for keys in actual])
+
+    def test_partition_func_without_bits(self):
+        with self.assertRaises(ValueError):
+            SpatialPartitionStrategy(num_partitions=None, bits=None).partition_func()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+import pytest
+
+from geopyspark.geotrellis import SpatialKey, Tile
+from geopyspark.geotrellis.layer import TiledRasterLayer
+from geopyspark.tests.base_test_class import BaseTestClass
+from geopyspark.geotrellis.constants import LayerType, Transport
+
+
+pytest.importorskip("pyarrow")
+
+
+class ArrowTransportTest(BaseTestClass):
+    cells = np.array([[
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [2.0, 2.0, 2.0, 2.0, 2.0],
+        [3.0, 3.0, 3.0, 3.0, 3.0],
+        [4.0, 4.0, 4.0, 4.0, 4.0],
+        [5.0, 5.0, 5.0, 5.0, -1.0]]], dtype='float32')
+
+    layer = [(SpatialKey(0, 0), Tile(np.concatenate([cells, cells]), 'FLOAT', -1.0)),
+             (SpatialKey(1, 0), Tile(np.concatenate([cells, cells]), 'FLOAT', -1.0)),
+             (SpatialKey(0, 1), Tile(np.concatenate([cells, cells]), 'FLOAT', -1.0)),
+             (SpatialKey(1, 1), Tile(np.concatenate([cells, cells]), 'FLOAT', -1.0))]
+    rdd = BaseTestClass.pysc.parallelize(layer)
+
+    extent = {'xmin': 0.0, 'ymin': 0.0, 'xmax': 33.0, 'ymax': 33.0}
+    metadata = {'cellType': 'float32ud-1.0',
+                'extent': extent,
+                'crs': '+proj=longlat +datum=WGS84 +no_defs ',
+                'bounds': {
+                    'minKey': {'col': 0, 'row': 0},
+                    'maxKey': {'col': 1, 'row': 1}},
+                'layoutDefinition': {
+                    'extent': extent,
+                    'tileLayout': {'tileCols': 5, 'tileRows': 5, 'layoutCols': 2, 'layoutRows': 2}}}
+
+    raster_rdd = TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd, metadata,
+                                                 transport=Transport.ARROW)
+
+    @pytest.fixture(scope='class', autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def test_round_trip(self):
+        actual = self.raster_rdd.to_numpy_rdd(transport=Transport.ARROW).collect()
+        expected = self.raster_rdd.to_numpy_rdd().collect()
+
+        actual.sort(key=lambda tup: (tup[0].col, tup[0].row))
+        expected.sort(key=lambda tup: (tup[0].col, tup[0].row))
+
+        self.assertEqual([k for k, _ in expected], [k for k, _ in actual])
+
+        for (_, expected_tile), (_, actual_tile) in zip(expected, actual):
+            self.assertEqual(expected_tile.cell_type, actual_tile.cell_type)
+            self.assertEqual(expected_tile.no_data_value, actual_tile.no_data_value)
+            self.assertTrue((expected_tile.cells == actual_tile.cells).all())
+
+    def test_map_cells(self):
+        result = self.raster_rdd.map_cells(lambda cells, nd: cells + 1, transport=Transport.ARROW)
+        actual = result.to_numpy_rdd().first()[1].cells
+
+        self.assertTrue((actual == np.concatenate([self.cells, self.cells]) + 1).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import numpy as np
+import pytest
+
+from geopyspark.geotrellis import SpatialKey, Tile, FrameCompression, CompressionStats
+from geopyspark.geotrellis.layer import TiledRasterLayer
+from geopyspark.tests.base_test_class import BaseTestClass
+from geopyspark.geotrellis.constants import LayerType, FrameCodec
+
+
+class FrameCompressionTest(BaseTestClass):
+    cells = np.zeros((1, 256, 256), dtype='int16')
+    cells[0, 0, 0] = 7
+
+    layer = [(SpatialKey(0, 0), Tile(cells, 'SHORT', -32768)),
+             (SpatialKey(1, 0), Tile(cells, 'SHORT', -32768)),
+             (SpatialKey(0, 1), Tile(cells, 'SHORT', -32768)),
+             (SpatialKey(1, 1), Tile(cells, 'SHORT', -32768))]
+    rdd = BaseTestClass.pysc.parallelize(layer)
+
+    extent = {'xmin': 0.0, 'ymin': 0.0, 'xmax': 33.0, 'ymax': 33.0}
+    metadata = {'cellType': 'int16',
+                'extent': extent,
+                'crs': '+proj=longlat +datum=WGS84 +no_defs ',
+                'bounds': {
+                    'minKey': {'col': 0, 'row': 0},
+                    'maxKey': {'col': 1, 'row': 1}},
+                'layoutDefinition': {
+                    'extent': extent,
+                    'tileLayout': {'tileCols': 256, 'tileRows': 256, 'layoutCols': 2, 'layoutRows': 2}}}
+
+    raster_rdd = TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd, metadata,
+                                                 compression=FrameCompression(FrameCodec.ZLIB))
+
+    @pytest.fixture(scope='class', autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def test_round_trip(self):
+        stats = CompressionStats()
+        compression = FrameCompression(FrameCodec.ZLIB, stats=stats)
+
+        actual = self.raster_rdd.to_numpy_rdd(compression=compression).collect()
+        actual.sort(key=lambda tup: (tup[0].col, tup[0].row))
+
+        self.assertEqual([SpatialKey(0, 0), SpatialKey(0, 1), SpatialKey(1, 0), SpatialKey(1, 1)],
+                         [k for k, _ in actual])
+
+        for _, tile in actual:
+            self.assertTrue((tile.cells == self.cells).all())
+
+        self.assertTrue(stats.ratio < 0.1)
+
+    def test_incompressible_frames(self):
+        cells = np.random.rand(1, 256, 256)
+        stats = CompressionStats()
+        compression = FrameCompression(FrameCodec.ZLIB, stats=stats)
+
+        layer = TiledRasterLayer.from_numpy_rdd(
+            LayerType.SPATIAL,
+            BaseTestClass.pysc.parallelize([(SpatialKey(0, 0), Tile(cells, 'DOUBLE', None))]),
+            dict(self.metadata, cellType='float64raw'))
+
+        actual = layer.to_numpy_rdd(compression=compression).first()[1].cells
+
+        self.assertTrue((actual == cells).all())
+        self.assertTrue(stats.ratio > 1.0)
+
+    def test_incompressible_frames_to_jvm(self):
+        cells = np.random.rand(1, 256, 256)
+        stats = CompressionStats()
+        compression = FrameCompression(FrameCodec.ZLIB, stats=stats)
+
+        layer = TiledRasterLayer.from_numpy_rdd(
+            LayerType.SPATIAL,
+            BaseTestClass.pysc.parallelize([(SpatialKey(0, 0), Tile(cells, 'DOUBLE', None))]),
+            dict(self.metadata, cellType='float64raw'),
+            compression=compression)
+
+        actual = layer.to_numpy_rdd().first()[1].cells
+
+        self.assertTrue((actual == cells).all())
+        self.assertTrue(stats.ratio > 1.0)
+
+    def test_probed_frames_to_jvm(self):
+        from geopyspark.geotrellis import framecompression
+        from geopyspark.geotrellis.protobufserializer import ProtoBufSerializer
+
+        tiles = [(SpatialKey(0, 0), Tile(np.random.rand(1, 256, 256), 'DOUBLE', None))]
+        encode = framecompression._encode
+        encoded_sizes = []
+
+        def counting_encode(codec, level, frame):
+            encoded_sizes.append(len(frame))
+            return encode(codec, level, frame)
+
+        framecompression._encode = counting_encode
+
+        try:
+            ser = ProtoBufSerializer.create_tuple_batch_serializer(
+                key_type='SpatialKey', compression=FrameCompression(FrameCodec.ZLIB), probe=True)
+            frame = ser.dumps(tiles)
+        finally:
+            framecompression._encode = encode
+
+        # Only the sample was compressed, and the frame was sent as it was
+        self.assertEqual(encoded_sizes, [framecompression._PROBE_SIZE])
+        self.assertEqual(ser.loads(frame)[0][1].cells.tolist(), tiles[0][1].cells.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
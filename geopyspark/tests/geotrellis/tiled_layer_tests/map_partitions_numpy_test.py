@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+import pytest
+
+from geopyspark.geotrellis import SpatialKey, Tile
+from geopyspark.geotrellis.layer import TiledRasterLayer
+from geopyspark.tests.base_test_class import BaseTestClass
+from geopyspark.geotrellis.constants import LayerType
+
+
+class MapPartitionsNumpyTest(BaseTestClass):
+    cells = np.array([[
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [2.0, 2.0, 2.0, 2.0, 2.0],
+        [3.0, 3.0, 3.0, 3.0, 3.0],
+        [4.0, 4.0, 4.0, 4.0, 4.0],
+        [5.0, 5.0, 5.0, 5.0, 5.0]]])
+
+    layer = [(SpatialKey(0, 0), Tile(np.array([cells[0], cells[0]]), 'FLOAT', -1.0)),
+             (SpatialKey(1, 0), Tile(np.array([cells[0], cells[0]]), 'FLOAT', -1.0)),
+             (SpatialKey(0, 1), Tile(np.array([cells[0], cells[0]]), 'FLOAT', -1.0)),
+             (SpatialKey(1, 1), Tile(np.array([cells[0], cells[0]]), 'FLOAT', -1.0))]
+    rdd = BaseTestClass.pysc.parallelize(layer, 1)
+
+    extent = {'xmin': 0.0, 'ymin': 0.0, 'xmax': 33.0, 'ymax': 33.0}
+    metadata = {'cellType': 'float32ud-1.0',
+                'extent': extent,
+                'crs': '+proj=longlat +datum=WGS84 +no_defs ',
+                'bounds': {
+                    'minKey': {'col': 0, 'row': 0},
+                    'maxKey': {'col': 1, 'row': 1}},
+                'layoutDefinition': {
+                    'extent': extent,
+                    'tileLayout': {'tileCols': 5, 'tileRows': 5, 'layoutCols': 2, 'layoutRows': 2}}}
+
+    raster_rdd = TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, rdd, metadata)
+
+    @pytest.fixture(scope='class', autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def test_map_partitions_numpy(self):
+        def add_col(cells, keys):
+            assert cells.shape == (len(keys), 2, 5, 5)
+
+            offsets = np.array([key.col for key in keys]).reshape((-1, 1, 1, 1))
+            return cells + offsets
+
+        result = self.raster_rdd.map_partitions_numpy(add_col, batch_size=3).to_numpy_rdd().collect()
+
+        self.assertEqual(len(result), 4)
+
+        for key, tile in result:
+            self.assertEqual(tile.cell_type, 'FLOAT')
+            self.assertTrue((tile.cells == self.cells + key.col).all())
+
+    def test_wrong_shape(self):
+        with pytest.raises(Exception):
+            self.raster_rdd.map_partitions_numpy(lambda cells, keys: cells[:, 0]).to_numpy_rdd().collect()
+
+
+if __name__ == "__main__":
+    unittest.main()
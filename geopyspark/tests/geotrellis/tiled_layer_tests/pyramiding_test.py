@@ -184,5 +184,29 @@ class PyramidingTest(BaseTestClass):
         self.assertTrue(catalog.read_layer_metadata(uri, layer_name, 0))
         self.assertTrue(catalog.read_layer_metadata(uri, layer_name, max_zoom))
 
+    def test_write_pyramid_layers_async(self):
+        max_zoom = 5
+        tif = file_path('srtm_52_11.tif')
+        raster_layer = geotiff.get(layer_type=LayerType.SPATIAL, uri=tif)
+        tiled_raster_layer = raster_layer.tile_to_layout(GlobalLayout(zoom=max_zoom), target_crs=3857)
+        pyramided_layer = tiled_raster_layer.pyramid()
+
+        layer_name = 'pyramid-async-test-layer'
+        path = file_path('pyramid-async-test-catalog')
+        uri = 'file:///' + path
+
+        if os.path.isdir(path):
+            import shutil
+            shutil.rmtree(path)
+
+        handle = pyramided_layer.write_async(uri, layer_name, max_concurrent=2)
+        handle.result()
+
+        self.assertTrue(handle.done())
+        self.assertEqual([level.state for level in handle.progress()], ['done'] * (max_zoom + 1))
+        self.assertTrue(handle.bytes_written > 0)
+        self.assertTrue(catalog.read_layer_metadata(uri, layer_name, 0))
+        self.assertTrue(catalog.read_layer_metadata(uri, layer_name, max_zoom))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,278 @@
+import os
+import sqlite3
+import unittest
+import tempfile
+
+import numpy as np
+import pytest
+
+from geopyspark import geotiff
+from geopyspark.geotrellis import Extent, GlobalLayout, LayoutDefinition, SpatialKey, Tile, TileLayout
+from geopyspark.geotrellis.color import ColorMap
+from geopyspark.geotrellis.constants import LayerType
+from geopyspark.geotrellis.layer import Pyramid, TiledRasterLayer
+from geopyspark.geotrellis.tms import (TMS, RenderedTileCache, RenderedTileCacheStats,
+                                       _is_empty_tile, _seed_key_bounds)
+from geopyspark.tests.base_test_class import BaseTestClass
+from geopyspark.tests.python_test_utils import file_path
+
+
+class RenderedTileCacheTest(BaseTestClass):
+    jvm = BaseTestClass.pysc._gateway.jvm
+
+    # Each image takes 100 bytes, plus the 64 bytes every entry is counted as
+    png = bytes(range(100))
+
+    @pytest.fixture(autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def put(self, cache, source_ids, zoom, x=0, y=0):
+        key = cache.cache.key(source_ids, "display", zoom, x, y)
+        cache.cache.put(key, self.jvm.scala.Some(self.png))
+
+    def get(self, cache, source_ids, zoom, x=0, y=0):
+        cached = cache.cache.get(cache.cache.key(source_ids, "display", zoom, x, y))
+        return bytes(cached.get().png().get()) if cached.isDefined() else None
+
+    def test_lru_eviction(self):
+        cache = RenderedTileCache(max_bytes=400)
+
+        self.put(cache, "a", 1)
+        self.put(cache, "b", 1)
+        self.assertEqual(self.get(cache, "a", 1), self.png)
+        self.put(cache, "c", 1)
+
+        self.assertEqual(self.get(cache, "b", 1), None)
+        self.assertEqual(self.get(cache, "a", 1), self.png)
+        self.assertEqual(self.get(cache, "c", 1), self.png)
+        self.assertEqual(cache.stats(), RenderedTileCacheStats(3, 1, 1, 328))
+        self.assertEqual(cache.stats().hit_rate, 0.75)
+
+    def test_empty_stats(self):
+        cache = RenderedTileCache()
+
+        self.assertEqual(cache.stats(), RenderedTileCacheStats(0, 0, 0, 0))
+        self.assertEqual(cache.stats().hit_rate, None)
+
+    def test_spill_and_reload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RenderedTileCache(max_bytes=400, spill_directory=directory)
+
+            self.put(cache, "a", 1, 2, 3)
+            self.put(cache, "b", 1)
+            self.put(cache, "c", 1)
+
+            spilled = os.path.join(directory, "a", "display", "1", "2", "3.png")
+            self.assertTrue(os.path.isfile(spilled))
+
+            with open(spilled, 'rb') as f:
+                self.assertEqual(f.read(), self.png)
+
+            self.assertEqual(self.get(cache, "a", 1, 2, 3), self.png)
+            self.assertEqual(cache.stats().evictions, 2)
+
+    def test_invalidate(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Everything is spilled by the first cache, and kept in memory by the second
+            for cache in (RenderedTileCache(max_bytes=0, spill_directory=directory),
+                          RenderedTileCache()):
+                for (source_ids, zoom) in [("a", 1), ("a", 2), ("b", 1), ("a\nb", 1), ("b", 2)]:
+                    self.put(cache, source_ids, zoom)
+
+                cache.cache.invalidate("a", None, 1)
+
+                self.assertEqual(self.get(cache, "a", 1), None)
+                self.assertEqual(self.get(cache, "a\nb", 1), None)
+                self.assertEqual(self.get(cache, "a", 2), self.png)
+                self.assertEqual(self.get(cache, "b", 1), self.png)
+
+                cache.cache.invalidate("b", None, None)
+
+                self.assertEqual(self.get(cache, "b", 1), None)
+                self.assertEqual(self.get(cache, "b", 2), None)
+                self.assertEqual(self.get(cache, "a", 2), self.png)
+
+                cache.clear()
+
+                self.assertEqual(self.get(cache, "a", 2), None)
+
+    def test_invalidate_catalog_source(self):
+        cache = RenderedTileCache()
+
+        self.put(cache, "catalog:file:///tmp/catalog:layer", 1)
+        self.put(cache, "catalog:file:///tmp/catalog:layer", 2)
+        self.put(cache, "catalog:file:///tmp/catalog:other", 1)
+
+        cache.invalidate(("file:///tmp/catalog", "layer"), zoom=1)
+
+        self.assertEqual(self.get(cache, "catalog:file:///tmp/catalog:layer", 1), None)
+        self.assertEqual(self.get(cache, "catalog:file:///tmp/catalog:layer", 2), self.png)
+        self.assertEqual(self.get(cache, "catalog:file:///tmp/catalog:other", 1), self.png)
+
+
+class SeedTest(BaseTestClass):
+    max_zoom = 5
+
+    tif = file_path('srtm_52_11.tif')
+    raster_layer = geotiff.get(layer_type=LayerType.SPATIAL, uri=tif)
+    pyramid = raster_layer.tile_to_layout(GlobalLayout(zoom=max_zoom), target_crs=3857).pyramid()
+
+    web_mercator = {'xmin': -20037508.342789244, 'ymin': -20037508.342789244,
+                    'xmax': 20037508.342789244, 'ymax': 20037508.342789244}
+
+    # A zoom 1 layer whose tile at (1, 0) is all NoData
+    metadata = {'cellType': 'int16ud-1',
+                'extent': web_mercator,
+                'crs': '+proj=merc +a=6378137 +b=6378137 +lat_ts=0.0 +lon_0=0.0 +x_0=0.0 +y_0=0 +k=1.0 +units=m +nadgrids=@null +wktext +no_defs ',
+                'bounds': {
+                    'minKey': {'col': 0, 'row': 0},
+                    'maxKey': {'col': 1, 'row': 1}},
+                'layoutDefinition': {
+                    'extent': web_mercator,
+                    'tileLayout': {'tileCols': 4, 'tileRows': 4, 'layoutCols': 2, 'layoutRows': 2}}}
+
+    tiles = [(SpatialKey(0, 0), Tile.from_numpy_array(np.full((1, 4, 4), 5, dtype='int16'), -1)),
+             (SpatialKey(1, 0), Tile.from_numpy_array(np.full((1, 4, 4), -1, dtype='int16'), -1)),
+             (SpatialKey(0, 1), Tile.from_numpy_array(np.full((1, 4, 4), 7, dtype='int16'), -1))]
+
+    layer = TiledRasterLayer.from_numpy_rdd(LayerType.SPATIAL, BaseTestClass.pysc.parallelize(tiles),
+                                            metadata, zoom_level=1)
+
+    # A two band layer whose first band is all NoData at (0, 0), and whose bands are all
+    # NoData at (1, 0)
+    band_cells = [np.stack([np.full((4, 4), -1, dtype='int16'), np.full((4, 4), 5, dtype='int16')]),
+                  np.full((2, 4, 4), -1, dtype='int16')]
+    multiband_layer = TiledRasterLayer.from_numpy_rdd(
+        LayerType.SPATIAL,
+        BaseTestClass.pysc.parallelize([(SpatialKey(0, 0), Tile.from_numpy_array(band_cells[0], -1)),
+                                        (SpatialKey(1, 0), Tile.from_numpy_array(band_cells[1], -1))]),
+        metadata, zoom_level=1)
+
+    color_map = ColorMap.build(breaks={5: 0xff0000ff, 7: 0x00ff00ff})
+
+    @pytest.fixture(autouse=True)
+    def tearDown(self):
+        yield
+        BaseTestClass.pysc._gateway.close()
+
+    def expected_tiles(self):
+        return set((zoom, key.col, key.row)
+                   for (zoom, level) in self.pyramid.levels.items()
+                   for (key, tile) in level.to_numpy_rdd().collect()
+                   if not _is_empty_tile(tile))
+
+    def written_tiles(self, directory):
+        return set((int(zoom), int(col), int(os.path.splitext(name)[0]))
+                   for zoom in os.listdir(directory)
+                   for col in os.listdir(os.path.join(directory, zoom))
+                   for name in os.listdir(os.path.join(directory, zoom, col)))
+
+    def mbtiles_tiles(self, path):
+        connection = sqlite3.connect(path)
+
+        try:
+            tiles = set(connection.execute("SELECT zoom_level, tile_column, tile_row FROM tiles"))
+            metadata = dict(connection.execute("SELECT name, value FROM metadata"))
+        finally:
+            connection.close()
+
+        return (tiles, metadata)
+
+    def test_seed_directory(self):
+        expected = self.expected_tiles()
+
+        with tempfile.TemporaryDirectory() as directory:
+            written = TMS.seed(self.pyramid, lambda tile: b'png', directory)
+
+            self.assertEqual(written, len(expected))
+            self.assertEqual(self.written_tiles(directory), expected)
+
+            (zoom, col, row) = min(expected)
+
+            with open(os.path.join(directory, str(zoom), str(col), "{}.png".format(row)), 'rb') as f:
+                self.assertEqual(f.read(), b'png')
+
+    def test_seed_mbtiles(self):
+        expected = self.expected_tiles()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "srtm.mbtiles")
+            written = TMS.seed(self.pyramid, lambda tile: b'png', path)
+            (tiles, metadata) = self.mbtiles_tiles(path)
+
+        # MBTiles count rows from the bottom of the layout
+        self.assertEqual(written, len(expected))
+        self.assertEqual(tiles, set((zoom, col, (1 << zoom) - 1 - row) for (zoom, col, row) in expected))
+        self.assertEqual((metadata['name'], metadata['minzoom'], metadata['maxzoom']),
+                         ('srtm', '0', str(self.max_zoom)))
+
+    def test_seed_zooms(self):
+        expected = set(tile for tile in self.expected_tiles() if tile[0] == self.max_zoom)
+
+        with tempfile.TemporaryDirectory() as directory:
+            written = TMS.seed(self.pyramid, lambda tile: b'png', directory, zooms=self.max_zoom)
+
+            self.assertEqual(written, len(expected))
+            self.assertEqual(self.written_tiles(directory), expected)
+
+    def test_seed_skips_empty_tiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            written = TMS.seed(Pyramid({1: self.layer}), lambda tile: b'png', directory)
+
+            self.assertEqual(written, 2)
+            self.assertEqual(self.written_tiles(directory), {(1, 0, 0), (1, 0, 1)})
+
+            path = os.path.join(directory, "layer.mbtiles")
+            TMS.seed(Pyramid({1: self.layer}), lambda tile: b'png', path)
+            (tiles, _) = self.mbtiles_tiles(path)
+
+        self.assertEqual(tiles, {(1, 0, 1), (1, 0, 0)})
+
+    def test_seed_color_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            written = TMS.seed(Pyramid({1: self.layer}), self.color_map, directory)
+
+            self.assertEqual(written, 2)
+            self.assertEqual(self.written_tiles(directory), {(1, 0, 0), (1, 0, 1)})
+
+            with open(os.path.join(directory, "1", "0", "0.png"), 'rb') as f:
+                self.assertEqual(f.read()[:8], b'\x89PNG\r\n\x1a\n')
+
+    def test_seed_empty_bands(self):
+        # Both kinds of display only skip the tiles whose bands are all NoData
+        for display in (self.color_map, lambda tile: b'png'):
+            with tempfile.TemporaryDirectory() as directory:
+                written = TMS.seed(Pyramid({1: self.multiband_layer}), display, directory)
+
+                self.assertEqual(written, 1)
+                self.assertEqual(self.written_tiles(directory), {(1, 0, 0)})
+
+    def test_seed_bbox(self):
+        # Covers the west half of the layout, up to the edge of the tiles at col 1
+        bbox = Extent(-20037508.342789244, -20037508.342789244, 0.0, 20037508.342789244)
+
+        with tempfile.TemporaryDirectory() as directory:
+            written = TMS.seed(Pyramid({1: self.layer}), lambda tile: b'png', directory, bbox=bbox)
+
+            self.assertEqual(written, 2)
+            self.assertEqual(self.written_tiles(directory), {(1, 0, 0), (1, 0, 1)})
+
+    def test_seed_key_bounds(self):
+        layout = LayoutDefinition(Extent(0.0, 0.0, 40.0, 40.0), TileLayout(4, 4, 256, 256))
+
+        # Edges that lie on tile boundaries do not pull in the neighboring tiles
+        self.assertEqual(_seed_key_bounds(layout, Extent(10.0, 10.0, 20.0, 30.0)), (1, 1, 1, 2))
+        self.assertEqual(_seed_key_bounds(layout, Extent(10.0, 10.0, 20.5, 30.0)), (1, 1, 2, 2))
+        self.assertEqual(_seed_key_bounds(layout, Extent(-5.0, -5.0, 45.0, 45.0)), (0, 0, 3, 3))
+
+    def test_is_empty_tile(self):
+        self.assertTrue(_is_empty_tile(self.tiles[1][1]))
+        self.assertFalse(_is_empty_tile(self.tiles[0][1]))
+        self.assertTrue(_is_empty_tile(Tile.from_numpy_array(np.full((1, 2, 2), np.nan))))
+        self.assertFalse(_is_empty_tile(Tile.from_numpy_array(np.zeros((1, 2, 2), dtype='int8'))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,14 @@ class ToGeoTiffTest(BaseTestClass):
         self.assertEqual(tiled_collected.cell_type, rasterio_geotiff.cell_type)
         self.assertEqual(tiled_collected.no_data_value, rasterio_geotiff.no_data_value)
 
+    def test_to_geotiff_rdd_tiledrasterlayer_keys(self):
+        tiled_rdd = self.rdd.tile_to_layout(LocalLayout(tile_size=128))
+
+        expected_keys = sorted(tiled_rdd.to_numpy_rdd().keys().collect())
+        actual_keys = sorted(tiled_rdd.to_geotiff_rdd().keys().collect())
+
+        self.assertEqual(expected_keys, actual_keys)
+
 
 if __name__ == "__main__":
     unittest.main()
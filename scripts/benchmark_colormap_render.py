@@ -0,0 +1,70 @@
+"""Micro-benchmark of the per-tile cost of rendering a tile to a PNG in Python.
+
+Compares coloring every cell with a Python loop over the breaks against
+``NumpyColorMap``, which classifies the whole tile with ``np.searchsorted`` and
+gathers the colors from a lookup table. The PNGs are encoded with the encoder of
+``NumpyColorMap`` and, if it is installed, with PIL.
+
+Usage:
+    python scripts/benchmark_colormap_render.py [tile_size]
+"""
+import io
+import sys
+import timeit
+import numpy as np
+
+from geopyspark.geotrellis import Tile
+from geopyspark.geotrellis.color import NumpyColorMap, _encode_png
+
+
+def _naive_render(cmap, cells):
+    image = np.zeros(cells.shape + (4,), dtype=np.uint8)
+
+    for (row, col), value in np.ndenumerate(cells):
+        for index, break_value in enumerate(cmap.breaks):
+            if value <= break_value:
+                image[row, col] = cmap.colors[index]
+                break
+
+    return image
+
+
+def _time_per_tile(render, number):
+    seconds = min(timeit.repeat(render, number=number, repeat=5))
+    return seconds / number * 1e3
+
+
+def main(size):
+    cells = np.random.randint(0, 1000, size=(1, size, size)).astype('int16')
+    tile = Tile(cells, 'SHORT', -32768)
+    cmap = NumpyColorMap.build(list(range(0, 1000, 4)),
+                               [0x000000ff + (i << 8) for i in range(250)])
+    image = cmap.render_tile(tile)
+
+    timings = [
+        ("naive color map", lambda: _naive_render(cmap, cells[0]), 1),
+        ("NumpyColorMap.render_tile", lambda: cmap.render_tile(tile), 50),
+        ("PNG encoding", lambda: _encode_png(image, cmap.compress_level), 50),
+        ("NumpyColorMap (render + PNG)", lambda: cmap(tile), 50)
+    ]
+
+    try:
+        from PIL import Image
+
+        def pil_png():
+            bio = io.BytesIO()
+            Image.fromarray(cmap.render_tile(tile), mode='RGBA').save(bio, 'PNG')
+            return bio.getvalue()
+
+        timings.append(("render + PIL PNG", pil_png, 50))
+    except ImportError:
+        pass
+
+    print("{:<32}{:>16}".format("{}x{} tile".format(size, size), "per tile (ms)"))
+
+    for name, render, number in timings:
+        print("{:<32}{:>16.3f}".format(name, _time_per_tile(render, number)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 256)
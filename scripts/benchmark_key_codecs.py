@@ -0,0 +1,91 @@
+"""Micro-benchmark of the per-record cost of decoding ``ProtoTuple`` bytes for each key type.
+
+Compares the previous decoder, which compared the name of the key type and converted every
+instant for every record, against the specialized decoders made by
+``create_partial_tuple_decoder``.
+
+Usage:
+    python scripts/benchmark_key_codecs.py [number_of_records]
+"""
+import sys
+import timeit
+import datetime
+import numpy as np
+
+from geopyspark.geotrellis import (Extent, ProjectedExtent, TemporalProjectedExtent, SpatialKey,
+                                   SpaceTimeKey, Tile)
+from geopyspark.geotrellis.protobuf import tupleMessages_pb2
+from geopyspark.geotrellis.protobufcodecs import (from_pb_multibandtile,
+                                                  from_pb_projected_extent,
+                                                  from_pb_extent,
+                                                  tuple_encoder,
+                                                  create_partial_tuple_decoder)
+
+
+def _previous_from_pb_temporal_projected_extent(pb_tpex):
+    instant = datetime.datetime.utcfromtimestamp(pb_tpex.instant / 1000)
+
+    if pb_tpex.crs.epsg != 0:
+        return TemporalProjectedExtent(extent=from_pb_extent(pb_tpex.extent),
+                                       epsg=pb_tpex.crs.epsg,
+                                       instant=instant)
+    else:
+        return TemporalProjectedExtent(extent=from_pb_extent(pb_tpex.extent),
+                                       proj4=pb_tpex.crs.proj4,
+                                       instant=instant)
+
+
+def _previous_tuple_decoder(proto_bytes, key_decoder):
+    tup = tupleMessages_pb2.ProtoTuple.FromString(proto_bytes)
+    multiband = from_pb_multibandtile(tup.tiles)
+
+    if key_decoder == "ProjectedExtent":
+        return (from_pb_projected_extent(tup.projectedExtent), multiband)
+    elif key_decoder == "TemporalProjectedExtent":
+        return (_previous_from_pb_temporal_projected_extent(tup.temporalProjectedExtent), multiband)
+    elif key_decoder == "SpatialKey":
+        return (SpatialKey(col=tup.spatialKey.col, row=tup.spatialKey.row), multiband)
+    else:
+        return (SpaceTimeKey(col=tup.spaceTimeKey.col, row=tup.spaceTimeKey.row,
+                             instant=datetime.datetime.utcfromtimestamp(tup.spaceTimeKey.instant / 1000)),
+                multiband)
+
+
+def _time_per_record(decoder, records):
+    seconds = min(timeit.repeat(lambda: [decoder(record) for record in records], number=1, repeat=5))
+    return seconds / len(records) * 1e6
+
+
+def main(count):
+    # A small tile keeps the cost of decoding the cells from hiding the cost of the key
+    tile = Tile(np.zeros((1, 4, 4), dtype='int16'), 'SHORT', -32768)
+    extent = Extent(0.0, 0.0, 10.0, 10.0)
+    instant = datetime.datetime(2017, 1, 1)
+
+    keys = {
+        "ProjectedExtent": lambda i: ProjectedExtent(extent, 3857),
+        "TemporalProjectedExtent": lambda i: TemporalProjectedExtent(extent, instant, 3857),
+        "SpatialKey": lambda i: SpatialKey(i, i),
+        "SpaceTimeKey": lambda i: SpaceTimeKey(i, i, instant)
+    }
+
+    print("{:<26}{:>12}{:>12}{:>14}".format("key type", "before (us)", "after (us)", "millis (us)"))
+
+    for key_type, make_key in keys.items():
+        records = [tuple_encoder((make_key(i), tile), key_type) for i in range(count)]
+
+        before = _time_per_record(lambda record: _previous_tuple_decoder(record, key_type), records)
+        after = _time_per_record(create_partial_tuple_decoder(key_type), records)
+
+        if key_type in ("TemporalProjectedExtent", "SpaceTimeKey"):
+            millis = "{:>14.2f}".format(
+                _time_per_record(create_partial_tuple_decoder(key_type, instants_as_millis=True),
+                                 records))
+        else:
+            millis = "{:>14}".format("-")
+
+        print("{:<26}{:>12.2f}{:>12.2f}{}".format(key_type, before, after, millis))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
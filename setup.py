@@ -21,6 +21,11 @@ setup_args = dict(
         'pytz',
         'python-dateutil>=2.6.1'
     ],
+    extras_require={
+        # The JVM uses Arrow 0.8, which cannot read the IPC format written by pyarrow 0.15 and later
+        'arrow': ['pyarrow>=0.8.0,<0.15'],
+        'compression': ['lz4', 'zstandard']
+    },
     packages=[
         'geopyspark',
         'geopyspark.geotrellis',